@@ -1,17 +1,18 @@
 import threading
 from contextlib import contextmanager
+from datetime import timedelta
 from typing import Any, Iterator, Optional, Sequence
 
 from langchain_core.runnables import RunnableConfig
 
 import duckdb
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
     CheckpointTuple,
     get_checkpoint_id,
+    get_prune_cutoff,
 )
 from langgraph.checkpoint.duckdb.base import BaseDuckDBSaver
 from langgraph.checkpoint.serde.base import SerializerProtocol
@@ -330,22 +331,72 @@ class DuckDBSaver(BaseDuckDBSaver):
             writes (List[Tuple[str, Any]]): List of writes to store.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            self.UPSERT_CHECKPOINT_WRITES_SQL
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else self.INSERT_CHECKPOINT_WRITES_SQL
-        )
+        self.put_writes_batch(config, [(task_id, writes)])
+
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        The writes of all tasks are saved with a single `executemany` per kind of write.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task identifier and the writes of that task.
+        """
+        upsert, insert = self._dump_task_writes(config, task_writes)
         with self._cursor() as cur:
-            cur.executemany(
-                query,
-                self._dump_writes(
-                    config["configurable"]["thread_id"],
-                    config["configurable"]["checkpoint_ns"],
-                    config["configurable"]["checkpoint_id"],
-                    task_id,
-                    writes,
-                ),
-            )
+            if upsert:
+                cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upsert)
+            if insert:
+                cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, insert)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        with self._cursor() as cur:
+            for query in self.DELETE_THREAD_SQL:
+                cur.execute(query, [str(thread_id)])
+
+    def prune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Delete old checkpoints from the database.
+
+        A checkpoint is deleted if it isn't among the `keep_last` latest of its
+        thread and namespace, or if it was created more than `max_age` ago. Its
+        writes are deleted too, except those storing the pending sends of a
+        remaining checkpoint, as are the channel values no longer referenced.
+
+        Each thread is pruned in its own transaction.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        cutoff = get_prune_cutoff(keep_last, max_age)
+        if thread_ids is None:
+            with self._cursor() as cur:
+                cur.execute("SELECT DISTINCT thread_id FROM checkpoints")
+                thread_ids = [thread_id for (thread_id,) in cur.fetchall()]
+        deleted = 0
+        for thread_id in thread_ids:
+            with self._cursor() as cur:
+                deleted += self._prune_thread(cur, str(thread_id), keep_last, cutoff)
+        return deleted
 
     @contextmanager
     def _cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
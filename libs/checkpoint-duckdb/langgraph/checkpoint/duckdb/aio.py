@@ -1,17 +1,18 @@
 import asyncio
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from typing import Any, AsyncIterator, Iterator, Optional, Sequence
 
 from langchain_core.runnables import RunnableConfig
 
 import duckdb
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
     CheckpointTuple,
     get_checkpoint_id,
+    get_prune_cutoff,
 )
 from langgraph.checkpoint.duckdb.base import BaseDuckDBSaver
 from langgraph.checkpoint.serde.base import SerializerProtocol
@@ -302,21 +303,83 @@ class AsyncDuckDBSaver(BaseDuckDBSaver):
             writes (Sequence[Tuple[str, Any]]): List of writes to store, each as (channel, value) pair.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            self.UPSERT_CHECKPOINT_WRITES_SQL
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else self.INSERT_CHECKPOINT_WRITES_SQL
-        )
-        params = await asyncio.to_thread(
-            self._dump_writes,
-            config["configurable"]["thread_id"],
-            config["configurable"]["checkpoint_ns"],
-            config["configurable"]["checkpoint_id"],
-            task_id,
-            writes,
+        await self.aput_writes_batch(config, [(task_id, writes)])
+
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint asynchronously.
+
+        The writes of all tasks are saved with a single `executemany` per kind of write.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task identifier and the writes of that task.
+        """
+        upsert, insert = await asyncio.to_thread(
+            self._dump_task_writes, config, task_writes
         )
         async with self._cursor() as cur:
-            await asyncio.to_thread(cur.executemany, query, params)
+            if upsert:
+                await asyncio.to_thread(
+                    cur.executemany, self.UPSERT_CHECKPOINT_WRITES_SQL, upsert
+                )
+            if insert:
+                await asyncio.to_thread(
+                    cur.executemany, self.INSERT_CHECKPOINT_WRITES_SQL, insert
+                )
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread asynchronously, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        async with self._cursor() as cur:
+            for query in self.DELETE_THREAD_SQL:
+                await asyncio.to_thread(cur.execute, query, [str(thread_id)])
+
+    async def aprune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Delete old checkpoints from the database asynchronously.
+
+        A checkpoint is deleted if it isn't among the `keep_last` latest of its
+        thread and namespace, or if it was created more than `max_age` ago. Its
+        writes are deleted too, except those storing the pending sends of a
+        remaining checkpoint, as are the channel values no longer referenced.
+
+        Each thread is pruned in its own transaction.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        cutoff = get_prune_cutoff(keep_last, max_age)
+        if thread_ids is None:
+            async with self._cursor() as cur:
+                await asyncio.to_thread(
+                    cur.execute, "SELECT DISTINCT thread_id FROM checkpoints"
+                )
+                rows = await asyncio.to_thread(cur.fetchall)
+                thread_ids = [thread_id for (thread_id,) in rows]
+        deleted = 0
+        for thread_id in thread_ids:
+            async with self._cursor() as cur:
+                deleted += await asyncio.to_thread(
+                    self._prune_thread, cur, str(thread_id), keep_last, cutoff
+                )
+        return deleted
 
     @asynccontextmanager
     async def _cursor(self) -> AsyncIterator[duckdb.DuckDBPyConnection]:
@@ -429,3 +492,49 @@ class AsyncDuckDBSaver(BaseDuckDBSaver):
         return asyncio.run_coroutine_threadsafe(
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
+
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task identifier and the writes of that task.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_batch(config, task_writes), self.loop
+        ).result()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.adelete_thread(thread_id), self.loop
+        ).result()
+
+    def prune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Delete old checkpoints from the database.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aprune(thread_ids, keep_last=keep_last, max_age=max_age), self.loop
+        ).result()
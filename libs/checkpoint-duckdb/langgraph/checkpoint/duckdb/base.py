@@ -1,9 +1,11 @@
 import json
 import random
+from itertools import groupby
 from typing import Any, List, Optional, Sequence, Tuple, cast
 
 from langchain_core.runnables import RunnableConfig
 
+import duckdb
 from langgraph.checkpoint.base import (
     WRITES_IDX_MAP,
     BaseCheckpointSaver,
@@ -11,6 +13,7 @@ from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
     get_checkpoint_id,
+    select_pruned_checkpoints,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
@@ -124,6 +127,46 @@ INSERT_CHECKPOINT_WRITES_SQL = """
     ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx) DO NOTHING
 """
 
+DELETE_THREAD_SQL = [
+    "DELETE FROM checkpoints WHERE thread_id = ?",
+    "DELETE FROM checkpoint_blobs WHERE thread_id = ?",
+    "DELETE FROM checkpoint_writes WHERE thread_id = ?",
+]
+
+SELECT_PRUNE_SQL = """
+    SELECT checkpoint_ns, checkpoint_id, parent_checkpoint_id
+    FROM checkpoints
+    WHERE thread_id = ?
+    ORDER BY checkpoint_ns, checkpoint_id DESC
+"""
+
+DELETE_CHECKPOINT_SQL = """
+    DELETE FROM checkpoints
+    WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?
+"""
+
+DELETE_CHECKPOINT_WRITES_SQL = """
+    DELETE FROM checkpoint_writes
+    WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?
+"""
+
+DELETE_CHECKPOINT_WRITES_EXCEPT_SENDS_SQL = f"""
+    DELETE FROM checkpoint_writes
+    WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?
+        AND channel != '{TASKS}'
+"""
+
+DELETE_UNREFERENCED_BLOBS_SQL = """
+    DELETE FROM checkpoint_blobs
+    WHERE thread_id = ? AND checkpoint_ns = ?
+        AND NOT EXISTS (
+            SELECT 1 FROM checkpoints
+            WHERE checkpoints.thread_id = checkpoint_blobs.thread_id
+                AND checkpoints.checkpoint_ns = checkpoint_blobs.checkpoint_ns
+                AND json_extract_string(checkpoint, '$.channel_versions.' || checkpoint_blobs.channel) = checkpoint_blobs.version
+        )
+"""
+
 
 class BaseDuckDBSaver(BaseCheckpointSaver[str]):
     SELECT_SQL = SELECT_SQL
@@ -132,6 +175,14 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
     UPSERT_CHECKPOINT_WRITES_SQL = UPSERT_CHECKPOINT_WRITES_SQL
     INSERT_CHECKPOINT_WRITES_SQL = INSERT_CHECKPOINT_WRITES_SQL
+    DELETE_THREAD_SQL = DELETE_THREAD_SQL
+    SELECT_PRUNE_SQL = SELECT_PRUNE_SQL
+    DELETE_CHECKPOINT_SQL = DELETE_CHECKPOINT_SQL
+    DELETE_CHECKPOINT_WRITES_SQL = DELETE_CHECKPOINT_WRITES_SQL
+    DELETE_CHECKPOINT_WRITES_EXCEPT_SENDS_SQL = (
+        DELETE_CHECKPOINT_WRITES_EXCEPT_SENDS_SQL
+    )
+    DELETE_UNREFERENCED_BLOBS_SQL = DELETE_UNREFERENCED_BLOBS_SQL
 
     jsonplus_serde = JsonPlusSerializer()
 
@@ -226,6 +277,32 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
             for idx, (channel, value) in enumerate(writes)
         ]
 
+    def _dump_task_writes(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> tuple[
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+    ]:
+        """Return the rows for the writes of the given tasks, as a pair of rows
+        to upsert (tasks writing only to special channels, eg. errors) and rows
+        to insert unless already present."""
+        upsert: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        insert: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        for task_id, writes in task_writes:
+            rows = upsert if all(w[0] in WRITES_IDX_MAP for w in writes) else insert
+            rows.extend(
+                self._dump_writes(
+                    config["configurable"]["thread_id"],
+                    config["configurable"]["checkpoint_ns"],
+                    config["configurable"]["checkpoint_id"],
+                    task_id,
+                    writes,
+                )
+            )
+        return upsert, insert
+
     def _load_metadata(self, metadata_json_str: str) -> CheckpointMetadata:
         return self.jsonplus_serde.loads(metadata_json_str.encode())
 
@@ -234,6 +311,51 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
         # NOTE: we're using JSON serializer (not msgpack), so we need to remove null characters before writing
         return serialized_metadata.decode().replace("\\u0000", "")
 
+    def _prune_thread(
+        self,
+        cur: duckdb.DuckDBPyConnection,
+        thread_id: str,
+        keep_last: Optional[int],
+        cutoff: Optional[str],
+    ) -> int:
+        """Delete the old checkpoints of a thread in a single transaction, along
+        with their writes and unreferenced blobs, see `prune`.
+
+        Returns the number of checkpoints deleted."""
+        deleted = 0
+        cur.begin()
+        try:
+            cur.execute(self.SELECT_PRUNE_SQL, [thread_id])
+            for checkpoint_ns, history in groupby(cur.fetchall(), lambda r: r[0]):
+                pruned, delete_writes, keep_sends = select_pruned_checkpoints(
+                    [(id, parent) for _, id, parent in history], keep_last, cutoff
+                )
+                if not pruned:
+                    continue
+                cur.executemany(
+                    self.DELETE_CHECKPOINT_SQL,
+                    [(thread_id, checkpoint_ns, id) for id in pruned],
+                )
+                if delete_writes:
+                    cur.executemany(
+                        self.DELETE_CHECKPOINT_WRITES_SQL,
+                        [(thread_id, checkpoint_ns, id) for id in delete_writes],
+                    )
+                if keep_sends:
+                    cur.executemany(
+                        self.DELETE_CHECKPOINT_WRITES_EXCEPT_SENDS_SQL,
+                        [(thread_id, checkpoint_ns, id) for id in keep_sends],
+                    )
+                cur.execute(
+                    self.DELETE_UNREFERENCED_BLOBS_SQL, [thread_id, checkpoint_ns]
+                )
+                deleted += len(pruned)
+        except BaseException:
+            cur.rollback()
+            raise
+        cur.commit()
+        return deleted
+
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         if current is None:
             current_v = 0
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import Any
 
 import pytest
@@ -110,3 +111,49 @@ class TestAsyncDuckDBSaver:
             assert [c async for c in saver.alist(None, filter={"my_key": "abc"})][
                 0
             ].metadata["my_key"] == "abc"
+
+    async def test_aprune(self) -> None:
+        async with AsyncDuckDBSaver.from_conn_string(":memory:") as saver:
+            await saver.setup()
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+            }
+            chkpnt: Checkpoint = empty_checkpoint()
+            configs = []
+            for step in range(3):
+                chkpnt = {
+                    **create_checkpoint(chkpnt, None, step),
+                    "channel_values": {"a": step},
+                    "channel_versions": {"a": str(step + 1)},
+                }
+                config = await saver.aput(config, chkpnt, {}, {"a": str(step + 1)})
+                await saver.aput_writes(config, [("a", step)], "t")
+                configs.append(config)
+            other = await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+            assert await saver.aprune(["thread-3"], keep_last=1) == 2
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-3"}}
+            assert [c.config async for c in saver.alist(thread)] == configs[2:]
+            assert saver.conn.execute(
+                "SELECT channel, version FROM checkpoint_blobs WHERE thread_id = 'thread-3'"
+            ).fetchall() == [("a", "3")]
+            assert saver.conn.execute(
+                "SELECT checkpoint_id FROM checkpoint_writes WHERE thread_id = 'thread-3'"
+            ).fetchall() == [(configs[2]["configurable"]["checkpoint_id"],)]
+
+            assert await saver.aprune(max_age=timedelta(0)) == 2
+            assert [c async for c in saver.alist(None)] == []
+            assert await saver.aget_tuple(other) is None
+
+    async def test_adelete_thread(self) -> None:
+        async with AsyncDuckDBSaver.from_conn_string(":memory:") as saver:
+            await saver.setup()
+            config = await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            await saver.aput(self.config_3, self.chkpnt_3, self.metadata_3, {})
+
+            await saver.adelete_thread("thread-2")
+
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-2"}}
+            assert [c async for c in saver.alist(thread)] == []
+            assert await saver.aget_tuple(config) is not None
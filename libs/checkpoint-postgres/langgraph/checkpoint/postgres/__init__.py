@@ -1,5 +1,6 @@
 import threading
 from contextlib import contextmanager
+from datetime import timedelta
 from typing import Any, Iterator, Optional, Sequence, Union
 
 from langchain_core.runnables import RunnableConfig
@@ -10,12 +11,12 @@ from psycopg.types.json import Jsonb
 from psycopg_pool import ConnectionPool
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
     CheckpointTuple,
     get_checkpoint_id,
+    get_prune_cutoff,
 )
 from langgraph.checkpoint.postgres.base import BasePostgresSaver
 from langgraph.checkpoint.serde.base import SerializerProtocol
@@ -346,22 +347,137 @@ class PostgresSaver(BasePostgresSaver):
             writes (List[Tuple[str, Any]]): List of writes to store.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            self.UPSERT_CHECKPOINT_WRITES_SQL
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else self.INSERT_CHECKPOINT_WRITES_SQL
-        )
+        self.put_writes_batch(config, [(task_id, writes)])
+
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        The writes of all tasks are saved with a single `executemany` per kind of write.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task identifier and the writes of that task.
+        """
+        upsert, insert = self._dump_task_writes(config, task_writes)
         with self._cursor(pipeline=True) as cur:
-            cur.executemany(
-                query,
-                self._dump_writes(
-                    config["configurable"]["thread_id"],
-                    config["configurable"]["checkpoint_ns"],
-                    config["configurable"]["checkpoint_id"],
-                    task_id,
-                    writes,
-                ),
+            if upsert:
+                cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upsert)
+            if insert:
+                cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, insert)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        with self._cursor(pipeline=True) as cur:
+            for query in self.DELETE_THREAD_SQL:
+                cur.execute(query, (str(thread_id),))
+
+    def prune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """Delete old checkpoints from the database.
+
+        A checkpoint is deleted if it isn't among the `keep_last` latest of its
+        thread and namespace, or if it was created more than `max_age` ago. Its
+        writes are deleted too, except those storing the pending sends of a
+        remaining checkpoint, as are the channel values no longer referenced.
+
+        Rows are deleted in batches of `batch_size`, each in its own short
+        transaction, so that pruning can run alongside graphs using the same
+        threads. Pruning by `max_age` a thread that was idle for longer, while
+        it's resumed, may however delete the values of its new checkpoint.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+            batch_size (int): Maximum number of rows deleted per statement.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        cutoff = get_prune_cutoff(keep_last, max_age)
+        if thread_ids is not None:
+            return sum(
+                self._prune_thread(str(thread_id), keep_last, cutoff, batch_size)
+                for thread_id in thread_ids
+            )
+        deleted = 0
+        after: Optional[str] = None
+        while True:
+            where, args = (
+                ("WHERE thread_id > %s ", [after]) if after is not None else ("", [])
             )
+            with self._cursor() as cur:
+                cur.execute(
+                    self.SELECT_THREAD_IDS_SQL + where + "ORDER BY thread_id LIMIT %s",
+                    [*args, batch_size],
+                )
+                page = [row["thread_id"] for row in cur.fetchall()]
+            for thread_id in page:
+                deleted += self._prune_thread(thread_id, keep_last, cutoff, batch_size)
+            if len(page) < batch_size:
+                return deleted
+            after = page[-1]
+
+    def _prune_thread(
+        self,
+        thread_id: str,
+        keep_last: Optional[int],
+        cutoff: Optional[str],
+        batch_size: int,
+    ) -> int:
+        deleted = 0
+        namespaces: set[str] = set()
+        while True:
+            with self._cursor() as cur, cur.connection.transaction():
+                cur.execute(
+                    self.PRUNE_CHECKPOINTS_SQL,
+                    {
+                        "thread_id": thread_id,
+                        "keep_last": keep_last,
+                        "cutoff": cutoff,
+                        "batch_size": batch_size,
+                    },
+                )
+                rows = cur.fetchall()
+                if rows:
+                    cur.execute(
+                        self.DELETE_PRUNED_WRITES_SQL,
+                        self._pruned_writes_args(thread_id, rows),
+                    )
+            deleted += len(rows)
+            namespaces.update(row["checkpoint_ns"] for row in rows)
+            if len(rows) < batch_size:
+                break
+        for checkpoint_ns in namespaces:
+            while True:
+                with self._cursor() as cur:
+                    cur.execute(
+                        self.DELETE_UNREFERENCED_BLOBS_SQL,
+                        {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "batch_size": batch_size,
+                        },
+                    )
+                    # fetch the rows rather than use rowcount, which isn't
+                    # set before the pipeline is synced
+                    if len(cur.fetchall()) < batch_size:
+                        break
+        return deleted
 
     @contextmanager
     def _cursor(self, *, pipeline: bool = False) -> Iterator[Cursor[DictRow]]:
@@ -1,5 +1,6 @@
 import asyncio
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from typing import Any, AsyncIterator, Iterator, Optional, Sequence, Union
 
 from langchain_core.runnables import RunnableConfig
@@ -10,12 +11,12 @@ from psycopg.types.json import Jsonb
 from psycopg_pool import AsyncConnectionPool
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
     CheckpointTuple,
     get_checkpoint_id,
+    get_prune_cutoff,
 )
 from langgraph.checkpoint.postgres.base import BasePostgresSaver
 from langgraph.checkpoint.serde.base import SerializerProtocol
@@ -303,21 +304,142 @@ class AsyncPostgresSaver(BasePostgresSaver):
             writes (Sequence[Tuple[str, Any]]): List of writes to store, each as (channel, value) pair.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            self.UPSERT_CHECKPOINT_WRITES_SQL
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else self.INSERT_CHECKPOINT_WRITES_SQL
-        )
-        params = await asyncio.to_thread(
-            self._dump_writes,
-            config["configurable"]["thread_id"],
-            config["configurable"]["checkpoint_ns"],
-            config["configurable"]["checkpoint_id"],
-            task_id,
-            writes,
+        await self.aput_writes_batch(config, [(task_id, writes)])
+
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint asynchronously.
+
+        The writes of all tasks are saved with a single `executemany` per kind of write.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task identifier and the writes of that task.
+        """
+        upsert, insert = await asyncio.to_thread(
+            self._dump_task_writes, config, task_writes
         )
         async with self._cursor(pipeline=True) as cur:
-            await cur.executemany(query, params)
+            if upsert:
+                await cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upsert)
+            if insert:
+                await cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, insert)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread asynchronously, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        async with self._cursor(pipeline=True) as cur:
+            for query in self.DELETE_THREAD_SQL:
+                await cur.execute(query, (str(thread_id),))
+
+    async def aprune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """Delete old checkpoints from the database asynchronously.
+
+        A checkpoint is deleted if it isn't among the `keep_last` latest of its
+        thread and namespace, or if it was created more than `max_age` ago. Its
+        writes are deleted too, except those storing the pending sends of a
+        remaining checkpoint, as are the channel values no longer referenced.
+
+        Rows are deleted in batches of `batch_size`, each in its own short
+        transaction, so that pruning can run alongside graphs using the same
+        threads. Pruning by `max_age` a thread that was idle for longer, while
+        it's resumed, may however delete the values of its new checkpoint.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+            batch_size (int): Maximum number of rows deleted per statement.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        cutoff = get_prune_cutoff(keep_last, max_age)
+        deleted = 0
+        if thread_ids is not None:
+            for thread_id in thread_ids:
+                deleted += await self._aprune_thread(
+                    str(thread_id), keep_last, cutoff, batch_size
+                )
+            return deleted
+        after: Optional[str] = None
+        while True:
+            where, args = (
+                ("WHERE thread_id > %s ", [after]) if after is not None else ("", [])
+            )
+            async with self._cursor() as cur:
+                await cur.execute(
+                    self.SELECT_THREAD_IDS_SQL + where + "ORDER BY thread_id LIMIT %s",
+                    [*args, batch_size],
+                )
+                page = [row["thread_id"] for row in await cur.fetchall()]
+            for thread_id in page:
+                deleted += await self._aprune_thread(
+                    thread_id, keep_last, cutoff, batch_size
+                )
+            if len(page) < batch_size:
+                return deleted
+            after = page[-1]
+
+    async def _aprune_thread(
+        self,
+        thread_id: str,
+        keep_last: Optional[int],
+        cutoff: Optional[str],
+        batch_size: int,
+    ) -> int:
+        deleted = 0
+        namespaces: set[str] = set()
+        while True:
+            async with self._cursor() as cur, cur.connection.transaction():
+                await cur.execute(
+                    self.PRUNE_CHECKPOINTS_SQL,
+                    {
+                        "thread_id": thread_id,
+                        "keep_last": keep_last,
+                        "cutoff": cutoff,
+                        "batch_size": batch_size,
+                    },
+                )
+                rows = await cur.fetchall()
+                if rows:
+                    await cur.execute(
+                        self.DELETE_PRUNED_WRITES_SQL,
+                        self._pruned_writes_args(thread_id, rows),
+                    )
+            deleted += len(rows)
+            namespaces.update(row["checkpoint_ns"] for row in rows)
+            if len(rows) < batch_size:
+                break
+        for checkpoint_ns in namespaces:
+            while True:
+                async with self._cursor() as cur:
+                    await cur.execute(
+                        self.DELETE_UNREFERENCED_BLOBS_SQL,
+                        {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "batch_size": batch_size,
+                        },
+                    )
+                    # fetch the rows rather than use rowcount, which isn't
+                    # set before the pipeline is synced
+                    if len(await cur.fetchall()) < batch_size:
+                        break
+        return deleted
 
     @asynccontextmanager
     async def _cursor(
@@ -452,3 +574,54 @@ class AsyncPostgresSaver(BasePostgresSaver):
         return asyncio.run_coroutine_threadsafe(
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
+
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task identifier and the writes of that task.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_batch(config, task_writes), self.loop
+        ).result()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.adelete_thread(thread_id), self.loop
+        ).result()
+
+    def prune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """Delete old checkpoints from the database, see `aprune`.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+            batch_size (int): Maximum number of rows deleted per statement.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aprune(
+                thread_ids, keep_last=keep_last, max_age=max_age, batch_size=batch_size
+            ),
+            self.loop,
+        ).result()
@@ -124,6 +124,106 @@ INSERT_CHECKPOINT_WRITES_SQL = """
 """
 
 
+DELETE_THREAD_SQL = [
+    "DELETE FROM checkpoints WHERE thread_id = %s",
+    "DELETE FROM checkpoint_blobs WHERE thread_id = %s",
+    "DELETE FROM checkpoint_writes WHERE thread_id = %s",
+]
+
+SELECT_THREAD_IDS_SQL = "SELECT DISTINCT thread_id FROM checkpoints "
+
+# deletes a batch of the checkpoints of a thread, oldest first, so that
+# checkpoints are only ever deleted after their parents
+PRUNE_CHECKPOINTS_SQL = """
+    DELETE FROM checkpoints
+    USING (
+        SELECT checkpoint_ns, checkpoint_id
+        FROM (
+            SELECT
+                checkpoint_ns,
+                checkpoint_id,
+                row_number() OVER (
+                    PARTITION BY checkpoint_ns ORDER BY checkpoint_id DESC
+                ) AS position
+            FROM checkpoints
+            WHERE thread_id = %(thread_id)s
+        ) ranked
+        WHERE position > %(keep_last)s OR checkpoint_id < %(cutoff)s
+        ORDER BY checkpoint_id
+        LIMIT %(batch_size)s
+    ) pruned
+    WHERE checkpoints.thread_id = %(thread_id)s
+        AND checkpoints.checkpoint_ns = pruned.checkpoint_ns
+        AND checkpoints.checkpoint_id = pruned.checkpoint_id
+    RETURNING
+        checkpoints.checkpoint_ns,
+        checkpoints.checkpoint_id,
+        checkpoints.parent_checkpoint_id
+"""
+
+# deletes the writes of the given checkpoints that no longer exist, except the
+# pending sends of a remaining checkpoint, stored with its parent
+DELETE_PRUNED_WRITES_SQL = f"""
+    DELETE FROM checkpoint_writes cw
+    USING unnest(%(checkpoint_ns)s::text[], %(checkpoint_id)s::text[])
+        AS pruned(checkpoint_ns, checkpoint_id)
+    WHERE cw.thread_id = %(thread_id)s
+        AND cw.checkpoint_ns = pruned.checkpoint_ns
+        AND cw.checkpoint_id = pruned.checkpoint_id
+        AND NOT EXISTS (
+            SELECT 1 FROM checkpoints
+            WHERE checkpoints.thread_id = cw.thread_id
+                AND checkpoints.checkpoint_ns = cw.checkpoint_ns
+                AND checkpoints.checkpoint_id = cw.checkpoint_id
+        )
+        AND NOT (
+            cw.channel = '{TASKS}'
+            AND EXISTS (
+                SELECT 1 FROM checkpoints
+                WHERE checkpoints.thread_id = cw.thread_id
+                    AND checkpoints.checkpoint_ns = cw.checkpoint_ns
+                    AND checkpoints.parent_checkpoint_id = cw.checkpoint_id
+            )
+        )
+"""
+
+# deletes a batch of the channel values of a namespace not referenced by any of
+# its checkpoints. Values are saved before the checkpoint referencing them, so
+# only values older than a referenced one are deleted, unless the namespace has
+# no checkpoints left. Rows locked by a concurrent prune are skipped.
+DELETE_UNREFERENCED_BLOBS_SQL = """
+    DELETE FROM checkpoint_blobs
+    WHERE ctid = ANY(ARRAY(
+        SELECT bl.ctid
+        FROM checkpoint_blobs bl
+        WHERE bl.thread_id = %(thread_id)s
+            AND bl.checkpoint_ns = %(checkpoint_ns)s
+            AND NOT EXISTS (
+                SELECT 1 FROM checkpoints
+                WHERE checkpoints.thread_id = bl.thread_id
+                    AND checkpoints.checkpoint_ns = bl.checkpoint_ns
+                    AND checkpoints.checkpoint -> 'channel_versions' ->> bl.channel = bl.version
+            )
+            AND (
+                EXISTS (
+                    SELECT 1 FROM checkpoints
+                    WHERE checkpoints.thread_id = bl.thread_id
+                        AND checkpoints.checkpoint_ns = bl.checkpoint_ns
+                        AND checkpoints.checkpoint -> 'channel_versions' ->> bl.channel > bl.version
+                )
+                OR NOT EXISTS (
+                    SELECT 1 FROM checkpoints
+                    WHERE checkpoints.thread_id = bl.thread_id
+                        AND checkpoints.checkpoint_ns = bl.checkpoint_ns
+                )
+            )
+        LIMIT %(batch_size)s
+        FOR UPDATE SKIP LOCKED
+    ))
+    RETURNING channel, version
+"""
+
+
 class BasePostgresSaver(BaseCheckpointSaver[str]):
     SELECT_SQL = SELECT_SQL
     MIGRATIONS = MIGRATIONS
@@ -131,6 +231,11 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
     UPSERT_CHECKPOINT_WRITES_SQL = UPSERT_CHECKPOINT_WRITES_SQL
     INSERT_CHECKPOINT_WRITES_SQL = INSERT_CHECKPOINT_WRITES_SQL
+    DELETE_THREAD_SQL = DELETE_THREAD_SQL
+    SELECT_THREAD_IDS_SQL = SELECT_THREAD_IDS_SQL
+    PRUNE_CHECKPOINTS_SQL = PRUNE_CHECKPOINTS_SQL
+    DELETE_PRUNED_WRITES_SQL = DELETE_PRUNED_WRITES_SQL
+    DELETE_UNREFERENCED_BLOBS_SQL = DELETE_UNREFERENCED_BLOBS_SQL
 
     jsonplus_serde = JsonPlusSerializer()
 
@@ -224,6 +329,49 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             for idx, (channel, value) in enumerate(writes)
         ]
 
+    def _dump_task_writes(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> tuple[
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+    ]:
+        """Return the rows for the writes of the given tasks, as a pair of rows
+        to upsert (tasks writing only to special channels, eg. errors) and rows
+        to insert unless already present."""
+        upsert: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        insert: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        for task_id, writes in task_writes:
+            rows = upsert if all(w[0] in WRITES_IDX_MAP for w in writes) else insert
+            rows.extend(
+                self._dump_writes(
+                    config["configurable"]["thread_id"],
+                    config["configurable"]["checkpoint_ns"],
+                    config["configurable"]["checkpoint_id"],
+                    task_id,
+                    writes,
+                )
+            )
+        return upsert, insert
+
+    def _pruned_writes_args(
+        self, thread_id: str, rows: Sequence[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Return the arguments of DELETE_PRUNED_WRITES_SQL for a batch of pruned
+        checkpoints, whose writes and those of their parents may be deleted."""
+        candidates = {(row["checkpoint_ns"], row["checkpoint_id"]) for row in rows}
+        candidates.update(
+            (row["checkpoint_ns"], row["parent_checkpoint_id"])
+            for row in rows
+            if row["parent_checkpoint_id"] is not None
+        )
+        return {
+            "thread_id": thread_id,
+            "checkpoint_ns": [checkpoint_ns for checkpoint_ns, _ in candidates],
+            "checkpoint_id": [checkpoint_id for _, checkpoint_id in candidates],
+        }
+
     def _load_metadata(self, metadata: dict[str, Any]) -> CheckpointMetadata:
         return self.jsonplus_serde.loads(self.jsonplus_serde.dumps(metadata))
 
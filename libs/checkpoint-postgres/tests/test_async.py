@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import Any
 
 import pytest
@@ -11,6 +12,7 @@ from langgraph.checkpoint.base import (
     empty_checkpoint,
 )
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.checkpoint.serde.types import TASKS
 
 
 class TestAsyncPostgresSaver:
@@ -111,3 +113,85 @@ class TestAsyncPostgresSaver:
             assert [c async for c in saver.alist(None, filter={"my_key": "abc"})][
                 0
             ].metadata["my_key"] == "abc"
+
+    async def test_aprune(self) -> None:
+        async with AsyncPostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+            }
+            chkpnt: Checkpoint = empty_checkpoint()
+            configs = []
+            for step in range(4):
+                chkpnt = {
+                    **create_checkpoint(chkpnt, None, step),
+                    "channel_values": {"a": "1", "b": step},
+                    "channel_versions": {"a": "1", "b": str(step + 1)},
+                }
+                config = await saver.aput(
+                    config,
+                    chkpnt,
+                    {},
+                    {"a": "1", "b": "1"} if step == 0 else {"b": str(step + 1)},
+                )
+                await saver.aput_writes(config, [("b", step), (TASKS, step)], "t")
+                configs.append(config)
+            other = await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+            with pytest.raises(ValueError):
+                await saver.aprune()
+            assert await saver.aprune(["thread-3"], keep_last=2, batch_size=1) == 2
+
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-3"}}
+            assert [c.config async for c in saver.alist(thread)] == configs[:1:-1]
+            # only the pending sends of the parent of the oldest checkpoint are kept
+            saved = await saver.aget_tuple(configs[2])
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {"a": "1", "b": 2}
+            assert saved.checkpoint["pending_sends"] == [1]
+            async with saver._cursor() as cur:
+                await cur.execute(
+                    "SELECT checkpoint_id, channel FROM checkpoint_writes WHERE thread_id = 'thread-3' ORDER BY checkpoint_id, channel"
+                )
+                assert [
+                    (row["checkpoint_id"], row["channel"])
+                    for row in await cur.fetchall()
+                ] == [
+                    (configs[1]["configurable"]["checkpoint_id"], TASKS),
+                    (configs[2]["configurable"]["checkpoint_id"], TASKS),
+                    (configs[2]["configurable"]["checkpoint_id"], "b"),
+                    (configs[3]["configurable"]["checkpoint_id"], TASKS),
+                    (configs[3]["configurable"]["checkpoint_id"], "b"),
+                ]
+                # blobs of versions no longer referenced are deleted
+                await cur.execute(
+                    "SELECT channel, version FROM checkpoint_blobs WHERE thread_id = 'thread-3' ORDER BY channel, version"
+                )
+                assert [
+                    (row["channel"], row["version"]) for row in await cur.fetchall()
+                ] == [("a", "1"), ("b", "3"), ("b", "4")]
+            # other threads are untouched
+            assert await saver.aget_tuple(other) is not None
+
+            assert await saver.aprune(keep_last=2) == 0
+            assert await saver.aprune(max_age=timedelta(0), batch_size=1) == 3
+            assert [c async for c in saver.alist(None)] == []
+            async with saver._cursor() as cur:
+                for table in ("checkpoints", "checkpoint_writes", "checkpoint_blobs"):
+                    await cur.execute(f"SELECT * FROM {table}")
+                    assert await cur.fetchall() == []
+
+    async def test_adelete_thread(self) -> None:
+        async with AsyncPostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            config = await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            await saver.aput(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            await saver.aput_writes(self.config_2, [("foo", "bar")], "t")
+
+            await saver.adelete_thread("thread-2")
+
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-2"}}
+            assert [c async for c in saver.alist(thread)] == []
+            async with saver._cursor() as cur:
+                await cur.execute("SELECT * FROM checkpoint_writes")
+                assert await cur.fetchall() == []
+            assert await saver.aget_tuple(config) is not None
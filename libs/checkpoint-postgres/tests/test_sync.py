@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import Any
 
 import pytest
@@ -11,6 +12,7 @@ from langgraph.checkpoint.base import (
     empty_checkpoint,
 )
 from langgraph.checkpoint.postgres import PostgresSaver
+from langgraph.checkpoint.serde.types import TASKS
 
 
 class TestPostgresSaver:
@@ -110,3 +112,86 @@ class TestPostgresSaver:
                 list(saver.list(None, filter={"my_key": "abc"}))[0].metadata["my_key"]  # type: ignore
                 == "abc"
             )
+
+    def test_prune(self) -> None:
+        with PostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+            }
+            chkpnt: Checkpoint = empty_checkpoint()
+            configs = []
+            for step in range(4):
+                chkpnt = {
+                    **create_checkpoint(chkpnt, None, step),
+                    "channel_values": {"a": "1", "b": step},
+                    "channel_versions": {"a": "1", "b": str(step + 1)},
+                }
+                config = saver.put(
+                    config,
+                    chkpnt,
+                    {},
+                    {"a": "1", "b": "1"} if step == 0 else {"b": str(step + 1)},
+                )
+                saver.put_writes(config, [("b", step), (TASKS, step)], "t")
+                configs.append(config)
+            other = saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+            with pytest.raises(ValueError):
+                saver.prune()
+            assert saver.prune(["thread-3"], keep_last=2, batch_size=1) == 2
+
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-3"}}
+            assert [c.config for c in saver.list(thread)] == configs[:1:-1]
+            # only the pending sends of the parent of the oldest checkpoint are kept
+            saved = saver.get_tuple(configs[2])
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {"a": "1", "b": 2}
+            assert saved.checkpoint["pending_sends"] == [1]
+            with saver._cursor() as cur:
+                cur.execute(
+                    "SELECT checkpoint_id, channel FROM checkpoint_writes WHERE thread_id = 'thread-3' ORDER BY checkpoint_id, channel"
+                )
+                assert [
+                    (row["checkpoint_id"], row["channel"]) for row in cur.fetchall()
+                ] == [
+                    (configs[1]["configurable"]["checkpoint_id"], TASKS),
+                    (configs[2]["configurable"]["checkpoint_id"], TASKS),
+                    (configs[2]["configurable"]["checkpoint_id"], "b"),
+                    (configs[3]["configurable"]["checkpoint_id"], TASKS),
+                    (configs[3]["configurable"]["checkpoint_id"], "b"),
+                ]
+                # blobs of versions no longer referenced are deleted
+                cur.execute(
+                    "SELECT channel, version FROM checkpoint_blobs WHERE thread_id = 'thread-3' ORDER BY channel, version"
+                )
+                assert [(row["channel"], row["version"]) for row in cur.fetchall()] == [
+                    ("a", "1"),
+                    ("b", "3"),
+                    ("b", "4"),
+                ]
+            # other threads are untouched
+            assert saver.get_tuple(other) is not None
+
+            assert saver.prune(keep_last=2) == 0
+            assert saver.prune(max_age=timedelta(0), batch_size=1) == 3
+            assert list(saver.list(None)) == []
+            with saver._cursor() as cur:
+                for table in ("checkpoints", "checkpoint_writes", "checkpoint_blobs"):
+                    cur.execute(f"SELECT * FROM {table}")
+                    assert cur.fetchall() == []
+
+    def test_delete_thread(self) -> None:
+        with PostgresSaver.from_conn_string(DEFAULT_URI) as saver:
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            saver.put_writes(self.config_2, [("foo", "bar")], "t")
+
+            saver.delete_thread("thread-2")
+
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-2"}}
+            assert list(saver.list(thread)) == []
+            with saver._cursor() as cur:
+                cur.execute("SELECT * FROM checkpoint_writes")
+                assert cur.fetchall() == []
+            assert saver.get_tuple(config) is not None
@@ -2,12 +2,25 @@ import random
 import sqlite3
 import threading
 from contextlib import closing, contextmanager
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple
+from datetime import timedelta
+from functools import partial
+from itertools import groupby
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from langchain_core.runnables import RunnableConfig
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     BaseCheckpointSaver,
     ChannelVersions,
     Checkpoint,
@@ -15,10 +28,24 @@ from langgraph.checkpoint.base import (
     CheckpointTuple,
     SerializerProtocol,
     get_checkpoint_id,
+    get_prune_cutoff,
+    select_pruned_checkpoints,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
+from langgraph.checkpoint.sqlite.pool import ConnectionPool
+from langgraph.checkpoint.sqlite.utils import (
+    SELECT_LIST_CHAIN_SQL,
+    SavedLists,
+    blobs_where,
+    dump_blobs,
+    dump_checkpoint,
+    dump_writes,
+    load_list,
+    migrate_inline_values,
+    referenced_blobs,
+    search_where,
+)
 
 _AIO_ERROR_MSG = (
     "The SqliteSaver does not support async methods. "
@@ -30,19 +57,23 @@ _AIO_ERROR_MSG = (
     "for more information."
 )
 
+T = TypeVar("T")
+
 
 class SqliteSaver(BaseCheckpointSaver[str]):
     """A checkpoint saver that stores checkpoints in a SQLite database.
 
     Note:
         This class is meant for lightweight, synchronous use cases
-        (demos and small projects) and does not
-        scale to multiple threads.
+        (demos and small projects). With a single connection, it does not
+        scale to multiple threads: give it a
+        [ConnectionPool][langgraph.checkpoint.sqlite.pool.ConnectionPool]
+        instead, to read concurrently and commit the writes of many threads together.
         For a similar sqlite saver with `async` support,
         consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
 
     Args:
-        conn (sqlite3.Connection): The SQLite database connection.
+        conn (Union[sqlite3.Connection, ConnectionPool]): The SQLite database connection, or a pool of connections to a database file.
         serde (Optional[SerializerProtocol]): The serializer to use for serializing and deserializing checkpoints. Defaults to JsonPlusSerializerCompat.
 
     Examples:
@@ -65,12 +96,12 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         StateSnapshot(values=4, next=(), config={'configurable': {'thread_id': '1', 'checkpoint_ns': '', 'checkpoint_id': '0c62ca34-ac19-445d-bbb0-5b4984975b2a'}}, parent_config=None)
     """  # noqa
 
-    conn: sqlite3.Connection
+    conn: Union[sqlite3.Connection, ConnectionPool]
     is_setup: bool
 
     def __init__(
         self,
-        conn: sqlite3.Connection,
+        conn: Union[sqlite3.Connection, ConnectionPool],
         *,
         serde: Optional[SerializerProtocol] = None,
     ) -> None:
@@ -79,14 +110,18 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         self.conn = conn
         self.is_setup = False
         self.lock = threading.Lock()
+        self.saved_lists = SavedLists()
 
     @classmethod
     @contextmanager
-    def from_conn_string(cls, conn_string: str) -> Iterator["SqliteSaver"]:
+    def from_conn_string(
+        cls, conn_string: str, *, readers: Optional[int] = None
+    ) -> Iterator["SqliteSaver"]:
         """Create a new SqliteSaver instance from a connection string.
 
         Args:
             conn_string (str): The SQLite connection string.
+            readers (Optional[int]): If given, use a connection pool with this many read connections and a writer thread, instead of a single connection. Defaults to None.
 
         Yields:
             SqliteSaver: A new SqliteSaver instance.
@@ -102,7 +137,16 @@ class SqliteSaver(BaseCheckpointSaver[str]):
 
                 with SqliteSaver.from_conn_string("checkpoints.sqlite") as memory:
                     ...
-        """
+
+            To disk, from many threads:
+
+                with SqliteSaver.from_conn_string("checkpoints.sqlite", readers=8) as memory:
+                    ...
+        """  # noqa
+        if readers is not None:
+            with ConnectionPool(conn_string, readers=readers) as pool:
+                yield SqliteSaver(pool)
+            return
         with closing(
             sqlite3.connect(
                 conn_string,
@@ -116,13 +160,25 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """Set up the checkpoint database.
 
         This method creates the necessary tables in the SQLite database if they don't
-        already exist. It is called automatically when needed and should not be called
-        directly by the user.
+        already exist, and moves the channel values of checkpoints saved by earlier
+        versions to the `checkpoint_blobs` table. It is called automatically when
+        needed and should not be called directly by the user.
         """
         if self.is_setup:
             return
+        if isinstance(self.conn, ConnectionPool):
+            # the writer thread runs it on its own, between transactions
+            with self.lock:
+                if not self.is_setup:
+                    self.conn.write(
+                        lambda cur: self._setup(cur.connection), transaction=False
+                    )
+        else:
+            self._setup(self.conn)
+        self.is_setup = True
 
-        self.conn.executescript(
+    def _setup(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(
             """
             PRAGMA journal_mode=WAL;
             CREATE TABLE IF NOT EXISTS checkpoints (
@@ -146,17 +202,60 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 value BLOB,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
             );
+            CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                channel TEXT NOT NULL,
+                version TEXT NOT NULL,
+                type TEXT NOT NULL,
+                blob BLOB,
+                base_version TEXT,
+                PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+            );
             """
         )
+        # databases written by earlier versions are migrated once, the schema
+        # version is tracked in the database header
+        if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+            columns = {
+                column
+                for _, column, *_ in conn.execute("PRAGMA table_info(checkpoint_blobs)")
+            }
+            if "base_version" not in columns:
+                conn.execute(
+                    "ALTER TABLE checkpoint_blobs ADD COLUMN base_version TEXT"
+                )
+            self._migrate_inline_values(conn)
+            conn.execute("PRAGMA user_version = 1")
+            conn.commit()
 
-        self.is_setup = True
+    def _migrate_inline_values(
+        self, conn: sqlite3.Connection, batch_size: int = 1000
+    ) -> None:
+        with closing(conn.cursor()) as cur:
+            last_rowid = 0
+            while rows := cur.execute(
+                "SELECT rowid, thread_id, checkpoint_ns, type, checkpoint FROM checkpoints WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, batch_size),
+            ).fetchall():
+                last_rowid = rows[-1][0]
+                blobs, updates = migrate_inline_values(self.serde, rows)
+                cur.executemany(
+                    "INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, base_version) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    blobs,
+                )
+                cur.executemany(
+                    "UPDATE checkpoints SET type = ?, checkpoint = ? WHERE rowid = ?",
+                    updates,
+                )
 
     @contextmanager
     def cursor(self, transaction: bool = True) -> Iterator[sqlite3.Cursor]:
         """Get a cursor for the SQLite database.
 
         This method returns a cursor for the SQLite database. It is used internally
-        by the SqliteSaver and should not be called directly by the user.
+        by the SqliteSaver and should not be called directly by the user. With a
+        connection pool, it is a cursor of a read connection.
 
         Args:
             transaction (bool): Whether to commit the transaction when the cursor is closed. Defaults to True.
@@ -164,6 +263,17 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         Yields:
             sqlite3.Cursor: A cursor for the SQLite database.
         """
+        if isinstance(self.conn, ConnectionPool):
+            self.setup()
+            with self.conn.reader() as conn:
+                cur = conn.cursor()
+                try:
+                    yield cur
+                finally:
+                    if transaction:
+                        conn.commit()
+                    cur.close()
+            return
         with self.lock:
             self.setup()
             cur = self.conn.cursor()
@@ -174,6 +284,51 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     self.conn.commit()
                 cur.close()
 
+    def _write(self, fn: Callable[[sqlite3.Cursor], T]) -> T:
+        """Run `fn` with a cursor, in a transaction committed once it returns.
+
+        With a connection pool, it runs in the writer thread, and may be
+        committed together with the writes of other threads.
+        """
+        if isinstance(self.conn, ConnectionPool):
+            self.setup()
+            return self.conn.write(fn)
+        with self.cursor() as cur:
+            return fn(cur)
+
+    def _load_checkpoint(
+        self,
+        cur: sqlite3.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        type: str,
+        checkpoint: bytes,
+    ) -> Checkpoint:
+        loaded: Checkpoint = self.serde.loads_typed((type, checkpoint))
+        if versions := loaded["channel_versions"]:
+            where, param_values = blobs_where(thread_id, checkpoint_ns, versions)
+            cur.execute(
+                f"SELECT channel, version, type, blob, base_version FROM checkpoint_blobs {where}",
+                param_values,
+            )
+            for channel, version, type, blob, base_version in cur.fetchall():
+                if type == "empty":
+                    continue
+                elif base_version is None:
+                    loaded["channel_values"][channel] = self.serde.loads_typed(
+                        (type, blob)
+                    )
+                else:
+                    # lists saved as the items appended to their base version
+                    cur.execute(
+                        SELECT_LIST_CHAIN_SQL,
+                        (thread_id, checkpoint_ns, channel, version, base_version),
+                    )
+                    loaded["channel_values"][channel] = load_list(
+                        self.serde, cur.fetchall(), base_version
+                    ) + self.serde.loads_typed((type, blob))
+        return loaded
+
     def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database.
 
@@ -244,6 +399,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # deserialize the checkpoint, loading channel values from blobs
+                loaded = self._load_checkpoint(
+                    cur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 # find any pending writes
                 cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -253,10 +412,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -321,7 +480,9 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         ORDER BY checkpoint_id DESC"""
         if limit:
             query += f" LIMIT {limit}"
-        with self.cursor(transaction=False) as cur, closing(self.conn.cursor()) as wcur:
+        with self.cursor(transaction=False) as cur, closing(
+            cur.connection.cursor()
+        ) as wcur:
             cur.execute(query, param_values)
             for (
                 thread_id,
@@ -332,6 +493,9 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                loaded = self._load_checkpoint(
+                    wcur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -344,7 +508,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -396,9 +560,49 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        values = checkpoint["channel_values"]
+        # only channels updated since the previous checkpoint are serialized,
+        # the values of other channels are already stored at their version, and
+        # lists extending their previous version are saved as the new items
+        digests = self.saved_lists.digests(
+            self.serde, str(thread_id), checkpoint_ns, values, new_versions
+        )
+        bases = self.saved_lists.bases(
+            str(thread_id), checkpoint_ns, digests, new_versions
+        )
+        blobs = dump_blobs(
+            self.serde, str(thread_id), checkpoint_ns, values, new_versions, bases
+        )
+        type_, serialized_checkpoint = self.serde.dumps_typed(
+            dump_checkpoint(checkpoint)
+        )
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
-        with self.cursor() as cur:
+
+        def write(cur: sqlite3.Cursor) -> None:
+            rows = blobs
+            if bases:
+                # base versions may have been deleted since, by another saver
+                where, param_values = blobs_where(
+                    str(thread_id),
+                    checkpoint_ns,
+                    {channel: version for channel, (version, *_) in bases.items()},
+                )
+                cur.execute(
+                    f"SELECT channel FROM checkpoint_blobs {where}", param_values
+                )
+                if len(found := {channel for (channel,) in cur}) < len(bases):
+                    rows = dump_blobs(
+                        self.serde,
+                        str(thread_id),
+                        checkpoint_ns,
+                        values,
+                        new_versions,
+                        {c: b for c, b in bases.items() if c in found},
+                    )
+            cur.executemany(
+                "INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, base_version) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
             cur.execute(
                 "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (
@@ -411,6 +615,11 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     serialized_metadata,
                 ),
             )
+
+        self._write(write)
+        self.saved_lists.update(
+            str(thread_id), checkpoint_ns, digests, new_versions, bases
+        )
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -434,28 +643,149 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             writes (Sequence[Tuple[str, Any]]): List of writes to store, each as (channel, value) pair.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
-        )
-        with self.cursor() as cur:
-            cur.executemany(
-                query,
-                [
-                    (
-                        str(config["configurable"]["thread_id"]),
-                        str(config["configurable"]["checkpoint_ns"]),
-                        str(config["configurable"]["checkpoint_id"]),
-                        task_id,
-                        WRITES_IDX_MAP.get(channel, idx),
-                        channel,
-                        *self.serde.dumps_typed(value),
-                    )
-                    for idx, (channel, value) in enumerate(writes)
-                ],
+        self.put_writes_batch(config, [(task_id, writes)])
+
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        The writes of all tasks are saved in a single transaction.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task identifier and the writes of that task.
+        """
+        replace, insert = dump_writes(self.serde, config, task_writes)
+
+        def write(cur: sqlite3.Cursor) -> None:
+            if replace:
+                cur.executemany(
+                    "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    replace,
+                )
+            if insert:
+                cur.executemany(
+                    "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    insert,
+                )
+
+        self._write(write)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+
+        def write(cur: sqlite3.Cursor) -> None:
+            cur.execute(
+                "DELETE FROM checkpoints WHERE thread_id = ?", (str(thread_id),)
+            )
+            cur.execute("DELETE FROM writes WHERE thread_id = ?", (str(thread_id),))
+            cur.execute(
+                "DELETE FROM checkpoint_blobs WHERE thread_id = ?", (str(thread_id),)
             )
 
+        self._write(write)
+        self.saved_lists.forget(str(thread_id))
+
+    def prune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Delete old checkpoints from the database.
+
+        A checkpoint is deleted if it isn't among the `keep_last` latest of its
+        thread and namespace, or if it was created more than `max_age` ago. Its
+        writes are deleted too, except those storing the pending sends of a
+        remaining checkpoint, as are the channel values no longer referenced.
+
+        Each thread is pruned in its own transaction, so that checkpoints can be
+        saved in between.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        cutoff = get_prune_cutoff(keep_last, max_age)
+        if thread_ids is None:
+            with self.cursor(transaction=False) as cur:
+                cur.execute("SELECT DISTINCT thread_id FROM checkpoints")
+                thread_ids = [thread_id for (thread_id,) in cur]
+
+        def prune_thread(thread_id: str, cur: sqlite3.Cursor) -> int:
+            deleted = 0
+            cur.execute(
+                "SELECT checkpoint_ns, checkpoint_id, parent_checkpoint_id FROM checkpoints WHERE thread_id = ? ORDER BY checkpoint_ns, checkpoint_id DESC",
+                (str(thread_id),),
+            )
+            for checkpoint_ns, history in groupby(cur.fetchall(), lambda r: r[0]):
+                pruned, delete_writes, keep_sends = select_pruned_checkpoints(
+                    [(id, parent) for _, id, parent in history], keep_last, cutoff
+                )
+                if not pruned:
+                    continue
+                cur.executemany(
+                    "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    [(str(thread_id), checkpoint_ns, id) for id in pruned],
+                )
+                cur.executemany(
+                    "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    [(str(thread_id), checkpoint_ns, id) for id in delete_writes],
+                )
+                cur.executemany(
+                    "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? AND channel != ?",
+                    [(str(thread_id), checkpoint_ns, id, TASKS) for id in keep_sends],
+                )
+                self._delete_unreferenced_blobs(cur, str(thread_id), checkpoint_ns)
+                deleted += len(pruned)
+            return deleted
+
+        return sum(
+            self._write(partial(prune_thread, thread_id)) for thread_id in thread_ids
+        )
+
+    def _delete_unreferenced_blobs(
+        self, cur: sqlite3.Cursor, thread_id: str, checkpoint_ns: str
+    ) -> None:
+        cur.execute(
+            "SELECT type, checkpoint FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?",
+            (thread_id, checkpoint_ns),
+        )
+        versions = [
+            (channel, str(version))
+            for type, checkpoint in cur.fetchall()
+            for channel, version in self.serde.loads_typed((type, checkpoint))[
+                "channel_versions"
+            ].items()
+        ]
+        cur.execute(
+            "SELECT channel, version, base_version FROM checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ?",
+            (thread_id, checkpoint_ns),
+        )
+        bases = {(channel, version): base for channel, version, base in cur.fetchall()}
+        # the base versions of the lists that remain are kept too
+        referenced = referenced_blobs(versions, bases)
+        cur.executemany(
+            "DELETE FROM checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+            [
+                (thread_id, checkpoint_ns, channel, version)
+                for channel, version in bases
+                if (channel, version) not in referenced
+            ],
+        )
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -497,6 +827,30 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         raise NotImplementedError(_AIO_ERROR_MSG)
 
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread asynchronously.
+
+        Note:
+            This async method is not supported by the SqliteSaver class.
+            Use delete_thread() instead, or consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
+        """
+        raise NotImplementedError(_AIO_ERROR_MSG)
+
+    async def aprune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Delete old checkpoints from the database asynchronously.
+
+        Note:
+            This async method is not supported by the SqliteSaver class.
+            Use prune() instead, or consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
+        """
+        raise NotImplementedError(_AIO_ERROR_MSG)
+
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         """Generate the next version ID for a channel.
 
@@ -1,6 +1,8 @@
 import asyncio
 import random
 from contextlib import asynccontextmanager
+from datetime import timedelta
+from itertools import groupby
 from typing import (
     Any,
     AsyncIterator,
@@ -17,7 +19,6 @@ import aiosqlite
 from langchain_core.runnables import RunnableConfig
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     BaseCheckpointSaver,
     ChannelVersions,
     Checkpoint,
@@ -25,10 +26,23 @@ from langgraph.checkpoint.base import (
     CheckpointTuple,
     SerializerProtocol,
     get_checkpoint_id,
+    get_prune_cutoff,
+    select_pruned_checkpoints,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
+from langgraph.checkpoint.sqlite.utils import (
+    SELECT_LIST_CHAIN_SQL,
+    SavedLists,
+    blobs_where,
+    dump_blobs,
+    dump_checkpoint,
+    dump_writes,
+    load_list,
+    migrate_inline_values,
+    referenced_blobs,
+    search_where,
+)
 
 T = TypeVar("T", bound=Callable)
 
@@ -122,6 +136,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         self.lock = asyncio.Lock()
         self.loop = asyncio.get_running_loop()
         self.is_setup = False
+        self.saved_lists = SavedLists()
 
     @classmethod
     @asynccontextmanager
@@ -233,12 +248,53 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
 
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_batch(config, task_writes), self.loop
+        ).result()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.adelete_thread(thread_id), self.loop
+        ).result()
+
+    def prune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Delete old checkpoints from the database.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aprune(thread_ids, keep_last=keep_last, max_age=max_age), self.loop
+        ).result()
+
     async def setup(self) -> None:
         """Set up the checkpoint database asynchronously.
 
         This method creates the necessary tables in the SQLite database if they don't
-        already exist. It is called automatically when needed and should not be called
-        directly by the user.
+        already exist, and moves the channel values of checkpoints saved by earlier
+        versions to the `checkpoint_blobs` table. It is called automatically when
+        needed and should not be called directly by the user.
         """
         async with self.lock:
             if self.is_setup:
@@ -269,12 +325,92 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     value BLOB,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
                 );
+                CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL DEFAULT '',
+                    channel TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    blob BLOB,
+                    base_version TEXT,
+                    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+                );
                 """
             ):
                 await self.conn.commit()
+            # databases written by earlier versions are migrated once, the schema
+            # version is tracked in the database header
+            async with self.conn.execute("PRAGMA user_version") as cur:
+                (version,) = await cur.fetchone()  # type: ignore[misc]
+            if version < 1:
+                async with self.conn.execute(
+                    "PRAGMA table_info(checkpoint_blobs)"
+                ) as cur:
+                    columns = {column for _, column, *_ in await cur.fetchall()}
+                if "base_version" not in columns:
+                    await self.conn.execute(
+                        "ALTER TABLE checkpoint_blobs ADD COLUMN base_version TEXT"
+                    )
+                await self._migrate_inline_values()
+                await self.conn.execute("PRAGMA user_version = 1")
+                await self.conn.commit()
 
             self.is_setup = True
 
+    async def _migrate_inline_values(self, batch_size: int = 1000) -> None:
+        async with self.conn.cursor() as cur:
+            last_rowid = 0
+            while True:
+                await cur.execute(
+                    "SELECT rowid, thread_id, checkpoint_ns, type, checkpoint FROM checkpoints WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, batch_size),
+                )
+                if not (rows := list(await cur.fetchall())):
+                    break
+                last_rowid = rows[-1][0]
+                blobs, updates = migrate_inline_values(self.serde, rows)
+                await cur.executemany(
+                    "INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, base_version) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    blobs,
+                )
+                await cur.executemany(
+                    "UPDATE checkpoints SET type = ?, checkpoint = ? WHERE rowid = ?",
+                    updates,
+                )
+
+    async def _load_checkpoint(
+        self,
+        cur: aiosqlite.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        type: str,
+        checkpoint: bytes,
+    ) -> Checkpoint:
+        loaded: Checkpoint = self.serde.loads_typed((type, checkpoint))
+        if versions := loaded["channel_versions"]:
+            where, params = blobs_where(thread_id, checkpoint_ns, versions)
+            await cur.execute(
+                f"SELECT channel, version, type, blob, base_version FROM checkpoint_blobs {where}",
+                params,
+            )
+            for channel, version, type, blob, base_version in await cur.fetchall():
+                if type == "empty":
+                    continue
+                elif base_version is None:
+                    loaded["channel_values"][channel] = self.serde.loads_typed(
+                        (type, blob)
+                    )
+                else:
+                    # lists saved as the items appended to their base version
+                    await cur.execute(
+                        SELECT_LIST_CHAIN_SQL,
+                        (thread_id, checkpoint_ns, channel, version, base_version),
+                    )
+                    loaded["channel_values"][channel] = load_list(
+                        self.serde, await cur.fetchall(), base_version
+                    ) + self.serde.loads_typed((type, blob))
+        return loaded
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -325,6 +461,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # deserialize the checkpoint, loading channel values from blobs
+                loaded = await self._load_checkpoint(
+                    cur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 # find any pending writes
                 await cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -334,10 +474,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -398,6 +538,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                loaded = await self._load_checkpoint(
+                    wcur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 await wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -410,7 +553,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -453,21 +596,64 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         await self.setup()
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        values = checkpoint["channel_values"]
+        # only channels updated since the previous checkpoint are serialized,
+        # the values of other channels are already stored at their version, and
+        # lists extending their previous version are saved as the new items
+        digests = self.saved_lists.digests(
+            self.serde, str(thread_id), checkpoint_ns, values, new_versions
+        )
+        bases = self.saved_lists.bases(
+            str(thread_id), checkpoint_ns, digests, new_versions
+        )
+        blobs = dump_blobs(
+            self.serde, str(thread_id), checkpoint_ns, values, new_versions, bases
+        )
+        type_, serialized_checkpoint = self.serde.dumps_typed(
+            dump_checkpoint(checkpoint)
+        )
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
-        async with self.lock, self.conn.execute(
-            "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                str(config["configurable"]["thread_id"]),
-                checkpoint_ns,
-                checkpoint["id"],
-                config["configurable"].get("checkpoint_id"),
-                type_,
-                serialized_checkpoint,
-                serialized_metadata,
-            ),
-        ):
+        async with self.lock, self.conn.cursor() as cur:
+            if bases:
+                # base versions may have been deleted since, by another saver
+                where, params = blobs_where(
+                    str(thread_id),
+                    checkpoint_ns,
+                    {channel: version for channel, (version, *_) in bases.items()},
+                )
+                await cur.execute(
+                    f"SELECT channel FROM checkpoint_blobs {where}", params
+                )
+                found = {channel for (channel,) in await cur.fetchall()}
+                if len(found) < len(bases):
+                    blobs = dump_blobs(
+                        self.serde,
+                        str(thread_id),
+                        checkpoint_ns,
+                        values,
+                        new_versions,
+                        {c: b for c, b in bases.items() if c in found},
+                    )
+            await cur.executemany(
+                "INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, base_version) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                blobs,
+            )
+            await cur.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(config["configurable"]["thread_id"]),
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    serialized_checkpoint,
+                    serialized_metadata,
+                ),
+            )
             await self.conn.commit()
+        self.saved_lists.update(
+            str(thread_id), checkpoint_ns, digests, new_versions, bases
+        )
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -491,28 +677,155 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             writes (Sequence[Tuple[str, Any]]): List of writes to store, each as (channel, value) pair.
             task_id (str): Identifier for the task creating the writes.
         """
-        query = (
-            "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
-        )
+        await self.aput_writes_batch(config, [(task_id, writes)])
+
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint asynchronously.
+
+        The writes of all tasks are saved in a single transaction.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of task identifier and the writes of that task.
+        """
+        replace, insert = dump_writes(self.serde, config, task_writes)
         await self.setup()
         async with self.lock, self.conn.cursor() as cur:
-            await cur.executemany(
-                query,
-                [
-                    (
-                        str(config["configurable"]["thread_id"]),
-                        str(config["configurable"]["checkpoint_ns"]),
-                        str(config["configurable"]["checkpoint_id"]),
-                        task_id,
-                        WRITES_IDX_MAP.get(channel, idx),
-                        channel,
-                        *self.serde.dumps_typed(value),
-                    )
-                    for idx, (channel, value) in enumerate(writes)
-                ],
+            if replace:
+                await cur.executemany(
+                    "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    replace,
+                )
+            if insert:
+                await cur.executemany(
+                    "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    insert,
+                )
+            await self.conn.commit()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread asynchronously, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        await self.setup()
+        async with self.lock, self.conn.cursor() as cur:
+            await cur.execute(
+                "DELETE FROM checkpoints WHERE thread_id = ?", (str(thread_id),)
+            )
+            await cur.execute(
+                "DELETE FROM writes WHERE thread_id = ?", (str(thread_id),)
             )
+            await cur.execute(
+                "DELETE FROM checkpoint_blobs WHERE thread_id = ?", (str(thread_id),)
+            )
+            await self.conn.commit()
+        self.saved_lists.forget(str(thread_id))
+
+    async def aprune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Delete old checkpoints from the database asynchronously.
+
+        A checkpoint is deleted if it isn't among the `keep_last` latest of its
+        thread and namespace, or if it was created more than `max_age` ago. Its
+        writes are deleted too, except those storing the pending sends of a
+        remaining checkpoint, as are the channel values no longer referenced.
+
+        Each thread is pruned in its own transaction, so that checkpoints can be
+        saved in between.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        cutoff = get_prune_cutoff(keep_last, max_age)
+        await self.setup()
+        if thread_ids is None:
+            async with self.lock, self.conn.execute(
+                "SELECT DISTINCT thread_id FROM checkpoints"
+            ) as cur:
+                thread_ids = [thread_id for (thread_id,) in await cur.fetchall()]
+        deleted = 0
+        for thread_id in thread_ids:
+            async with self.lock, self.conn.cursor() as cur:
+                await cur.execute(
+                    "SELECT checkpoint_ns, checkpoint_id, parent_checkpoint_id FROM checkpoints WHERE thread_id = ? ORDER BY checkpoint_ns, checkpoint_id DESC",
+                    (str(thread_id),),
+                )
+                rows = await cur.fetchall()
+                for checkpoint_ns, history in groupby(rows, lambda r: r[0]):
+                    pruned, delete_writes, keep_sends = select_pruned_checkpoints(
+                        [(id, parent) for _, id, parent in history], keep_last, cutoff
+                    )
+                    if not pruned:
+                        continue
+                    await cur.executemany(
+                        "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                        [(str(thread_id), checkpoint_ns, id) for id in pruned],
+                    )
+                    await cur.executemany(
+                        "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                        [(str(thread_id), checkpoint_ns, id) for id in delete_writes],
+                    )
+                    await cur.executemany(
+                        "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? AND channel != ?",
+                        [
+                            (str(thread_id), checkpoint_ns, id, TASKS)
+                            for id in keep_sends
+                        ],
+                    )
+                    await self._delete_unreferenced_blobs(
+                        cur, str(thread_id), checkpoint_ns
+                    )
+                    deleted += len(pruned)
+                await self.conn.commit()
+        return deleted
+
+    async def _delete_unreferenced_blobs(
+        self, cur: aiosqlite.Cursor, thread_id: str, checkpoint_ns: str
+    ) -> None:
+        await cur.execute(
+            "SELECT type, checkpoint FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?",
+            (thread_id, checkpoint_ns),
+        )
+        versions = [
+            (channel, str(version))
+            for type, checkpoint in await cur.fetchall()
+            for channel, version in self.serde.loads_typed((type, checkpoint))[
+                "channel_versions"
+            ].items()
+        ]
+        await cur.execute(
+            "SELECT channel, version, base_version FROM checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ?",
+            (thread_id, checkpoint_ns),
+        )
+        bases = {
+            (channel, version): base for channel, version, base in await cur.fetchall()
+        }
+        # the base versions of the lists that remain are kept too
+        referenced = referenced_blobs(versions, bases)
+        await cur.executemany(
+            "DELETE FROM checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+            [
+                (thread_id, checkpoint_ns, channel, version)
+                for channel, version in bases
+                if (channel, version) not in referenced
+            ],
+        )
 
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         """Generate the next version ID for a channel.
@@ -0,0 +1,172 @@
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from time import monotonic
+from typing import Any, Callable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# a write function, whether to run it in the transaction of a batch, its result
+_Write = Tuple[Callable[[sqlite3.Cursor], Any], bool, Future[Any]]
+
+
+class ConnectionPool:
+    """Connections to a SQLite database, to use it from many threads at once.
+
+    Reads use one of `readers` read connections, which in WAL mode don't wait
+    for writes. Writes are queued to a writer thread, which owns the only write
+    connection. It commits the writes queued by all threads in one transaction
+    (group commit), waiting up to `commit_interval` seconds for more writes
+    after the first one. Each write runs in a savepoint, so that a failed write
+    doesn't affect the others in the transaction. Writes are applied in the
+    order they were queued, and return once committed.
+
+    Args:
+        conn_string (str): The path of the database file. An in-memory database can't be shared by connections.
+        readers (int): The number of read connections. Defaults to 4.
+        commit_interval (float): Seconds to wait for more writes to commit with the first one. Defaults to 0, which commits the writes queued meanwhile only.
+        max_batch (int): The maximum number of writes per transaction. Defaults to 256.
+
+    Examples:
+
+        >>> from langgraph.checkpoint.sqlite import SqliteSaver
+        >>> from langgraph.checkpoint.sqlite.pool import ConnectionPool
+        >>> with ConnectionPool("checkpoints.sqlite", readers=8) as pool:
+        ...     memory = SqliteSaver(pool)
+        ...     graph = builder.compile(checkpointer=memory)
+    """  # noqa
+
+    def __init__(
+        self,
+        conn_string: str,
+        *,
+        readers: int = 4,
+        commit_interval: float = 0.0,
+        max_batch: int = 256,
+    ) -> None:
+        if conn_string == ":memory:" or "mode=memory" in conn_string:
+            raise ValueError("An in-memory database can't be shared by connections")
+        if readers < 1:
+            raise ValueError("A connection pool needs at least one reader")
+        self.commit_interval = commit_interval
+        self.max_batch = max_batch
+        self.readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        for _ in range(readers):
+            self.readers.put(sqlite3.connect(conn_string, check_same_thread=False))
+        self.writer = sqlite3.connect(conn_string, check_same_thread=False)
+        self.writes: queue.SimpleQueue[Optional[_Write]] = queue.SimpleQueue()
+        # held to queue a write, so that none is queued after closing
+        self.lock = threading.Lock()
+        self.closed = False
+        self.thread = threading.Thread(
+            target=self._run, name="sqlite-writer", daemon=True
+        )
+        self.thread.start()
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read connection, waiting for one to be free."""
+        conn = self.readers.get()
+        try:
+            yield conn
+        finally:
+            self.readers.put(conn)
+
+    def write(
+        self, fn: Callable[[sqlite3.Cursor], T], *, transaction: bool = True
+    ) -> T:
+        """Run `fn` with a cursor of the write connection, in the writer thread,
+        and return its result once committed.
+
+        Args:
+            fn (Callable[[sqlite3.Cursor], T]): The function writing to the database. It must not commit or roll back.
+            transaction (bool): Whether to run `fn` in the transaction of a batch of writes. Otherwise it runs on its own, and manages its own transactions. Defaults to True.
+        """  # noqa
+        fut: Future[T] = Future()
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("The connection pool is closed")
+            self.writes.put((fn, transaction, fut))
+        return fut.result()
+
+    def close(self) -> None:
+        """Apply the queued writes, then close all connections."""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.writes.put(None)
+        self.thread.join()
+        self.writer.close()
+        while not self.readers.empty():
+            self.readers.get_nowait().close()
+
+    def _run(self) -> None:
+        next_write = self.writes.get()
+        while next_write is not None:
+            write, next_write = next_write, None
+            if not write[1]:
+                self._apply([write], transaction=False)
+                next_write = self.writes.get()
+                continue
+            batch = [write]
+            deadline = monotonic() + self.commit_interval
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    queued = self.writes.get(timeout=max(deadline - monotonic(), 0))
+                except queue.Empty:
+                    break
+                if queued is None or not queued[1]:
+                    # stop, or run it on its own, after committing this batch
+                    stop = queued is None
+                    next_write = queued
+                    break
+                batch.append(queued)
+            self._apply(batch, transaction=True)
+            if stop:
+                return
+            if next_write is None:
+                next_write = self.writes.get()
+
+    def _apply(self, batch: list[_Write], *, transaction: bool) -> None:
+        results: list[Tuple[Future[Any], Any, Optional[BaseException]]] = []
+        cur = self.writer.cursor()
+        try:
+            if transaction:
+                cur.execute("BEGIN IMMEDIATE")
+            for fn, _, fut in batch:
+                if transaction:
+                    cur.execute("SAVEPOINT write")
+                try:
+                    results.append((fut, fn(cur), None))
+                except Exception as exc:
+                    if transaction:
+                        cur.execute("ROLLBACK TO write")
+                    results.append((fut, None, exc))
+                if transaction:
+                    cur.execute("RELEASE write")
+            if transaction:
+                self.writer.commit()
+        except BaseException as exc:
+            # the transaction failed, so did all writes
+            if self.writer.in_transaction:
+                self.writer.rollback()
+            for _, _, fut in batch:
+                fut.set_exception(exc)
+            return
+        finally:
+            cur.close()
+        for fut, result, exc in results:
+            if exc is None:
+                fut.set_result(result)
+            else:
+                fut.set_exception(exc)
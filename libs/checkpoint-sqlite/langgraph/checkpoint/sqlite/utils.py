@@ -1,9 +1,19 @@
+import hashlib
 import json
-from typing import Any, Dict, Optional, Sequence, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple
 
 from langchain_core.runnables import RunnableConfig
 
-from langgraph.checkpoint.base import get_checkpoint_id
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.types import is_log_view
 
 
 def _metadata_predicate(
@@ -91,3 +101,283 @@ def search_where(
         param_values.append(get_checkpoint_id(before))
 
     return ("WHERE " + " AND ".join(wheres) if wheres else "", param_values)
+
+
+def dump_checkpoint(checkpoint: Checkpoint) -> Checkpoint:
+    """Return a copy of the checkpoint to store in the `checkpoints` table.
+
+    Values of versioned channels are stored separately in `checkpoint_blobs`,
+    only the values of unversioned channels are kept inline.
+    """
+    return {
+        **checkpoint,
+        "channel_values": {
+            k: v
+            for k, v in checkpoint["channel_values"].items()
+            if k not in checkpoint["channel_versions"]
+        },
+    }
+
+
+BlobRow = Tuple[str, str, str, str, str, Optional[bytes], Optional[str]]
+
+
+def dump_blobs(
+    serde: SerializerProtocol,
+    thread_id: str,
+    checkpoint_ns: str,
+    values: Dict[str, Any],
+    versions: ChannelVersions,
+    bases: Optional[Dict[str, Tuple[str, int, int]]] = None,
+) -> list[BlobRow]:
+    """Return the `checkpoint_blobs` rows for the given channel versions.
+
+    Channels without a value at that version are stored with the "empty" type.
+    Channels in `bases` are stored as the items appended to the list saved at
+    the given `(version, length, depth)`, which they reference as their base
+    version.
+    """
+    rows: list[BlobRow] = []
+    for channel, version in versions.items():
+        if channel not in values:
+            row = ("empty", None, None)
+        elif bases and channel in bases:
+            base_version, base_length, _ = bases[channel]
+            row = (*serde.dumps_typed(values[channel][base_length:]), base_version)
+        else:
+            row = (*serde.dumps_typed(values[channel]), None)
+        rows.append((thread_id, checkpoint_ns, channel, str(version), *row))
+    return rows
+
+
+# the (version, type, blob, base_version) rows of the chain of base versions
+# of a list, from the given version and base version to the first full value
+SELECT_LIST_CHAIN_SQL = """
+WITH RECURSIVE chain(version, type, blob, base_version) AS (
+    SELECT ?4, NULL, NULL, ?5
+    UNION ALL
+    SELECT b.version, b.type, b.blob, b.base_version
+    FROM checkpoint_blobs b JOIN chain ON b.version = chain.base_version
+    WHERE b.thread_id = ?1 AND b.checkpoint_ns = ?2 AND b.channel = ?3
+)
+SELECT version, type, blob, base_version FROM chain WHERE type IS NOT NULL
+"""
+
+
+def load_list(
+    serde: SerializerProtocol,
+    rows: Iterable[Any],
+    version: str,
+) -> list:
+    """Rebuild the list saved at `version` from the `(version, type, blob,
+    base_version)` rows of its chain of base versions."""
+    chain = {v: (type, blob, base) for v, type, blob, base in rows}
+    parts = []
+    next_version: Optional[str] = version
+    while next_version is not None:
+        type, blob, next_version = chain[next_version]
+        parts.append(serde.loads_typed((type, blob)))
+    return [item for part in reversed(parts) for item in part]
+
+
+def referenced_blobs(
+    versions: Iterable[Tuple[str, str]],
+    bases: Dict[Tuple[str, str], Optional[str]],
+) -> Set[Tuple[str, str]]:
+    """Return the `(channel, version)` blobs needed to load the given channel
+    versions, ie. those and their base versions, given the base version of
+    each stored blob."""
+    referenced: Set[Tuple[str, str]] = set()
+    for channel, version in versions:
+        key: Optional[Tuple[str, str]] = (channel, version)
+        while key is not None and key not in referenced:
+            referenced.add(key)
+            base = bases.get(key)
+            key = (channel, base) if base is not None else None
+    return referenced
+
+
+def _digest(serde: SerializerProtocol, value: Any) -> bytes:
+    type_, data = serde.dumps_typed(value)
+    return hashlib.blake2b(type_.encode() + b":" + data, digest_size=16).digest()
+
+
+class SavedLists:
+    """The last saved version of the list values of the channels of recent
+    threads, so that a new version extending it is saved as the appended items
+    only. Items are compared by the digests of their serialized bytes, as they
+    may have been modified in place since. To not serialize every item on every
+    save, a new version is taken to extend the saved one if it's at least as
+    long and the digest of the saved version's last item is unchanged, in which
+    case only the digests of the appended items are computed. Changes in place
+    to earlier items of a list are then not detected.
+
+    A list is saved in full again once its chain of base versions is
+    `max_depth` long, so that reads rebuild it from a bounded number of blobs.
+    """
+
+    def __init__(self, maxsize: int = 1024, max_depth: int = 32) -> None:
+        self.maxsize = maxsize
+        self.max_depth = max_depth
+        # (version, item digests, length of the chain of base versions)
+        self.lists: OrderedDict[Tuple[str, str, str], Tuple[str, list[bytes], int]] = (
+            OrderedDict()
+        )
+        self.lock = threading.Lock()
+
+    def digests(
+        self,
+        serde: SerializerProtocol,
+        thread_id: str,
+        checkpoint_ns: str,
+        values: Dict[str, Any],
+        versions: ChannelVersions,
+    ) -> Dict[str, list[bytes]]:
+        """Return the digests of the serialized items of the list values of the
+        given channel versions, including the views of append-only channels."""
+        digests: Dict[str, list[bytes]] = {}
+        for channel in versions:
+            value = values.get(channel)
+            if type(value) is not list and not is_log_view(value):
+                continue
+            with self.lock:
+                saved = self.lists.get((thread_id, checkpoint_ns, channel))
+            known = saved[1] if saved else []
+            if known and (
+                len(value) < len(known)
+                or _digest(serde, value[len(known) - 1]) != known[-1]
+            ):
+                known = []
+            digests[channel] = known + [
+                _digest(serde, item) for item in value[len(known) :]
+            ]
+        return digests
+
+    def bases(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        digests: Dict[str, list[bytes]],
+        versions: ChannelVersions,
+    ) -> Dict[str, Tuple[str, int, int]]:
+        """Return the `(version, length, depth)` of the saved lists extended by
+        the new versions of channels, given the digests of their items."""
+        bases: Dict[str, Tuple[str, int, int]] = {}
+        with self.lock:
+            for channel, version in versions.items():
+                if (items := digests.get(channel)) is None or not (
+                    saved := self.lists.get((thread_id, checkpoint_ns, channel))
+                ):
+                    continue
+                base_version, base_items, depth = saved
+                if (
+                    base_version != str(version)
+                    and depth < self.max_depth
+                    and len(base_items) <= len(items)
+                    and items[: len(base_items)] == base_items
+                ):
+                    bases[channel] = (base_version, len(base_items), depth)
+        return bases
+
+    def update(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        digests: Dict[str, list[bytes]],
+        versions: ChannelVersions,
+        bases: Dict[str, Tuple[str, int, int]],
+    ) -> None:
+        """Remember the new versions of channels, once saved."""
+        with self.lock:
+            for channel, version in versions.items():
+                key = (thread_id, checkpoint_ns, channel)
+                if (items := digests.get(channel)) is not None:
+                    depth = bases[channel][2] + 1 if channel in bases else 0
+                    self.lists[key] = (str(version), items, depth)
+                    self.lists.move_to_end(key)
+                else:
+                    self.lists.pop(key, None)
+            while len(self.lists) > self.maxsize:
+                self.lists.popitem(last=False)
+
+    def forget(self, thread_id: str) -> None:
+        """Forget the lists of a thread, eg. once its blobs may be deleted."""
+        with self.lock:
+            for key in [key for key in self.lists if key[0] == thread_id]:
+                del self.lists[key]
+
+
+def migrate_inline_values(
+    serde: SerializerProtocol,
+    rows: Iterable[Any],
+) -> Tuple[list[BlobRow], list[Tuple[Any, ...]]]:
+    """Move the values of versioned channels of checkpoints saved before the
+    `checkpoint_blobs` table existed out of the checkpoints.
+
+    Takes `(rowid, thread_id, checkpoint_ns, type, checkpoint)` rows of the
+    `checkpoints` table, and returns the `checkpoint_blobs` rows to insert
+    unless already present, and the `(type, checkpoint, rowid)` updates of the
+    checkpoints that had inline values.
+    """
+    blobs: list[BlobRow] = []
+    updates: list[Tuple[Any, ...]] = []
+    for rowid, thread_id, checkpoint_ns, type, checkpoint in rows:
+        loaded: Checkpoint = serde.loads_typed((type, checkpoint))
+        versions = loaded["channel_versions"]
+        if not any(k in versions for k in loaded["channel_values"]):
+            continue
+        blobs.extend(
+            dump_blobs(
+                serde, thread_id, checkpoint_ns, loaded["channel_values"], versions
+            )
+        )
+        updates.append((*serde.dumps_typed(dump_checkpoint(loaded)), rowid))
+    return blobs, updates
+
+
+def blobs_where(
+    thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+) -> Tuple[str, Sequence[Any]]:
+    """Return WHERE clause predicates to select the `checkpoint_blobs` rows
+    of the given channel versions, and the values for its parameters.
+    """
+    param_values: list[Any] = [thread_id, checkpoint_ns]
+    for channel, version in versions.items():
+        param_values.extend((channel, str(version)))
+    return (
+        "WHERE thread_id = ? AND checkpoint_ns = ? AND (channel, version) IN (VALUES "
+        + ", ".join("(?, ?)" for _ in versions)
+        + ")",
+        param_values,
+    )
+
+
+def dump_writes(
+    serde: SerializerProtocol,
+    config: RunnableConfig,
+    task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+) -> Tuple[list[Tuple[Any, ...]], list[Tuple[Any, ...]]]:
+    """Return the `writes` rows for the writes of the given tasks, as a pair of
+    rows to replace (tasks writing only to special channels, eg. errors) and
+    rows to insert unless already present.
+    """
+    thread_id = str(config["configurable"]["thread_id"])
+    checkpoint_ns = str(config["configurable"]["checkpoint_ns"])
+    checkpoint_id = str(config["configurable"]["checkpoint_id"])
+    replace: list[Tuple[Any, ...]] = []
+    insert: list[Tuple[Any, ...]] = []
+    for task_id, writes in task_writes:
+        rows = replace if all(w[0] in WRITES_IDX_MAP for w in writes) else insert
+        rows.extend(
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *serde.dumps_typed(value),
+            )
+            for idx, (channel, value) in enumerate(writes)
+        )
+    return replace, insert
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import Any
 
 import pytest
@@ -98,3 +99,92 @@ class TestAsyncSqliteSaver:
             } == {"", "inner"}
 
             # TODO: test before and limit params
+
+    async def test_aprune(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+            }
+            chkpnt: Checkpoint = empty_checkpoint()
+            configs = []
+            for step in range(3):
+                chkpnt = {
+                    **create_checkpoint(chkpnt, None, step),
+                    "channel_values": {"a": step},
+                    "channel_versions": {"a": str(step + 1)},
+                }
+                config = await saver.aput(config, chkpnt, {}, {"a": str(step + 1)})
+                await saver.aput_writes(config, [("a", step)], "t")
+                configs.append(config)
+            other = await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+            assert await saver.aprune(["thread-3"], keep_last=1) == 2
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-3"}}
+            assert [c.config async for c in saver.alist(thread)] == configs[2:]
+            async with saver.conn.execute(
+                "SELECT channel, version FROM checkpoint_blobs WHERE thread_id = 'thread-3'"
+            ) as cur:
+                assert await cur.fetchall() == [("a", "3")]
+            async with saver.conn.execute(
+                "SELECT checkpoint_id FROM writes WHERE thread_id = 'thread-3'"
+            ) as cur:
+                assert await cur.fetchall() == [
+                    (configs[2]["configurable"]["checkpoint_id"],)
+                ]
+
+            assert await saver.aprune(max_age=timedelta(0)) == 2
+            assert [c async for c in saver.alist(None)] == []
+            assert await saver.aget_tuple(other) is None
+
+    async def test_migrate_inline_values(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            # a database whose checkpoints keep their values inline, with the
+            # checkpoint_blobs table of earlier versions, without base versions
+            await saver.conn.execute(
+                "CREATE TABLE checkpoints (thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL DEFAULT '', checkpoint_id TEXT NOT NULL, parent_checkpoint_id TEXT, type TEXT, checkpoint BLOB, metadata BLOB, PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))"
+            )
+            await saver.conn.execute(
+                "CREATE TABLE checkpoint_blobs (thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL DEFAULT '', channel TEXT NOT NULL, version TEXT NOT NULL, type TEXT NOT NULL, blob BLOB, PRIMARY KEY (thread_id, checkpoint_ns, channel, version))"
+            )
+            chkpnt: Checkpoint = {
+                **empty_checkpoint(),
+                "channel_values": {"a": "1", "b": [1]},
+                "channel_versions": {"a": "1", "b": "1"},
+            }
+            await saver.conn.execute(
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    "thread-1",
+                    "",
+                    chkpnt["id"],
+                    *saver.serde.dumps_typed(chkpnt),
+                    saver.jsonplus_serde.dumps({}),
+                ),
+            )
+            await saver.conn.commit()
+
+            config: RunnableConfig = {"configurable": {"thread_id": "thread-1"}}
+            saved = await saver.aget_tuple(config)
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {"a": "1", "b": [1]}
+            async with saver.conn.execute(
+                "SELECT channel, version, base_version FROM checkpoint_blobs ORDER BY channel"
+            ) as cur:
+                assert await cur.fetchall() == [("a", "1", None), ("b", "1", None)]
+            async with saver.conn.execute(
+                "SELECT type, checkpoint FROM checkpoints"
+            ) as cur:
+                [(type, checkpoint)] = await cur.fetchall()
+            assert saver.serde.loads_typed((type, checkpoint))["channel_values"] == {}
+
+    async def test_adelete_thread(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            config = await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            await saver.aput(self.config_3, self.chkpnt_3, self.metadata_3, {})
+
+            await saver.adelete_thread("thread-2")
+
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-2"}}
+            assert [c async for c in saver.alist(thread)] == []
+            assert await saver.aget_tuple(config) is not None
@@ -1,3 +1,10 @@
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import timedelta
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -9,8 +16,15 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.serde.types import TASKS
 from langgraph.checkpoint.sqlite import SqliteSaver
-from langgraph.checkpoint.sqlite.utils import _metadata_predicate, search_where
+from langgraph.checkpoint.sqlite.pool import ConnectionPool
+from langgraph.checkpoint.sqlite.utils import (
+    SavedLists,
+    _metadata_predicate,
+    search_where,
+)
 
 
 class TestSqliteSaver:
@@ -101,6 +115,431 @@ class TestSqliteSaver:
 
             # TODO: test before and limit params
 
+    def test_delta_checkpoints(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+            }
+            chkpnt_1: Checkpoint = {
+                **empty_checkpoint(),
+                "channel_values": {"a": "1", "b": [1]},
+                "channel_versions": {"a": "1", "b": "1"},
+            }
+            config_1 = saver.put(config, chkpnt_1, {}, {"a": "1", "b": "1"})
+            chkpnt_2: Checkpoint = {
+                **create_checkpoint(chkpnt_1, None, 1),
+                "channel_values": {"a": "1", "b": [1, 2]},
+                "channel_versions": {"a": "1", "b": "2"},
+            }
+            config_2 = saver.put(config_1, chkpnt_2, {}, {"b": "2"})
+
+            # unchanged channel "a" is stored once
+            assert saver.conn.execute(
+                "SELECT channel, version FROM checkpoint_blobs ORDER BY channel, version"
+            ).fetchall() == [("a", "1"), ("b", "1"), ("b", "2")]
+            # full values are rebuilt on read
+            saved_1 = saver.get_tuple(config_1)
+            assert saved_1 is not None
+            assert saved_1.checkpoint["channel_values"] == {"a": "1", "b": [1]}
+            saved_2 = saver.get_tuple(config_2)
+            assert saved_2 is not None
+            assert saved_2.checkpoint["channel_values"] == {"a": "1", "b": [1, 2]}
+            assert [c.checkpoint["channel_values"] for c in saver.list(config)] == [
+                {"a": "1", "b": [1, 2]},
+                {"a": "1", "b": [1]},
+            ]
+
+            # checkpoints stored with inline values are still readable
+            legacy: Checkpoint = {
+                **create_checkpoint(chkpnt_2, None, 2),
+                "channel_values": {"a": "1", "b": [1, 2, 3]},
+                "channel_versions": {"a": "1", "b": "3"},
+            }
+            saver.conn.execute(
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    "thread-3",
+                    "",
+                    legacy["id"],
+                    config_2["configurable"]["checkpoint_id"],
+                    *saver.serde.dumps_typed(legacy),
+                    saver.jsonplus_serde.dumps({}),
+                ),
+            )
+            saved_3 = saver.get_tuple(config)
+            assert saved_3 is not None
+            assert saved_3.checkpoint["channel_values"] == {"a": "1", "b": [1, 2, 3]}
+
+    def test_list_deltas(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-4", "checkpoint_ns": ""}
+            }
+            items = [1]
+            chkpnt: Checkpoint = {
+                **empty_checkpoint(),
+                "channel_values": {"items": items},
+                "channel_versions": {"items": "1"},
+            }
+            configs = [saver.put(config, chkpnt, {}, {"items": "1"})]
+            for version in ("2", "3"):
+                items = [*items, int(version)]
+                chkpnt = {
+                    **create_checkpoint(chkpnt, None, int(version)),
+                    "channel_values": {"items": items},
+                    "channel_versions": {"items": version},
+                }
+                configs.append(saver.put(configs[-1], chkpnt, {}, {"items": version}))
+
+            # lists extending the previous version store the new items only
+            assert saver.conn.execute(
+                "SELECT version, base_version FROM checkpoint_blobs ORDER BY version"
+            ).fetchall() == [("1", None), ("2", "1"), ("3", "2")]
+            assert [c.checkpoint["channel_values"] for c in saver.list(config)] == [
+                {"items": [1, 2, 3]},
+                {"items": [1, 2]},
+                {"items": [1]},
+            ]
+
+            # base versions of remaining checkpoints aren't pruned
+            assert saver.prune(keep_last=1) == 2
+            assert saver.conn.execute(
+                "SELECT version FROM checkpoint_blobs ORDER BY version"
+            ).fetchall() == [("1",), ("2",), ("3",)]
+            saved = saver.get_tuple(config)
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {"items": [1, 2, 3]}
+
+            # a list is stored in full if it doesn't extend the previous version,
+            # or if the previous version was deleted since
+            for version, value in (("4", [1, 4]), ("5", [1, 4, 5])):
+                saver.conn.execute("DELETE FROM checkpoint_blobs WHERE version = '4'")
+                chkpnt = {
+                    **create_checkpoint(chkpnt, None, int(version)),
+                    "channel_values": {"items": value},
+                    "channel_versions": {"items": version},
+                }
+                saved_config = saver.put(configs[-1], chkpnt, {}, {"items": version})
+                assert saver.conn.execute(
+                    "SELECT base_version FROM checkpoint_blobs WHERE version = ?",
+                    (version,),
+                ).fetchone() == (None,)
+                saved = saver.get_tuple(saved_config)
+                assert saved is not None
+                assert saved.checkpoint["channel_values"] == {"items": value}
+
+    def test_list_deltas_of_changed_items(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            saver.saved_lists.max_depth = 2
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-5", "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            items: list[dict[str, int]] = []
+            for version in range(1, 7):
+                if version == 3:
+                    # the last saved item is modified in place, the list still
+                    # holds the same objects
+                    items[-1]["n"] = 0
+                items = [*items, {"n": version}]
+                chkpnt = {
+                    **create_checkpoint(chkpnt, None, version),
+                    "channel_values": {"items": items},
+                    "channel_versions": {"items": str(version)},
+                }
+                config = saver.put(config, chkpnt, {}, {"items": str(version)})
+                saved = saver.get_tuple(config)
+                assert saved is not None
+                assert saved.checkpoint["channel_values"] == {"items": items}
+
+            # a list with a changed item is stored in full, and so is a list
+            # which would extend a chain of max_depth base versions
+            assert saver.conn.execute(
+                "SELECT version, base_version FROM checkpoint_blobs ORDER BY version"
+            ).fetchall() == [
+                ("1", None),
+                ("2", "1"),
+                ("3", None),
+                ("4", "3"),
+                ("5", "4"),
+                ("6", None),
+            ]
+
+    def test_list_digests_of_appended_items(self) -> None:
+        class CountingSerializer(JsonPlusSerializer):
+            calls = 0
+
+            def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+                self.calls += 1
+                return super().dumps_typed(obj)
+
+        serde = CountingSerializer()
+        saved = SavedLists()
+        versions = {"items": "1"}
+        digests = saved.digests(serde, "t", "", {"items": [1, 2, 3]}, versions)
+        assert serde.calls == 3
+        saved.update("t", "", digests, versions, {})
+
+        # only the last saved item and the appended ones are serialized
+        serde.calls = 0
+        versions = {"items": "2"}
+        values = {"items": [1, 2, 3, 4, 5]}
+        assert saved.digests(serde, "t", "", values, versions) == saved.digests(
+            JsonPlusSerializer(), "u", "", values, versions
+        )
+        assert serde.calls == 3
+        # lists not extending the saved version are serialized in full
+        serde.calls = 0
+        saved.digests(serde, "t", "", {"items": [1, 2, 4, 5]}, versions)
+        assert serde.calls == 5
+        serde.calls = 0
+        saved.digests(serde, "t", "", {"items": [1, 2]}, versions)
+        assert serde.calls == 2
+
+    def test_migrate_inline_values(self) -> None:
+        # a database written before channel values were stored in checkpoint_blobs
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.executescript(
+            """
+            CREATE TABLE checkpoints (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                checkpoint_id TEXT NOT NULL,
+                parent_checkpoint_id TEXT,
+                type TEXT,
+                checkpoint BLOB,
+                metadata BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+            );
+            """
+        )
+        chkpnt_1: Checkpoint = {
+            **empty_checkpoint(),
+            "channel_values": {"a": "1", "b": [1]},
+            "channel_versions": {"a": "1", "b": "1"},
+        }
+        chkpnt_2: Checkpoint = {
+            **create_checkpoint(chkpnt_1, None, 1),
+            "channel_values": {"a": "1", "b": [1, 2]},
+            "channel_versions": {"a": "1", "b": "2"},
+        }
+        saver = SqliteSaver(conn)
+        for chkpnt in (chkpnt_1, chkpnt_2):
+            conn.execute(
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    "thread-1",
+                    "",
+                    chkpnt["id"],
+                    *saver.serde.dumps_typed(chkpnt),
+                    saver.jsonplus_serde.dumps({}),
+                ),
+            )
+        conn.commit()
+
+        config: RunnableConfig = {"configurable": {"thread_id": "thread-1"}}
+        assert [c.checkpoint["channel_values"] for c in saver.list(config)] == [
+            {"a": "1", "b": [1, 2]},
+            {"a": "1", "b": [1]},
+        ]
+        # values were moved to checkpoint_blobs, once per version
+        assert conn.execute(
+            "SELECT channel, version FROM checkpoint_blobs ORDER BY channel, version"
+        ).fetchall() == [("a", "1"), ("b", "1"), ("b", "2")]
+        for type, checkpoint in conn.execute(
+            "SELECT type, checkpoint FROM checkpoints"
+        ):
+            assert saver.serde.loads_typed((type, checkpoint))["channel_values"] == {}
+        assert conn.execute("PRAGMA user_version").fetchone() == (1,)
+        conn.close()
+
+    def test_put_writes_batch(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config = saver.put(self.config_2, self.chkpnt_2, {}, {})
+            saver.put_writes_batch(
+                config,
+                [("task-1", [("a", 1), ("b", 2)]), ("task-2", [("__error__", "boom")])],
+            )
+            # writes are not overwritten, errors are
+            saver.put_writes_batch(
+                config,
+                [("task-1", [("a", 3)]), ("task-2", [("__error__", "boom again")])],
+            )
+
+            saved = saver.get_tuple(config)
+            assert saved is not None
+            assert sorted(saved.pending_writes or []) == [
+                ("task-1", "a", 1),
+                ("task-1", "b", 2),
+                ("task-2", "__error__", "boom again"),
+            ]
+
+    def test_prune(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+            }
+            chkpnt: Checkpoint = empty_checkpoint()
+            configs = []
+            for step in range(4):
+                chkpnt = {
+                    **create_checkpoint(chkpnt, None, step),
+                    "channel_values": {"a": "1", "b": step},
+                    "channel_versions": {"a": "1", "b": str(step + 1)},
+                }
+                config = saver.put(
+                    config,
+                    chkpnt,
+                    {},
+                    {"a": "1", "b": "1"} if step == 0 else {"b": str(step + 1)},
+                )
+                saver.put_writes(config, [("b", step), (TASKS, step)], "t")
+                configs.append(config)
+            other = saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+            with pytest.raises(ValueError):
+                saver.prune()
+            assert saver.prune(["thread-3"], keep_last=2) == 2
+
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-3"}}
+            assert [c.config for c in saver.list(thread)] == configs[:1:-1]
+            # only the pending sends of the parent of the oldest checkpoint are kept
+            assert saver.conn.execute(
+                "SELECT checkpoint_id, channel FROM writes WHERE thread_id = 'thread-3' ORDER BY checkpoint_id, channel"
+            ).fetchall() == [
+                (configs[1]["configurable"]["checkpoint_id"], TASKS),
+                (configs[2]["configurable"]["checkpoint_id"], TASKS),
+                (configs[2]["configurable"]["checkpoint_id"], "b"),
+                (configs[3]["configurable"]["checkpoint_id"], TASKS),
+                (configs[3]["configurable"]["checkpoint_id"], "b"),
+            ]
+            saved = saver.get_tuple(configs[2])
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {"a": "1", "b": 2}
+            # blobs of versions no longer referenced are deleted
+            assert saver.conn.execute(
+                "SELECT channel, version FROM checkpoint_blobs WHERE thread_id = 'thread-3' ORDER BY channel, version"
+            ).fetchall() == [("a", "1"), ("b", "3"), ("b", "4")]
+            # other threads are untouched
+            assert saver.get_tuple(other) is not None
+
+            assert saver.prune(keep_last=2) == 0
+            assert saver.prune(max_age=timedelta(0)) == 3
+            assert list(saver.list(None)) == []
+            for table in ("checkpoints", "writes", "checkpoint_blobs"):
+                assert saver.conn.execute(f"SELECT * FROM {table}").fetchall() == []
+
+    def test_delete_thread(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            saver.put_writes(self.config_2, [("foo", "bar")], "t")
+
+            saver.delete_thread("thread-2")
+
+            thread: RunnableConfig = {"configurable": {"thread_id": "thread-2"}}
+            assert list(saver.list(thread)) == []
+            assert saver.conn.execute("SELECT * FROM writes").fetchall() == []
+            assert saver.get_tuple(config) is not None
+
+    def test_connection_pool(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            ConnectionPool(":memory:")
+
+        path = str(tmp_path / "checkpoints.sqlite")
+        with SqliteSaver.from_conn_string(path, readers=2) as saver:
+
+            def run_thread(n: int) -> list[RunnableConfig]:
+                config: RunnableConfig = {
+                    "configurable": {"thread_id": f"thread-{n}", "checkpoint_ns": ""}
+                }
+                chkpnt: Checkpoint = empty_checkpoint()
+                configs = []
+                for step in range(20):
+                    chkpnt = {
+                        **create_checkpoint(chkpnt, None, step),
+                        "channel_values": {"items": list(range(step + 1))},
+                        "channel_versions": {"items": str(step + 1)},
+                    }
+                    config = saver.put(config, chkpnt, {}, {"items": str(step + 1)})
+                    saver.put_writes(config, [("items", step)], "t")
+                    # writes are committed, and visible to readers, once saved
+                    saved = saver.get_tuple(config)
+                    assert saved is not None
+                    assert saved.pending_writes == [("t", "items", step)]
+                    configs.append(config)
+                return configs
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                threads = list(executor.map(run_thread, range(8)))
+
+            for n, configs in enumerate(threads):
+                thread: RunnableConfig = {"configurable": {"thread_id": f"thread-{n}"}}
+                saved = list(saver.list(thread))
+                assert [c.config for c in saved] == configs[::-1]
+                assert saved[0].checkpoint["channel_values"] == {
+                    "items": list(range(20))
+                }
+            assert saver.prune(keep_last=1) == 8 * 19
+            saver.delete_thread("thread-0")
+            assert list(saver.list({"configurable": {"thread_id": "thread-0"}})) == []
+
+    def test_connection_pool_failed_write(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "checkpoints.sqlite")
+        with ConnectionPool(path, commit_interval=0.05) as pool:
+            pool.write(lambda cur: cur.execute("CREATE TABLE t (v INTEGER UNIQUE)"))
+
+            def insert(v: int) -> None:
+                pool.write(lambda cur: cur.execute("INSERT INTO t VALUES (?)", (v,)))
+
+            # writes queued together are committed in one transaction, the failed
+            # one is rolled back alone
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(insert, v) for v in (1, 2, 2, 3)]
+            errors = [f.exception() for f in futures]
+            assert errors.count(None) == 3
+            assert any(isinstance(e, sqlite3.IntegrityError) for e in errors)
+            with pool.reader() as conn:
+                assert conn.execute("SELECT v FROM t ORDER BY v").fetchall() == [
+                    (1,),
+                    (2,),
+                    (3,),
+                ]
+        with pytest.raises(RuntimeError):
+            pool.write(lambda cur: None)
+
+    def test_connection_pool_close_while_writing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        closers: list[threading.Thread] = []
+
+        class ClosingQueue(queue.SimpleQueue):
+            def put(self, item: Any, *args: Any) -> None:
+                if item is not None and not closers:
+                    # close the pool from another thread while a write is queued
+                    closers.append(threading.Thread(target=pool.close))
+                    closers[0].start()
+                    closers[0].join(0.1)
+                super().put(item, *args)
+
+        monkeypatch.setattr(queue, "SimpleQueue", ClosingQueue)
+        pool = ConnectionPool(str(tmp_path / "checkpoints.sqlite"))
+        done = threading.Event()
+
+        def create() -> None:
+            pool.write(lambda cur: cur.execute("CREATE TABLE t (v INTEGER)"))
+            done.set()
+
+        threading.Thread(target=create, daemon=True).start()
+        # the write is applied before the pool closes
+        assert done.wait(5)
+        closers[0].join()
+        with closing(sqlite3.connect(tmp_path / "checkpoints.sqlite")) as conn:
+            assert conn.execute("SELECT count(*) FROM t").fetchone() == (0,)
+        with pytest.raises(RuntimeError):
+            pool.write(lambda cur: None)
+
     def test_search_where(self) -> None:
         # call method / assertions
         expected_predicate_1 = "WHERE json_extract(CAST(metadata AS TEXT), '$.source') = ? AND json_extract(CAST(metadata AS TEXT), '$.step') = ? AND json_extract(CAST(metadata AS TEXT), '$.writes') = ? AND json_extract(CAST(metadata AS TEXT), '$.score') = ? AND checkpoint_id < ?"
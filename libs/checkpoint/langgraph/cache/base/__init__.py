@@ -0,0 +1,115 @@
+import pickle
+from abc import ABC, abstractmethod
+from typing import Any, Generic, Mapping, Optional, Sequence, TypeVar
+
+from langgraph.checkpoint.serde.base import SerializerProtocol, maybe_add_typed_methods
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+ValueT = TypeVar("ValueT")
+Namespace = tuple[str, ...]
+FullKey = tuple[Namespace, str]
+
+
+class PickleSerializer(SerializerProtocol):
+    """Serializer keeping the exact types of values, eg. tuples, so that a cache
+    hit returns the same writes as the run that stored them. Loading a value
+    can run arbitrary code, so only use it for caches written by trusted
+    processes.
+
+    Values stored with another type are loaded with `JsonPlusSerializer`.
+    """
+
+    def __init__(self) -> None:
+        self.fallback = JsonPlusSerializer()
+
+    def dumps(self, obj: Any) -> bytes:
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        return "pickle", self.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        if data[0] == "pickle":
+            return self.loads(data[1])
+        return self.fallback.loads_typed(data)
+
+
+class BaseCache(ABC, Generic[ValueT]):
+    """Base class for a cache of node results.
+
+    Entries are addressed by a namespace and a key, and may expire after a
+    time-to-live (in seconds) given when they are set.
+
+    Attributes:
+        serde (SerializerProtocol): Serializer for encoding/decoding cached values.
+            Defaults to `JsonPlusSerializer`, as used by checkpointers. Pass
+            `PickleSerializer()` to keep the exact types of cached values.
+    """
+
+    serde: SerializerProtocol = JsonPlusSerializer()
+
+    def __init__(self, *, serde: Optional[SerializerProtocol] = None) -> None:
+        self.serde = maybe_add_typed_methods(serde or self.serde)
+
+    @abstractmethod
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Get the cached values for the given keys.
+
+        Args:
+            keys: A sequence of (namespace, key) pairs to look up.
+
+        Returns:
+            A mapping of the keys found in the cache to their values. Missing
+            and expired keys are omitted.
+        """
+
+    @abstractmethod
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Asynchronously get the cached values for the given keys.
+
+        Args:
+            keys: A sequence of (namespace, key) pairs to look up.
+
+        Returns:
+            A mapping of the keys found in the cache to their values. Missing
+            and expired keys are omitted.
+        """
+
+    @abstractmethod
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Set the cached values for the given keys.
+
+        Args:
+            pairs: A mapping of (namespace, key) pairs to a tuple of the value
+                and its time-to-live in seconds, or None to never expire.
+        """
+
+    @abstractmethod
+    async def aset(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Asynchronously set the cached values for the given keys.
+
+        Args:
+            pairs: A mapping of (namespace, key) pairs to a tuple of the value
+                and its time-to-live in seconds, or None to never expire.
+        """
+
+    @abstractmethod
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Delete the cached values for the given namespaces, including any
+        namespaces nested under them.
+
+        Args:
+            namespaces: The namespaces to clear. If None, clears the whole cache.
+        """
+
+    @abstractmethod
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Asynchronously delete the cached values for the given namespaces,
+        including any namespaces nested under them.
+
+        Args:
+            namespaces: The namespaces to clear. If None, clears the whole cache.
+        """
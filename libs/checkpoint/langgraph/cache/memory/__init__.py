@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Mapping, Optional, Sequence
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace, ValueT
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+
+class InMemoryCache(BaseCache[ValueT]):
+    """An in-process cache with least-recently-used eviction.
+
+    Values are stored serialized, so each hit returns a fresh copy that callers
+    are free to mutate.
+
+    Args:
+        maxsize: The maximum number of entries to keep. When the cache is full,
+            the least recently used entry is evicted. If None, the cache is unbounded.
+        serde: Serializer for encoding/decoding cached values.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: Optional[int] = 1024,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.maxsize = maxsize
+        self._data: OrderedDict[FullKey, tuple[tuple[str, bytes], Optional[float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        now = time.time()
+        found: dict[FullKey, tuple[str, bytes]] = {}
+        with self._lock:
+            for key in keys:
+                if (entry := self._data.get(key)) is None:
+                    continue
+                value, expires_at = entry
+                if expires_at is not None and expires_at <= now:
+                    del self._data[key]
+                    continue
+                self._data.move_to_end(key)
+                found[key] = value
+        return {key: self.serde.loads_typed(value) for key, value in found.items()}
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        return self.get(keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        now = time.time()
+        entries = {
+            key: (
+                self.serde.dumps_typed(value),
+                now + ttl if ttl is not None else None,
+            )
+            for key, (value, ttl) in pairs.items()
+        }
+        with self._lock:
+            for key, entry in entries.items():
+                self._data[key] = entry
+                self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        self.set(pairs)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        with self._lock:
+            if namespaces is None:
+                self._data.clear()
+            else:
+                for key in [
+                    k
+                    for k in self._data
+                    if any(k[0][: len(ns)] == ns for ns in namespaces)
+                ]:
+                    del self._data[key]
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        self.clear(namespaces)
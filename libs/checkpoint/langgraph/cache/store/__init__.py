@@ -0,0 +1,120 @@
+import base64
+import time
+from typing import Any, Mapping, Optional, Sequence, cast
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace, ValueT
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.store.base import BaseStore, GetOp, Item, PutOp, SearchOp
+
+CLEAR_PAGE_SIZE = 100
+
+
+class StoreCache(BaseCache[ValueT]):
+    """A cache backed by a `BaseStore`.
+
+    Lets several processes share cached node results through a common store,
+    eg. a `PostgresStore`. Entries are kept under the given root namespace.
+
+    Args:
+        store: The store to keep cached values in.
+        namespace: The root namespace for all cache entries.
+        serde: Serializer for encoding/decoding cached values.
+    """
+
+    def __init__(
+        self,
+        store: BaseStore,
+        *,
+        namespace: Namespace = ("langgraph_cache",),
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.store = store
+        self.namespace = namespace
+
+    def _namespace(self, ns: Namespace) -> Namespace:
+        # store namespace labels cannot contain periods
+        return (*self.namespace, *(label.replace(".", "_") for label in ns))
+
+    def _get_ops(self, keys: Sequence[FullKey]) -> list[GetOp]:
+        return [GetOp(self._namespace(ns), key) for ns, key in keys]
+
+    def _put_ops(
+        self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]
+    ) -> list[PutOp]:
+        now = time.time()
+        ops: list[PutOp] = []
+        for (ns, key), (value, ttl) in pairs.items():
+            type_, data = self.serde.dumps_typed(value)
+            ops.append(
+                PutOp(
+                    self._namespace(ns),
+                    key,
+                    {
+                        "type": type_,
+                        "data": base64.b64encode(data).decode(),
+                        "expires_at": now + ttl if ttl is not None else None,
+                    },
+                )
+            )
+        return ops
+
+    def _load(self, keys: Sequence[FullKey], items: list[Any]) -> dict[FullKey, ValueT]:
+        now = time.time()
+        values: dict[FullKey, ValueT] = {}
+        for key, item in zip(keys, items):
+            if not isinstance(item, Item):
+                continue
+            expires_at = item.value.get("expires_at")
+            if expires_at is not None and expires_at <= now:
+                continue
+            values[key] = self.serde.loads_typed(
+                (item.value["type"], base64.b64decode(item.value["data"]))
+            )
+        return values
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        if not keys:
+            return {}
+        return self._load(keys, self.store.batch(self._get_ops(keys)))
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        if not keys:
+            return {}
+        return self._load(keys, await self.store.abatch(self._get_ops(keys)))
+
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        if pairs:
+            self.store.batch(self._put_ops(pairs))
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        if pairs:
+            await self.store.abatch(self._put_ops(pairs))
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        for prefix in self._clear_prefixes(namespaces):
+            # deleted items drop out of the search, so always read the first page
+            while items := cast(
+                list[Item],
+                self.store.batch([SearchOp(prefix, limit=CLEAR_PAGE_SIZE)])[0],
+            ):
+                self.store.batch(
+                    [PutOp(item.namespace, item.key, None) for item in items]
+                )
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        for prefix in self._clear_prefixes(namespaces):
+            while items := cast(
+                list[Item],
+                (await self.store.abatch([SearchOp(prefix, limit=CLEAR_PAGE_SIZE)]))[0],
+            ):
+                await self.store.abatch(
+                    [PutOp(item.namespace, item.key, None) for item in items]
+                )
+
+    def _clear_prefixes(
+        self, namespaces: Optional[Sequence[Namespace]]
+    ) -> list[Namespace]:
+        if namespaces is None:
+            return [self.namespace]
+        return [self._namespace(ns) for ns in namespaces]
@@ -1,4 +1,5 @@
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from typing import (
     Any,
     AsyncIterator,
@@ -19,7 +20,7 @@ from typing import (
 
 from langchain_core.runnables import ConfigurableFieldSpec, RunnableConfig
 
-from langgraph.checkpoint.base.id import uuid6
+from langgraph.checkpoint.base.id import uuid6, uuid6_floor
 from langgraph.checkpoint.serde.base import SerializerProtocol, maybe_add_typed_methods
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import (
@@ -315,6 +316,24 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        The default implementation calls `put_writes` once per task. Override it
+        to store the writes of all tasks in a single round-trip.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        for task_id, writes in task_writes:
+            self.put_writes(config, writes, task_id)
+
     async def aget(self, config: RunnableConfig) -> Optional[Checkpoint]:
         """Asynchronously fetch a checkpoint using the given configuration.
 
@@ -407,6 +426,95 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Asynchronously store intermediate writes of several tasks linked to a checkpoint.
+
+        The default implementation calls `aput_writes` once per task. Override it
+        to store the writes of all tasks in a single round-trip.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        for task_id, writes in task_writes:
+            await self.aput_writes(config, writes, task_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+
+        Raises:
+            NotImplementedError: Implement this method in your custom checkpoint saver.
+        """
+        raise NotImplementedError
+
+    def prune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Delete old checkpoints, along with their writes and the channel values
+        no longer referenced by any remaining checkpoint.
+
+        A checkpoint is deleted if it isn't among the `keep_last` latest of its
+        thread and namespace, or if it was created more than `max_age` ago. The
+        writes storing the pending sends of a remaining checkpoint are kept.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+
+        Raises:
+            NotImplementedError: Implement this method in your custom checkpoint saver.
+        """
+        raise NotImplementedError
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Asynchronously delete all checkpoints and writes of a thread, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+
+        Raises:
+            NotImplementedError: Implement this method in your custom checkpoint saver.
+        """
+        raise NotImplementedError
+
+    async def aprune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Asynchronously delete old checkpoints, see `prune`.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+
+        Raises:
+            NotImplementedError: Implement this method in your custom checkpoint saver.
+        """
+        raise NotImplementedError
+
     def get_next_version(self, current: Optional[V], channel: ChannelProtocol) -> V:
         """Generate the next version ID for a channel.
 
@@ -442,6 +550,70 @@ def get_checkpoint_id(config: RunnableConfig) -> Optional[str]:
     )
 
 
+def get_prune_cutoff(
+    keep_last: Optional[int], max_age: Optional[timedelta]
+) -> Optional[str]:
+    """Validate the arguments of `prune`, and return the checkpoint ID below which
+    checkpoints are older than `max_age`, if given.
+
+    Checkpoint IDs are time-ordered UUIDs, so this lets savers select expired
+    checkpoints with a range over their primary key.
+    """
+    if keep_last is None and max_age is None:
+        raise ValueError("Either keep_last or max_age must be given")
+    if keep_last is not None and keep_last < 0:
+        raise ValueError("keep_last must not be negative")
+    if max_age is None:
+        return None
+    age_ns = max_age // timedelta(microseconds=1) * 1000
+    return str(uuid6_floor(time.time_ns() - age_ns))
+
+
+def select_pruned_checkpoints(
+    checkpoints: Sequence[Tuple[str, Optional[str]]],
+    keep_last: Optional[int],
+    cutoff: Optional[str],
+) -> Tuple[List[str], List[str], List[str]]:
+    """Select the checkpoints of a thread and namespace to delete with `prune`.
+
+    Args:
+        checkpoints (Sequence[Tuple[str, Optional[str]]]): Pairs of checkpoint ID and
+            parent checkpoint ID, newest first.
+        keep_last (Optional[int]): Number of latest checkpoints to keep.
+        cutoff (Optional[str]): Checkpoint ID below which checkpoints are deleted,
+            see `get_prune_cutoff`.
+
+    Returns:
+        Tuple[List[str], List[str], List[str]]: The IDs of the checkpoints to delete,
+            of the checkpoints whose writes to delete, and of the checkpoints whose
+            writes to delete except pending sends, read by a remaining child.
+    """
+    pruned: List[str] = []
+    parents: List[Optional[str]] = []
+    remaining: set[str] = set()
+    remaining_parents: set[Optional[str]] = set()
+    for i, (checkpoint_id, parent_checkpoint_id) in enumerate(checkpoints):
+        if (keep_last is not None and i >= keep_last) or (
+            cutoff is not None and checkpoint_id < cutoff
+        ):
+            pruned.append(checkpoint_id)
+            parents.append(parent_checkpoint_id)
+        else:
+            remaining.add(checkpoint_id)
+            remaining_parents.add(parent_checkpoint_id)
+    delete_writes: List[str] = []
+    keep_sends: List[str] = []
+    # parents deleted by an earlier prune kept their pending sends until now
+    for checkpoint_id in dict.fromkeys((*pruned, *parents)):
+        if checkpoint_id is None or checkpoint_id in remaining:
+            continue
+        elif checkpoint_id in remaining_parents:
+            keep_sends.append(checkpoint_id)
+        else:
+            delete_writes.append(checkpoint_id)
+    return pruned, delete_writes, keep_sends
+
+
 """
 Mapping from error type to error index.
 Regular writes just map to their index in the list of writes being saved.
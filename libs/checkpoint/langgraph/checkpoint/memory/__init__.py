@@ -1,10 +1,25 @@
 import asyncio
+import copy
 import random
-from collections import defaultdict
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from datetime import timedelta
 from functools import partial
 from types import TracebackType
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from langchain_core.runnables import RunnableConfig
 
@@ -17,9 +32,65 @@ from langgraph.checkpoint.base import (
     CheckpointTuple,
     SerializerProtocol,
     get_checkpoint_id,
+    get_prune_cutoff,
+    select_pruned_checkpoints,
 )
 from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
 
+# serialized checkpoint, serialized metadata, parent checkpoint ID
+SavedCheckpoint = tuple[tuple[str, Any], tuple[str, Any], Optional[str]]
+
+
+class _Checkpoints(MutableMapping[str, SavedCheckpoint]):
+    """The checkpoints of a thread and namespace by ID, along with their IDs in
+    sorted order, to look up the latest in O(1) and seek before an ID in
+    O(log n). IDs are time-ordered, so new checkpoints are usually appended."""
+
+    __slots__ = ("data", "ids")
+
+    def __init__(self) -> None:
+        self.data: dict[str, SavedCheckpoint] = {}
+        self.ids: list[str] = []
+
+    def __getitem__(self, checkpoint_id: str) -> SavedCheckpoint:
+        return self.data[checkpoint_id]
+
+    def __setitem__(self, checkpoint_id: str, saved: SavedCheckpoint) -> None:
+        if checkpoint_id not in self.data:
+            if not self.ids or checkpoint_id > self.ids[-1]:
+                self.ids.append(checkpoint_id)
+            else:
+                insort(self.ids, checkpoint_id)
+        self.data[checkpoint_id] = saved
+
+    def __delitem__(self, checkpoint_id: str) -> None:
+        del self.data[checkpoint_id]
+        del self.ids[bisect_left(self.ids, checkpoint_id)]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def remove(self, checkpoint_ids: Iterable[str]) -> None:
+        """Delete several checkpoints, in a single pass over the sorted IDs."""
+        for checkpoint_id in checkpoint_ids:
+            self.data.pop(checkpoint_id, None)
+        self.ids = [id for id in self.ids if id in self.data]
+
+    def latest(self) -> Optional[str]:
+        return self.ids[-1] if self.ids else None
+
+    def before(self, checkpoint_id: Optional[str] = None) -> Iterator[str]:
+        """Yield the IDs lower than the given one, or all IDs, newest first."""
+        ids = self.ids
+        # iterating by index is unaffected by checkpoints appended meanwhile
+        idx = len(ids) if checkpoint_id is None else bisect_left(ids, checkpoint_id)
+        for i in range(idx - 1, -1, -1):
+            if i < len(ids):
+                yield ids[i]
+
 
 class MemorySaver(
     BaseCheckpointSaver[str], AbstractContextManager, AbstractAsyncContextManager
@@ -34,6 +105,12 @@ class MemorySaver(
 
     Args:
         serde (Optional[SerializerProtocol]): The serializer to use for serializing and deserializing checkpoints. Defaults to None.
+        serialize (bool): Whether to store checkpoints, metadata and writes serialized.
+            If False, deep copies are stored and loaded instead, skipping the cost of
+            serialization. Defaults to True.
+        max_bytes (Optional[int]): If given, the least recently used threads are deleted
+            while the serialized size of all threads exceeds it, except the thread
+            being saved. Requires `serialize`. Defaults to None.
 
     Examples:
 
@@ -54,24 +131,39 @@ class MemorySaver(
     """
 
     # thread ID ->  checkpoint NS -> checkpoint ID -> checkpoint mapping
-    storage: defaultdict[
-        str,
-        dict[
-            str, dict[str, tuple[tuple[str, bytes], tuple[str, bytes], Optional[str]]]
-        ],
-    ]
+    storage: defaultdict[str, dict[str, _Checkpoints]]
     writes: defaultdict[
-        tuple[str, str, str], dict[tuple[str, int], tuple[str, str, tuple[str, bytes]]]
+        tuple[str, str, str], dict[tuple[str, int], tuple[str, str, tuple[str, Any]]]
     ]
+    # (thread ID, checkpoint NS, channel, version) -> serialized channel value
+    blobs: dict[tuple[str, str, str, Union[str, int, float]], tuple[str, Any]]
+    # thread ID -> keys of its writes and blobs, to find them without a full scan
+    thread_writes: defaultdict[str, set[tuple[str, str, str]]]
+    thread_blobs: defaultdict[str, set[tuple[str, str, str, Union[str, int, float]]]]
+    # thread ID -> serialized size, least recently used first, if bounded
+    sizes: OrderedDict[str, int]
 
     def __init__(
         self,
         *,
         serde: Optional[SerializerProtocol] = None,
+        serialize: bool = True,
+        max_bytes: Optional[int] = None,
     ) -> None:
+        if max_bytes is not None and not serialize:
+            raise ValueError("max_bytes requires serialize=True")
         super().__init__(serde=serde)
-        self.storage = defaultdict(lambda: defaultdict(dict))
+        self.serialize = serialize
+        self.max_bytes = max_bytes
+        self.storage = defaultdict(lambda: defaultdict(_Checkpoints))
         self.writes = defaultdict(dict)
+        self.blobs = {}
+        self.thread_writes = defaultdict(set)
+        self.thread_blobs = defaultdict(set)
+        self.sizes = OrderedDict()
+        self.total_bytes = 0
+        # held while updating the storage, not while serializing
+        self.lock = threading.Lock()
 
     def __enter__(self) -> "MemorySaver":
         return self
@@ -95,6 +187,90 @@ class MemorySaver(
     ) -> Optional[bool]:
         return
 
+    def _dump(self, value: Any) -> tuple[str, Any]:
+        # copied, as callers keep updating values they saved, eg. channels
+        # checkpoint the sets and lists holding their state
+        if self.serialize:
+            return self.serde.dumps_typed(value)
+        return ("object", copy.deepcopy(value))
+
+    def _load(self, saved: tuple[str, Any]) -> Any:
+        if self.serialize:
+            return self.serde.loads_typed(saved)
+        return copy.deepcopy(saved[1])
+
+    def _checkpoints(
+        self, thread_id: str, checkpoint_ns: str
+    ) -> Optional[_Checkpoints]:
+        # read without inserting, so that reads don't grow the storage
+        return self.storage.get(thread_id, {}).get(checkpoint_ns)
+
+    def _writes(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> Iterable[tuple[str, str, tuple[str, Any]]]:
+        return self.writes.get((thread_id, checkpoint_ns, checkpoint_id), {}).values()
+
+    def _load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        saved: tuple[str, Any],
+        sends: Sequence[tuple[str, Any]],
+    ) -> Checkpoint:
+        checkpoint: Checkpoint = self._load(saved)
+        # rebuild the channel values from the blobs of their current versions
+        channel_values = checkpoint["channel_values"]
+        for channel, version in checkpoint["channel_versions"].items():
+            if blob := self.blobs.get((thread_id, checkpoint_ns, channel, version)):
+                if blob[0] != "empty":
+                    channel_values[channel] = self._load(blob)
+        return {
+            **checkpoint,
+            "pending_sends": [self._load(s) for s in sends],
+        }
+
+    def _checkpoint_tuple(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        saved: SavedCheckpoint,
+        metadata: Optional[CheckpointMetadata] = None,
+    ) -> CheckpointTuple:
+        checkpoint, metadata_b, parent_checkpoint_id = saved
+        writes = self._writes(thread_id, checkpoint_ns, checkpoint_id)
+        if parent_checkpoint_id:
+            sends = [
+                w[2]
+                for w in self._writes(thread_id, checkpoint_ns, parent_checkpoint_id)
+                if w[1] == TASKS
+            ]
+        else:
+            sends = []
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self._load_checkpoint(
+                thread_id, checkpoint_ns, checkpoint, sends
+            ),
+            metadata=self._load(metadata_b) if metadata is None else metadata,
+            parent_config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": parent_checkpoint_id,
+                }
+            }
+            if parent_checkpoint_id
+            else None,
+            pending_writes=[(id, c, self._load(v)) for id, c, v in writes],
+        )
+
     def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the in-memory storage.
 
@@ -111,81 +287,24 @@ class MemorySaver(
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        if (checkpoints := self._checkpoints(thread_id, checkpoint_ns)) is None:
+            return None
         if checkpoint_id := get_checkpoint_id(config):
-            if saved := self.storage[thread_id][checkpoint_ns].get(checkpoint_id):
-                checkpoint, metadata, parent_checkpoint_id = saved
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
-                if parent_checkpoint_id:
-                    sends = [
-                        w[2]
-                        for w in self.writes[
-                            (thread_id, checkpoint_ns, parent_checkpoint_id)
-                        ].values()
-                        if w[1] == TASKS
-                    ]
-                else:
-                    sends = []
-                return CheckpointTuple(
-                    config=config,
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                    },
-                    metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v in writes
-                    ],
-                    parent_config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": parent_checkpoint_id,
-                        }
-                    }
-                    if parent_checkpoint_id
-                    else None,
-                )
-        else:
-            if checkpoints := self.storage[thread_id][checkpoint_ns]:
-                checkpoint_id = max(checkpoints.keys())
-                checkpoint, metadata, parent_checkpoint_id = checkpoints[checkpoint_id]
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
-                if parent_checkpoint_id:
-                    sends = [
-                        w[2]
-                        for w in self.writes[
-                            (thread_id, checkpoint_ns, parent_checkpoint_id)
-                        ].values()
-                        if w[1] == TASKS
-                    ]
-                else:
-                    sends = []
-                return CheckpointTuple(
-                    config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": checkpoint_id,
-                        }
-                    },
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                    },
-                    metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v in writes
-                    ],
-                    parent_config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": parent_checkpoint_id,
-                        }
-                    }
-                    if parent_checkpoint_id
-                    else None,
-                )
+            if (saved := checkpoints.get(checkpoint_id)) is None:
+                return None
+            self._touch(thread_id)
+            return self._checkpoint_tuple(
+                thread_id, checkpoint_ns, checkpoint_id, saved
+            )._replace(config=config)
+        elif (checkpoint_id := checkpoints.latest()) and (
+            # may be deleted meanwhile by a concurrent prune
+            saved := checkpoints.get(checkpoint_id)
+        ):
+            self._touch(thread_id)
+            return self._checkpoint_tuple(
+                thread_id, checkpoint_ns, checkpoint_id, saved
+            )
+        return None
 
     def list(
         self,
@@ -209,42 +328,46 @@ class MemorySaver(
         Yields:
             Iterator[CheckpointTuple]: An iterator of matching checkpoint tuples.
         """
-        thread_ids = (config["configurable"]["thread_id"],) if config else self.storage
+        # copied, as threads and namespaces may be deleted while iterating
+        thread_ids = (
+            (config["configurable"]["thread_id"],) if config else list(self.storage)
+        )
         config_checkpoint_ns = (
             config["configurable"].get("checkpoint_ns") if config else None
         )
         config_checkpoint_id = get_checkpoint_id(config) if config else None
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
         for thread_id in thread_ids:
-            for checkpoint_ns in self.storage[thread_id].keys():
+            if config:
+                self._touch(thread_id)
+            for checkpoint_ns, checkpoints in list(
+                self.storage.get(thread_id, {}).items()
+            ):
                 if (
                     config_checkpoint_ns is not None
                     and checkpoint_ns != config_checkpoint_ns
                 ):
                     continue
 
-                for checkpoint_id, (
-                    checkpoint,
-                    metadata_b,
-                    parent_checkpoint_id,
-                ) in sorted(
-                    self.storage[thread_id][checkpoint_ns].items(),
-                    key=lambda x: x[0],
-                    reverse=True,
-                ):
+                if config_checkpoint_id:
                     # filter by checkpoint ID from config
-                    if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
-                        continue
-
+                    checkpoint_ids: Iterable[str] = (
+                        [config_checkpoint_id]
+                        if not before_checkpoint_id
+                        or config_checkpoint_id < before_checkpoint_id
+                        else []
+                    )
+                else:
                     # filter by checkpoint ID from `before` config
-                    if (
-                        before
-                        and (before_checkpoint_id := get_checkpoint_id(before))
-                        and checkpoint_id >= before_checkpoint_id
-                    ):
+                    checkpoint_ids = checkpoints.before(before_checkpoint_id)
+
+                for checkpoint_id in checkpoint_ids:
+                    # skip checkpoints missing or deleted meanwhile
+                    if (saved := checkpoints.get(checkpoint_id)) is None:
                         continue
 
                     # filter by metadata
-                    metadata = self.serde.loads_typed(metadata_b)
+                    metadata = self._load(saved[1])
                     if filter and not all(
                         query_value == metadata.get(query_key)
                         for query_key, query_value in filter.items()
@@ -257,46 +380,8 @@ class MemorySaver(
                     elif limit is not None:
                         limit -= 1
 
-                    writes = self.writes[
-                        (thread_id, checkpoint_ns, checkpoint_id)
-                    ].values()
-
-                    if parent_checkpoint_id:
-                        sends = [
-                            w[2]
-                            for w in self.writes[
-                                (thread_id, checkpoint_ns, parent_checkpoint_id)
-                            ].values()
-                            if w[1] == TASKS
-                        ]
-                    else:
-                        sends = []
-
-                    yield CheckpointTuple(
-                        config={
-                            "configurable": {
-                                "thread_id": thread_id,
-                                "checkpoint_ns": checkpoint_ns,
-                                "checkpoint_id": checkpoint_id,
-                            }
-                        },
-                        checkpoint={
-                            **self.serde.loads_typed(checkpoint),
-                            "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                        },
-                        metadata=metadata,
-                        parent_config={
-                            "configurable": {
-                                "thread_id": thread_id,
-                                "checkpoint_ns": checkpoint_ns,
-                                "checkpoint_id": parent_checkpoint_id,
-                            }
-                        }
-                        if parent_checkpoint_id
-                        else None,
-                        pending_writes=[
-                            (id, c, self.serde.loads_typed(v)) for id, c, v in writes
-                        ],
+                    yield self._checkpoint_tuple(
+                        thread_id, checkpoint_ns, checkpoint_id, saved, metadata
                     )
 
     def put(
@@ -324,15 +409,46 @@ class MemorySaver(
         c.pop("pending_sends")  # type: ignore[misc]
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        self.storage[thread_id][checkpoint_ns].update(
-            {
-                checkpoint["id"]: (
-                    self.serde.dumps_typed(c),
-                    self.serde.dumps_typed(metadata),
-                    config["configurable"].get("checkpoint_id"),  # parent
-                )
-            }
+        values = c["channel_values"]
+
+        def dump_value(channel: str) -> tuple[str, Any]:
+            return self._dump(values[channel]) if channel in values else ("empty", b"")
+
+        # only serialize channel versions that aren't stored yet, unchanged
+        # channels are referenced by the version stored by an earlier checkpoint
+        blobs = {
+            key: dump_value(channel)
+            for channel, version in c["channel_versions"].items()
+            if (key := (thread_id, checkpoint_ns, channel, version)) not in self.blobs
+        }
+        # values of unversioned channels are kept inline
+        c["channel_values"] = {
+            k: v for k, v in values.items() if k not in c["channel_versions"]
+        }
+        saved: SavedCheckpoint = (
+            self._dump(c),
+            self._dump(metadata),
+            config["configurable"].get("checkpoint_id"),  # parent
         )
+        size = 0
+        with self.lock:
+            for channel, version in c["channel_versions"].items():
+                key = (thread_id, checkpoint_ns, channel, version)
+                if key not in self.blobs:
+                    # the blob may have been deleted by a concurrent prune
+                    blob = blobs[key] if key in blobs else dump_value(channel)
+                    self.blobs[key] = blob
+                    self.thread_blobs[thread_id].add(key)
+                    if self.max_bytes is not None:
+                        size += len(blob[1])
+            checkpoints = self.storage[thread_id][checkpoint_ns]
+            if self.max_bytes is not None:
+                size += len(saved[0][1]) + len(saved[1][1])
+                if replaced := checkpoints.get(checkpoint["id"]):
+                    size -= len(replaced[0][1]) + len(replaced[1][1])
+            checkpoints[checkpoint["id"]] = saved
+        if self.max_bytes is not None:
+            self._add_bytes(thread_id, size)
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -364,9 +480,185 @@ class MemorySaver(
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
         checkpoint_id = config["configurable"]["checkpoint_id"]
         outer_key = (thread_id, checkpoint_ns, checkpoint_id)
-        for idx, (c, v) in enumerate(writes):
-            inner_key = (task_id, WRITES_IDX_MAP.get(c, idx))
-            self.writes[outer_key][inner_key] = (task_id, c, self.serde.dumps_typed(v))
+        dumped = [
+            ((task_id, WRITES_IDX_MAP.get(c, idx)), (task_id, c, self._dump(v)))
+            for idx, (c, v) in enumerate(writes)
+        ]
+        size = 0
+        with self.lock:
+            saved_writes = self.writes[outer_key]
+            self.thread_writes[thread_id].add(outer_key)
+            for inner_key, write in dumped:
+                if self.max_bytes is not None:
+                    size += len(write[2][1])
+                    if replaced := saved_writes.get(inner_key):
+                        size -= len(replaced[2][1])
+                saved_writes[inner_key] = write
+        if self.max_bytes is not None:
+            self._add_bytes(thread_id, size)
+
+    def _touch(self, thread_id: str) -> None:
+        """Mark a thread as the most recently used, if bounded."""
+        if self.max_bytes is not None:
+            with self.lock:
+                if thread_id in self.sizes:
+                    self.sizes.move_to_end(thread_id)
+
+    def _add_bytes(self, thread_id: str, size: int) -> None:
+        """Add to the size of a thread, marking it as the most recently used, then
+        delete the least recently used threads while over `max_bytes`."""
+        assert self.max_bytes is not None
+        with self.lock:
+            self.sizes[thread_id] = self.sizes.get(thread_id, 0) + size
+            self.sizes.move_to_end(thread_id)
+            self.total_bytes += size
+            evicted = []
+            total_bytes = self.total_bytes
+            for lru_thread_id, lru_size in self.sizes.items():
+                if total_bytes <= self.max_bytes or lru_thread_id == thread_id:
+                    break
+                evicted.append(lru_thread_id)
+                total_bytes -= lru_size
+        for lru_thread_id in evicted:
+            self.delete_thread(lru_thread_id)
+
+    def _thread_bytes(self, thread_id: str) -> int:
+        """Count the serialized size of a thread. Called with the lock held."""
+        return (
+            sum(
+                len(saved[0][1]) + len(saved[1][1])
+                for checkpoints in self.storage.get(thread_id, {}).values()
+                for saved in checkpoints.values()
+            )
+            + sum(
+                len(w[2][1])
+                for key in self.thread_writes.get(thread_id, ())
+                for w in self.writes[key].values()
+            )
+            + sum(
+                len(self.blobs[key][1]) for key in self.thread_blobs.get(thread_id, ())
+            )
+        )
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, in all namespaces.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        with self.lock:
+            self.storage.pop(thread_id, None)
+            for key in self.thread_writes.pop(thread_id, ()):
+                self.writes.pop(key, None)
+            for key in self.thread_blobs.pop(thread_id, ()):
+                self.blobs.pop(key, None)
+            if self.max_bytes is not None:
+                self.total_bytes -= self.sizes.pop(thread_id, 0)
+
+    def prune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Delete old checkpoints from the in-memory storage.
+
+        A checkpoint is deleted if it isn't among the `keep_last` latest of its
+        thread and namespace, or if it was created more than `max_age` ago. Its
+        writes are deleted too, except those storing the pending sends of a
+        remaining checkpoint, as are the channel values no longer referenced.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        cutoff = get_prune_cutoff(keep_last, max_age)
+        deleted = 0
+        for thread_id in list(self.storage if thread_ids is None else thread_ids):
+            # one thread at a time, so that saves to others aren't held up
+            with self.lock:
+                deleted += self._prune_thread(thread_id, keep_last, cutoff)
+        return deleted
+
+    def _prune_thread(
+        self, thread_id: str, keep_last: Optional[int], cutoff: Optional[str]
+    ) -> int:
+        """Delete the old checkpoints of a thread. Called with the lock held."""
+        deleted = 0
+        namespaces = self.storage.get(thread_id, {})
+        thread_writes = self.thread_writes.get(thread_id, set())
+        for checkpoint_ns, checkpoints in list(namespaces.items()):
+            pruned, delete_writes, keep_sends = select_pruned_checkpoints(
+                [(id, checkpoints[id][2]) for id in checkpoints.before()],
+                keep_last,
+                cutoff,
+            )
+            if not pruned:
+                continue
+            checkpoints.remove(pruned)
+            for checkpoint_id in delete_writes:
+                key = (thread_id, checkpoint_ns, checkpoint_id)
+                self.writes.pop(key, None)
+                thread_writes.discard(key)
+            for checkpoint_id in keep_sends:
+                key = (thread_id, checkpoint_ns, checkpoint_id)
+                if writes := self.writes.get(key):
+                    if sends := {k: w for k, w in writes.items() if w[1] == TASKS}:
+                        self.writes[key] = sends
+                    else:
+                        self.writes.pop(key, None)
+                        thread_writes.discard(key)
+            self._delete_unreferenced_blobs(
+                thread_id, checkpoint_ns, list(checkpoints.values())
+            )
+            if not checkpoints:
+                namespaces.pop(checkpoint_ns, None)
+            deleted += len(pruned)
+        if thread_id in self.storage and not namespaces:
+            self.storage.pop(thread_id, None)
+        if not thread_writes:
+            self.thread_writes.pop(thread_id, None)
+        if self.max_bytes is not None and thread_id in self.sizes:
+            size = self._thread_bytes(thread_id)
+            self.total_bytes += size - self.sizes[thread_id]
+            if thread_id in self.storage:
+                self.sizes[thread_id] = size
+            else:
+                del self.sizes[thread_id]
+        return deleted
+
+    def _delete_unreferenced_blobs(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        remaining: Sequence[SavedCheckpoint],
+    ) -> None:
+        """Delete the blobs of a namespace no longer referenced by its remaining
+        checkpoints. Called with the lock held."""
+        referenced: defaultdict[str, set[Any]] = defaultdict(set)
+        for saved, _, _ in remaining:
+            versions = self._load(saved)["channel_versions"]
+            for channel, version in versions.items():
+                referenced[channel].add(version)
+        thread_blobs = self.thread_blobs.get(thread_id, set())
+        for key in [k for k in thread_blobs if k[1] == checkpoint_ns]:
+            _, _, channel, version = key
+            if version in referenced[channel]:
+                continue
+            # versions newer than those of all checkpoints may belong to a
+            # checkpoint being saved concurrently
+            if not remaining or (
+                referenced[channel] and version < max(referenced[channel])
+            ):
+                self.blobs.pop(key, None)
+                thread_blobs.discard(key)
+        if not thread_blobs:
+            self.thread_blobs.pop(thread_id, None)
 
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Asynchronous version of get_tuple.
@@ -464,6 +756,37 @@ class MemorySaver(
             None, self.put_writes, config, writes, task_id
         )
 
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Asynchronous version of delete_thread.
+
+        Args:
+            thread_id (str): The thread whose checkpoints to delete.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.delete_thread, thread_id
+        )
+
+    async def aprune(
+        self,
+        thread_ids: Optional[Sequence[str]] = None,
+        *,
+        keep_last: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> int:
+        """Asynchronous version of prune.
+
+        Args:
+            thread_ids (Optional[Sequence[str]]): The threads to prune. Defaults to all threads.
+            keep_last (Optional[int]): Number of latest checkpoints to keep per thread and namespace.
+            max_age (Optional[timedelta]): Age after which checkpoints are deleted.
+
+        Returns:
+            int: The number of checkpoints deleted.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(self.prune, keep_last=keep_last, max_age=max_age), thread_ids
+        )
+
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         if current is None:
             current_v = 0
@@ -25,7 +25,7 @@ from langchain_core.load.serializable import Serializable
 from zoneinfo import ZoneInfo
 
 from langgraph.checkpoint.serde.base import SerializerProtocol
-from langgraph.checkpoint.serde.types import SendProtocol
+from langgraph.checkpoint.serde.types import SendProtocol, is_log_view
 from langgraph.store.base import Item
 
 LC_REVIVER = Reviver()
@@ -53,7 +53,7 @@ class JsonPlusSerializer(SerializerProtocol):
             out["kwargs"] = kwargs
         return out
 
-    def _default(self, obj: Any) -> Union[str, dict[str, Any]]:
+    def _default(self, obj: Any) -> Union[str, dict[str, Any], list[Any]]:
         if isinstance(obj, Serializable):
             return cast(dict[str, Any], obj.to_json())
         elif hasattr(obj, "model_dump") and callable(obj.model_dump):
@@ -128,6 +128,8 @@ class JsonPlusSerializer(SerializerProtocol):
             )
         elif isinstance(obj, BaseException):
             return repr(obj)
+        elif is_log_view(obj):
+            return obj.items[: obj.length]
         else:
             raise TypeError(
                 f"Object of type {obj.__class__.__name__} is not JSON serializable"
@@ -223,7 +225,7 @@ EXT_PYDANTIC_V1 = 4
 EXT_PYDANTIC_V2 = 5
 
 
-def _msgpack_default(obj: Any) -> Union[str, msgpack.ExtType]:
+def _msgpack_default(obj: Any) -> Union[str, msgpack.ExtType, list[Any]]:
     if hasattr(obj, "model_dump") and callable(obj.model_dump):  # pydantic v2
         return msgpack.ExtType(
             EXT_PYDANTIC_V2,
@@ -431,6 +433,8 @@ def _msgpack_default(obj: Any) -> Union[str, msgpack.ExtType]:
 
     elif isinstance(obj, BaseException):
         return repr(obj)
+    elif is_log_view(obj):
+        return obj.items[: obj.length]
     else:
         raise TypeError(f"Object of type {obj.__class__.__name__} is not serializable")
 
@@ -37,6 +37,13 @@ class ChannelProtocol(Protocol[Value, Update, C]):
     def consume(self) -> bool: ...
 
 
+def is_log_view(obj: Any) -> bool:
+    """Whether the object is a `langgraph.channels.topic.LogView`, the read-only
+    view of the values of an append-only channel, which is saved as a list."""
+    cls = obj.__class__
+    return cls.__name__ == "LogView" and cls.__module__ == "langgraph.channels.topic"
+
+
 @runtime_checkable
 class SendProtocol(Protocol):
     # Mirrors langgraph.constants.Send
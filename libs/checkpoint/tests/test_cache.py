@@ -0,0 +1,108 @@
+import time
+
+import pytest
+
+from langgraph.cache.base import BaseCache, PickleSerializer
+from langgraph.cache.memory import InMemoryCache
+from langgraph.cache.store import StoreCache
+from langgraph.store.memory import InMemoryStore
+
+
+@pytest.fixture(params=["memory", "store"])
+def cache(request: pytest.FixtureRequest) -> BaseCache:
+    if request.param == "memory":
+        return InMemoryCache()
+    else:
+        return StoreCache(InMemoryStore())
+
+
+def test_cache_get_set(cache: BaseCache) -> None:
+    assert cache.get([(("a",), "1")]) == {}
+
+    cache.set(
+        {
+            (("a",), "1"): ([("x", 1)], None),
+            (("a", "b"), "2"): ({"y": [1, 2], "z": (1, 2)}, None),
+        }
+    )
+    found = cache.get([(("a",), "1"), (("a", "b"), "2"), (("a",), "3")])
+    # tuples are loaded as lists by the default serializer
+    assert found == {
+        (("a",), "1"): [["x", 1]],
+        (("a", "b"), "2"): {"y": [1, 2], "z": [1, 2]},
+    }
+
+    # values are returned as copies
+    cache.get([(("a", "b"), "2")])[(("a", "b"), "2")]["y"].append(3)
+    assert cache.get([(("a", "b"), "2")]) == {
+        (("a", "b"), "2"): {"y": [1, 2], "z": [1, 2]}
+    }
+
+
+@pytest.mark.parametrize("cls", [InMemoryCache, StoreCache])
+def test_cache_pickle_serializer(cls: type) -> None:
+    cache = (
+        InMemoryCache(serde=PickleSerializer())
+        if cls is InMemoryCache
+        else StoreCache(InMemoryStore(), serde=PickleSerializer())
+    )
+    cache.set({(("a",), "1"): ([("x", 1)], None)})
+    found = cache.get([(("a",), "1")])
+    assert found == {(("a",), "1"): [("x", 1)]}
+    # types are kept, eg. the writes of a task are a list of tuples
+    assert type(found[(("a",), "1")][0]) is tuple
+
+
+def test_cache_ttl(cache: BaseCache) -> None:
+    cache.set({(("a",), "1"): ("v1", 0), (("a",), "2"): ("v2", 60)})
+    time.sleep(0.01)
+    assert cache.get([(("a",), "1"), (("a",), "2")]) == {(("a",), "2"): "v2"}
+
+
+def test_cache_clear(cache: BaseCache) -> None:
+    cache.set(
+        {
+            (("a",), "1"): (1, None),
+            (("a", "b"), "2"): (2, None),
+            (("c",), "3"): (3, None),
+        }
+    )
+    cache.clear([("a",)])
+    assert cache.get([(("a",), "1"), (("a", "b"), "2"), (("c",), "3")]) == {
+        (("c",), "3"): 3
+    }
+    cache.clear()
+    assert cache.get([(("c",), "3")]) == {}
+
+
+async def test_cache_async(cache: BaseCache) -> None:
+    await cache.aset({(("a",), "1"): ("v1", None)})
+    assert await cache.aget([(("a",), "1"), (("a",), "2")]) == {(("a",), "1"): "v1"}
+    await cache.aclear([("a",)])
+    assert await cache.aget([(("a",), "1")]) == {}
+
+
+def test_in_memory_cache_lru() -> None:
+    cache = InMemoryCache(maxsize=2)
+    cache.set({(("a",), "1"): (1, None), (("a",), "2"): (2, None)})
+    # touch the first entry so the second one is evicted
+    assert cache.get([(("a",), "1")]) == {(("a",), "1"): 1}
+    cache.set({(("a",), "3"): (3, None)})
+    assert cache.get([(("a",), "1"), (("a",), "2"), (("a",), "3")]) == {
+        (("a",), "1"): 1,
+        (("a",), "3"): 3,
+    }
+
+
+def test_store_cache_pickle_reads_jsonplus_entries() -> None:
+    store = InMemoryStore()
+    StoreCache(store).set({(("a",), "1"): ([["x", 1]], None)})
+    # entries stored with the default serializer are still read
+    cache = StoreCache(store, serde=PickleSerializer())
+    assert cache.get([(("a",), "1")]) == {(("a",), "1"): [["x", 1]]}
+
+
+def test_store_cache_shares_entries() -> None:
+    store = InMemoryStore()
+    StoreCache(store).set({(("a.b",), "1"): ("v1", None)})
+    assert StoreCache(store).get([(("a.b",), "1")]) == {(("a.b",), "1"): "v1"}
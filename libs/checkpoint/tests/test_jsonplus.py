@@ -8,8 +8,10 @@ from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from enum import Enum
 from ipaddress import IPv4Address
+from typing import Sequence
 
 import dataclasses_json
+import pytest
 from pydantic import BaseModel, SecretStr
 from pydantic.v1 import BaseModel as BaseModelV1
 from pydantic.v1 import SecretStr as SecretStrV1
@@ -184,6 +186,37 @@ def test_serde_jsonplus_bytearray() -> None:
     assert serde.loads_typed(dumped) == some_bytearray
 
 
+def test_serde_jsonplus_log_view() -> None:
+    class FirstItems(Sequence[int]):
+        def __init__(self, items: list[int], length: int) -> None:
+            self.items = items
+            self.length = length
+
+        def __getitem__(self, index):
+            return self.items[: self.length][index]
+
+        def __len__(self) -> int:
+            return self.length
+
+    # mirrors langgraph.channels.topic.LogView
+    class LogView(FirstItems):
+        pass
+
+    LogView.__module__ = "langgraph.channels.topic"
+
+    serde = JsonPlusSerializer()
+    value = {"items": LogView([1, 2, 3], 2)}
+
+    assert serde.loads_typed(serde.dumps_typed(value)) == {"items": [1, 2]}
+    assert serde.loads(serde.dumps(value)) == {"items": [1, 2]}
+
+    # other sequences aren't serialized as lists
+    with pytest.raises(TypeError):
+        serde.dumps_typed(FirstItems([1, 2, 3], 2))
+    with pytest.raises(TypeError):
+        serde.dumps(FirstItems([1, 2, 3], 2))
+
+
 def test_loads_cannot_find() -> None:
     serde = JsonPlusSerializer()
 
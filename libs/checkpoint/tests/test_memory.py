@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Any
 
 import pytest
@@ -10,6 +12,7 @@ from langgraph.checkpoint.base import (
     empty_checkpoint,
 )
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.types import TASKS
 
 
 class TestMemorySaver:
@@ -138,3 +141,274 @@ class TestMemorySaver:
             c async for c in self.memory_saver.alist(None, filter=query_4)
         ]
         assert len(search_results_4) == 0
+
+    def test_delta_checkpoints(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+        }
+        chkpnt_1: Checkpoint = {
+            **empty_checkpoint(),
+            "channel_values": {"a": "1", "b": [1]},
+            "channel_versions": {"a": 1, "b": 1},
+        }
+        config_1 = self.memory_saver.put(config, chkpnt_1, {}, {"a": 1, "b": 1})
+        chkpnt_2: Checkpoint = {
+            **create_checkpoint(chkpnt_1, None, 1),
+            "channel_values": {"a": "1", "b": [1, 2]},
+            "channel_versions": {"a": 1, "b": 2},
+        }
+        config_2 = self.memory_saver.put(config_1, chkpnt_2, {}, {"b": 2})
+
+        # unchanged channel "a" is stored once
+        assert sorted(k[2:] for k in self.memory_saver.blobs) == [
+            ("a", 1),
+            ("b", 1),
+            ("b", 2),
+        ]
+        # full values are rebuilt on read
+        saved_1 = self.memory_saver.get_tuple(config_1)
+        assert saved_1 is not None
+        assert saved_1.checkpoint["channel_values"] == {"a": "1", "b": [1]}
+        saved_2 = self.memory_saver.get_tuple(config_2)
+        assert saved_2 is not None
+        assert saved_2.checkpoint["channel_values"] == {"a": "1", "b": [1, 2]}
+        assert [
+            c.checkpoint["channel_values"] for c in self.memory_saver.list(config)
+        ] == [{"a": "1", "b": [1, 2]}, {"a": "1", "b": [1]}]
+
+    def test_latest_and_before(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+        }
+        chkpnt: Checkpoint = empty_checkpoint()
+        ids = []
+        for step in range(5):
+            chkpnt = create_checkpoint(chkpnt, None, step)
+            config = self.memory_saver.put(config, chkpnt, {"step": step}, {})
+            ids.append(chkpnt["id"])
+        # saved out of order, eg. when copying a thread
+        self.memory_saver.put(config, {**chkpnt, "id": "0"}, {"step": -1}, {})
+        ids.insert(0, "0")
+
+        thread: RunnableConfig = {"configurable": {"thread_id": "thread-3"}}
+        latest = self.memory_saver.get_tuple(thread)
+        assert latest is not None
+        assert latest.checkpoint["id"] == ids[-1]
+        assert [c.checkpoint["id"] for c in self.memory_saver.list(thread)] == ids[::-1]
+        before: RunnableConfig = {"configurable": {"checkpoint_id": ids[3]}}
+        assert [
+            c.metadata["step"]
+            for c in self.memory_saver.list(thread, before=before, limit=2)
+        ] == [1, 0]
+        assert [
+            c.metadata["step"]
+            for c in self.memory_saver.list(thread, before=before, filter={"step": 0})
+        ] == [0]
+
+    def test_no_serialize(self) -> None:
+        saver = MemorySaver(serialize=False)
+        value = {"a": [1, 2]}
+        chkpnt: Checkpoint = {
+            **empty_checkpoint(),
+            "channel_values": {"a": value},
+            "channel_versions": {"a": 1},
+        }
+        config = saver.put(self.config_1, chkpnt, self.metadata_1, {"a": 1})
+        saver.put_writes(config, [("a", value)], "t")
+        # changes to the checkpoint by its caller aren't saved
+        chkpnt["channel_versions"]["a"] = 2
+
+        # nor are changes to its values, eg. sets and lists of channels
+        value["a"].append(3)
+
+        saved = saver.get_tuple(config)
+        assert saved is not None
+        assert saved.checkpoint["channel_values"] == {"a": {"a": [1, 2]}}
+        assert saved.pending_writes == [("t", "a", {"a": [1, 2]})]
+        assert saved.metadata == self.metadata_1
+        assert saved.checkpoint["channel_versions"] == {"a": 1}
+        # nor are changes to loaded checkpoints
+        saved.checkpoint["channel_versions"]["a"] = 3
+        saved.checkpoint["channel_values"]["a"]["a"].clear()
+        saved.pending_writes[0][2]["a"].clear()
+        saved = saver.get_tuple(config)
+        assert saved is not None
+        assert saved.checkpoint["channel_versions"] == {"a": 1}
+        assert saved.checkpoint["channel_values"] == {"a": {"a": [1, 2]}}
+        assert saved.pending_writes == [("t", "a", {"a": [1, 2]})]
+
+        with pytest.raises(ValueError):
+            MemorySaver(serialize=False, max_bytes=1000)
+
+    def test_max_bytes(self) -> None:
+        saver = MemorySaver(max_bytes=10**9)
+
+        def save(thread_id: str) -> RunnableConfig:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+            }
+            chkpnt: Checkpoint = {
+                **empty_checkpoint(),
+                "channel_values": {"a": thread_id * 1000},
+                "channel_versions": {"a": 1},
+            }
+            config = saver.put(config, chkpnt, {}, {"a": 1})
+            saver.put_writes(config, [("a", thread_id)], "t")
+            return config
+
+        configs = {"a": save("a")}
+        size = saver.total_bytes
+        assert saver.sizes == {"a": size}
+        saver.max_bytes = int(size * 3.5)
+        configs.update((thread_id, save(thread_id)) for thread_id in "bc")
+        assert saver.total_bytes == 3 * size
+        # reading a thread marks it as recently used
+        assert saver.get_tuple(configs["a"]) is not None
+
+        save("d")
+        assert list(saver.sizes) == ["c", "a", "d"]
+        assert saver.total_bytes == 3 * size
+        assert saver.get_tuple(configs["b"]) is None
+        assert not [k for k in saver.blobs if k[0] == "b"]
+        assert not [k for k in saver.writes if k[0] == "b"]
+
+        # the thread being saved is kept, even if larger than max_bytes
+        saver.max_bytes = size // 2
+        save("e")
+        assert list(saver.sizes) == ["e"]
+        assert saver.get_tuple({"configurable": {"thread_id": "e"}}) is not None
+
+        saver.prune(["e"], max_age=timedelta(0))
+        assert not saver.sizes
+        assert saver.total_bytes == 0
+
+    def test_reads_dont_grow_storage(self) -> None:
+        config = self.memory_saver.put(
+            self.config_1, self.chkpnt_1, self.metadata_1, {}
+        )
+        storage = {k: dict(v) for k, v in self.memory_saver.storage.items()}
+        writes = dict(self.memory_saver.writes)
+
+        assert self.memory_saver.get_tuple(config) is not None
+        assert self.memory_saver.get_tuple(self.config_2) is None
+        assert list(self.memory_saver.list(self.config_2)) == []
+        assert len(list(self.memory_saver.list(None))) == 1
+
+        assert {k: dict(v) for k, v in self.memory_saver.storage.items()} == storage
+        assert dict(self.memory_saver.writes) == writes
+
+    def test_prune(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+        }
+        chkpnt: Checkpoint = empty_checkpoint()
+        configs = []
+        for step in range(4):
+            chkpnt = {
+                **create_checkpoint(chkpnt, None, step),
+                "channel_values": {"a": "1", "b": step},
+                "channel_versions": {"a": 1, "b": step + 1},
+            }
+            new_versions = {"a": 1, "b": step + 1} if step == 0 else {"b": step + 1}
+            config = self.memory_saver.put(config, chkpnt, {}, new_versions)
+            self.memory_saver.put_writes(config, [("b", step), (TASKS, step)], "t")
+            configs.append(config)
+        other = self.memory_saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+        with pytest.raises(ValueError):
+            self.memory_saver.prune()
+        assert self.memory_saver.prune(["thread-3"], keep_last=2) == 2
+
+        thread: RunnableConfig = {"configurable": {"thread_id": "thread-3"}}
+        assert [c.config for c in self.memory_saver.list(thread)] == configs[:1:-1]
+        # only the pending sends of the parent of the oldest checkpoint are kept
+        assert sorted(k[2] for k in self.memory_saver.writes) == sorted(
+            c["configurable"]["checkpoint_id"] for c in configs[1:]
+        )
+        assert [
+            w[1]
+            for w in self.memory_saver.writes[
+                ("thread-3", "", configs[1]["configurable"]["checkpoint_id"])
+            ].values()
+        ] == [TASKS]
+        saved = self.memory_saver.get_tuple(configs[2])
+        assert saved is not None
+        assert saved.checkpoint["pending_sends"] == [1]
+        assert saved.checkpoint["channel_values"] == {"a": "1", "b": 2}
+        # blobs of versions no longer referenced are deleted
+        blobs = self.memory_saver.blobs
+        assert sorted(k[2:] for k in blobs if k[0] == "thread-3") == [
+            ("a", 1),
+            ("b", 3),
+            ("b", 4),
+        ]
+        # other threads are untouched
+        assert self.memory_saver.get_tuple(other) is not None
+
+        assert self.memory_saver.prune(keep_last=2) == 0
+        assert self.memory_saver.prune(max_age=timedelta(0)) == 3
+        assert list(self.memory_saver.list(None)) == []
+        assert not self.memory_saver.storage
+        assert not self.memory_saver.writes
+        assert not self.memory_saver.blobs
+
+    def test_prune_while_saving(self) -> None:
+        saver = MemorySaver()
+
+        def save(thread_id: str) -> None:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            for step in range(200):
+                chkpnt = {
+                    **create_checkpoint(chkpnt, None, step),
+                    "channel_values": {"a": step},
+                    "channel_versions": {"a": step + 1},
+                }
+                config = saver.put(config, chkpnt, {}, {"a": step + 1})
+                saver.put_writes(config, [("a", step)], "t")
+
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(save, t) for t in ("a", "b")]
+            while not all(f.done() for f in futures):
+                saver.prune(["a", "b"], keep_last=3)
+            for f in futures:
+                f.result()
+        saver.prune(keep_last=3)
+
+        for thread_id in ("a", "b"):
+            checkpoints = saver.storage[thread_id][""]
+            assert checkpoints.ids == sorted(checkpoints.data)
+            assert len(checkpoints) == 3
+            # the writes and blobs of each thread are indexed by it
+            assert saver.thread_writes[thread_id] == {
+                k for k in saver.writes if k[0] == thread_id
+            }
+            assert saver.thread_blobs[thread_id] == {
+                k for k in saver.blobs if k[0] == thread_id
+            }
+            assert [
+                c.checkpoint["channel_values"]
+                for c in saver.list({"configurable": {"thread_id": thread_id}})
+            ] == [{"a": 199}, {"a": 198}, {"a": 197}]
+
+        saver.delete_thread("a")
+        assert "a" not in saver.thread_writes
+        assert "a" not in saver.thread_blobs
+        assert not [k for k in saver.blobs if k[0] == "a"]
+
+    def test_delete_thread(self) -> None:
+        config = self.memory_saver.put(
+            self.config_1, self.chkpnt_1, self.metadata_1, {}
+        )
+        self.memory_saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+        self.memory_saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+        self.memory_saver.put_writes(self.config_2, [("foo", "bar")], "t")
+
+        self.memory_saver.delete_thread("thread-2")
+
+        thread: RunnableConfig = {"configurable": {"thread_id": "thread-2"}}
+        assert list(self.memory_saver.list(thread)) == []
+        assert not self.memory_saver.writes
+        assert self.memory_saver.get_tuple(config) is not None
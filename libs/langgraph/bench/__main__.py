@@ -1,13 +1,35 @@
 import random
+import sys
+from functools import partial
 from uuid import uuid4
 
 from langchain_core.messages import HumanMessage
 from pyperf._runner import Runner
 from uvloop import new_event_loop
 
+from bench.compile import compile_graph
 from bench.fanout_to_subgraph import fanout_to_subgraph, fanout_to_subgraph_sync
+from bench.interrupts import interrupt_resume, interrupt_resume_sync
+from bench.long_history import long_history, long_history_input, long_history_sync
+from bench.map_reduce import map_reduce, map_reduce_sync
+from bench.nested_subgraphs import nested_subgraphs, nested_subgraphs_sync
 from bench.react_agent import react_agent
-from bench.wide_state import wide_state
+from bench.savers import (
+    SAVERS,
+    aresume,
+    astate_history,
+    astream,
+    aupdate_state,
+    resume,
+    state_history,
+    stream,
+    time_async,
+    time_sync,
+    update_state,
+)
+from bench.sequential import sequential, sequential_sync
+from bench.sparse_nodes import sparse_nodes
+from bench.wide_state import wide_state, wide_state_keys
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.pregel import Pregel
 
@@ -83,6 +105,30 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "map_reduce_10000x",
+        map_reduce(10000).compile(checkpointer=None),
+        map_reduce_sync(10000).compile(checkpointer=None),
+        {"results": []},
+    ),
+    (
+        "map_reduce_10000x_checkpoint",
+        map_reduce(10000).compile(checkpointer=MemorySaver()),
+        map_reduce_sync(10000).compile(checkpointer=MemorySaver()),
+        {"results": []},
+    ),
+    (
+        "long_history_2000x100",
+        long_history(2100).compile(checkpointer=None),
+        long_history_sync(2100).compile(checkpointer=None),
+        long_history_input(2000),
+    ),
+    (
+        "long_history_2000x100_checkpoint",
+        long_history(2100).compile(checkpointer=MemorySaver()),
+        long_history_sync(2100).compile(checkpointer=MemorySaver()),
+        long_history_input(2000),
+    ),
     (
         "react_agent_10x",
         react_agent(10, checkpointer=None),
@@ -203,6 +249,95 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "wide_state_keys_2000x500",
+        wide_state_keys(2000, 500).compile(checkpointer=None),
+        wide_state_keys(2000, 500).compile(checkpointer=None),
+        {"count": 0},
+    ),
+    (
+        "wide_state_keys_2000x500_checkpoint",
+        wide_state_keys(2000, 500).compile(checkpointer=MemorySaver()),
+        wide_state_keys(2000, 500).compile(checkpointer=MemorySaver()),
+        {"count": 0},
+    ),
+    (
+        "sparse_nodes_150x1000",
+        sparse_nodes(150, 3, 1000).compile(checkpointer=None),
+        sparse_nodes(150, 3, 1000).compile(checkpointer=None),
+        {"count": 0},
+    ),
+    (
+        "sparse_nodes_150x1000_checkpoint",
+        sparse_nodes(150, 3, 1000).compile(checkpointer=MemorySaver()),
+        sparse_nodes(150, 3, 1000).compile(checkpointer=MemorySaver()),
+        {"count": 0},
+    ),
+)
+
+# (name, async graph, sync graph, input, (prepare, async prepare), (run, async run))
+# graphs are built with each checkpointer in SAVERS, timing only the run
+checkpointer_benchmarks = (
+    (
+        "sequential_10000x",
+        lambda c: sequential(10000).compile(checkpointer=c),
+        lambda c: sequential_sync(10000).compile(checkpointer=c),
+        {"count": 0},
+        (None, None),
+        (stream, astream),
+    ),
+    (
+        "long_history_2000x100",
+        lambda c: long_history(2100).compile(checkpointer=c),
+        lambda c: long_history_sync(2100).compile(checkpointer=c),
+        long_history_input(2000),
+        (None, None),
+        (stream, astream),
+    ),
+    (
+        "map_reduce_10000x",
+        lambda c: map_reduce(10000).compile(checkpointer=c),
+        lambda c: map_reduce_sync(10000).compile(checkpointer=c),
+        {"results": []},
+        (None, None),
+        (stream, astream),
+    ),
+    (
+        "nested_subgraphs_4x25",
+        lambda c: nested_subgraphs(4, 25).compile(checkpointer=c),
+        lambda c: nested_subgraphs_sync(4, 25).compile(checkpointer=c),
+        {"count": 0},
+        (None, None),
+        (stream, astream),
+    ),
+    (
+        "interrupt_resume_100x",
+        lambda c: interrupt_resume(100).compile(
+            checkpointer=c, interrupt_before=["ask"]
+        ),
+        lambda c: interrupt_resume_sync(100).compile(
+            checkpointer=c, interrupt_before=["ask"]
+        ),
+        {"count": 0},
+        (None, None),
+        (partial(resume, 100), partial(aresume, 100)),
+    ),
+    (
+        "state_history_1000x",
+        lambda c: sequential(1000).compile(checkpointer=c),
+        lambda c: sequential_sync(1000).compile(checkpointer=c),
+        {"count": 0},
+        (stream, astream),
+        (state_history, astate_history),
+    ),
+    (
+        "update_state_1000x",
+        lambda c: sequential(10).compile(checkpointer=c),
+        lambda c: sequential_sync(10).compile(checkpointer=c),
+        {"count": 0},
+        (stream, astream),
+        (partial(update_state, 1000), partial(aupdate_state, 1000)),
+    ),
 )
 
 
@@ -212,3 +347,17 @@ for name, agraph, graph, input in benchmarks:
     r.bench_async_func(name, arun, agraph, input, loop_factory=new_event_loop)
     if graph is not None:
         r.bench_func(name + "_sync", run, graph, input)
+
+for name, abuild, build, input, (prep, aprep), (run_, arun_) in checkpointer_benchmarks:
+    for kind in SAVERS:
+        r.bench_time_func(
+            f"{name}_{kind}", time_async, abuild, kind, input, arun_, aprep
+        )
+        r.bench_time_func(
+            f"{name}_{kind}_sync", time_sync, build, kind, input, run_, prep
+        )
+
+r.bench_func("compile_20x", compile_graph, 20)
+r.bench_command(
+    "import_langgraph_graph", [sys.executable, "-c", "import langgraph.graph"]
+)
@@ -0,0 +1,69 @@
+import operator
+from typing import Annotated, Optional, TypedDict
+
+from langchain_core.messages import AnyMessage
+
+from langgraph.constants import END, START
+from langgraph.graph.message import add_messages
+from langgraph.graph.state import StateGraph
+
+
+# schemas are defined once, and graphs built from them many times, as services
+# do when building graphs at startup and on each change of configuration
+class State(TypedDict):
+    messages: Annotated[list[AnyMessage], add_messages]
+    documents: Annotated[list[dict], operator.add]
+    scores: Annotated[dict[str, float], operator.or_]
+    query: str
+    summary: Optional[str]
+    attempts: int
+    route: Optional[str]
+
+
+class SubgraphState(TypedDict):
+    messages: Annotated[list[AnyMessage], add_messages]
+    documents: Annotated[list[dict], operator.add]
+    query: str
+
+
+class Output(TypedDict):
+    messages: list[AnyMessage]
+    summary: Optional[str]
+
+
+def _node(state: State) -> dict:
+    return {"attempts": state["attempts"] + 1}
+
+
+def _subgraph_node(state: SubgraphState) -> dict:
+    return {"documents": [{"query": state["query"]}]}
+
+
+def _route(state: State) -> str:
+    return state["route"] or END
+
+
+def compile_graph(n_nodes: int) -> None:
+    """Build and compile a graph of `n_nodes` nodes, each with a conditional
+    edge, and a subgraph, so that compile time is measured on its own."""
+    subgraph = StateGraph(SubgraphState)
+    subgraph.add_node("retrieve", _subgraph_node)
+    subgraph.add_node("rerank", _subgraph_node)
+    subgraph.add_edge(START, "retrieve")
+    subgraph.add_edge("retrieve", "rerank")
+    subgraph.add_edge("rerank", END)
+
+    builder = StateGraph(State, output=Output)
+    builder.add_node("subgraph", subgraph.compile())
+    builder.add_edge(START, "subgraph")
+    for i in range(n_nodes):
+        builder.add_node(f"node_{i}", _node)
+        builder.add_edge("subgraph" if i == 0 else f"node_{i - 1}", f"node_{i}")
+        builder.add_conditional_edges(f"node_{i}", _route)
+    builder.add_edge(f"node_{n_nodes - 1}", END)
+    builder.compile()
+
+
+if __name__ == "__main__":
+    for _ in range(100):
+        compile_graph(20)
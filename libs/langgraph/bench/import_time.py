@@ -0,0 +1,43 @@
+"""Check that importing langgraph.graph doesn't import optional subsystems, and
+print the slowest imports, as reported by `python -X importtime`."""
+
+import subprocess
+import sys
+
+MODULE = "langgraph.graph"
+
+# imported on first use only, to keep cold starts fast
+LAZY_MODULES = (
+    "langgraph.prebuilt",
+    "langgraph.pregel.remote",
+    "langgraph.pregel.messages",
+    "langgraph.graph.message",
+    "langgraph.channels.messages",
+    "langgraph_sdk",
+)
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a new interpreter, returning the cumulative import time
+    in microseconds of each module it imported."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+if __name__ == "__main__":
+    times = import_times(MODULE)
+    for name, us in sorted(times.items(), key=lambda t: t[1], reverse=True)[:20]:
+        print(f"{us / 1000:10.1f} ms  {name}")
+    if imported := [m for m in LAZY_MODULES if m in times]:
+        sys.exit(f"import {MODULE} imported {', '.join(imported)}")
@@ -0,0 +1,71 @@
+from typing import TypedDict
+
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+
+
+class State(TypedDict):
+    count: int
+
+
+def interrupt_resume(n_cycles: int) -> StateGraph:
+    """A loop that is interrupted before asking for input, for `n_cycles` cycles,
+    to be compiled with `interrupt_before=["ask"]` and resumed after each
+    interrupt, so that saving and restoring runs dominates."""
+
+    async def ask(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    async def act(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    def should_continue(state: State) -> str:
+        return "ask" if state["count"] < n_cycles * 2 else END
+
+    builder = StateGraph(State)
+    builder.add_node("ask", ask)
+    builder.add_node("act", act)
+    builder.add_edge(START, "ask")
+    builder.add_edge("ask", "act")
+    builder.add_conditional_edges("act", should_continue)
+    return builder
+
+
+def interrupt_resume_sync(n_cycles: int) -> StateGraph:
+    def ask(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    def act(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    def should_continue(state: State) -> str:
+        return "ask" if state["count"] < n_cycles * 2 else END
+
+    builder = StateGraph(State)
+    builder.add_node("ask", ask)
+    builder.add_node("act", act)
+    builder.add_edge(START, "ask")
+    builder.add_edge("ask", "act")
+    builder.add_conditional_edges("act", should_continue)
+    return builder
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    graph = interrupt_resume(100).compile(
+        checkpointer=MemorySaver(), interrupt_before=["ask"]
+    )
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 1000000000}
+
+    async def run():
+        len([c async for c in graph.astream({"count": 0}, config=config)])
+        for _ in range(100):
+            len([c async for c in graph.astream(None, config=config)])
+
+    uvloop.install()
+    asyncio.run(run())
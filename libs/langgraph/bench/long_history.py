@@ -0,0 +1,61 @@
+from langchain_core.messages import AIMessage, HumanMessage
+
+from langgraph.constants import END, START
+from langgraph.graph.message import MessagesState
+from langgraph.graph.state import StateGraph
+
+
+def long_history(n_turns: int) -> StateGraph:
+    """A conversation that appends one message per step for `n_turns` steps,
+    on top of a long history, so that merging updates into the history
+    dominates."""
+
+    async def respond(state: MessagesState) -> dict:
+        return {"messages": [AIMessage(f"reply {len(state['messages'])}")]}
+
+    def should_continue(state: MessagesState) -> str:
+        return "respond" if len(state["messages"]) < n_turns else END
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "respond")
+    builder.add_conditional_edges("respond", should_continue)
+    return builder
+
+
+def long_history_sync(n_turns: int) -> StateGraph:
+    def respond(state: MessagesState) -> dict:
+        return {"messages": [AIMessage(f"reply {len(state['messages'])}")]}
+
+    def should_continue(state: MessagesState) -> str:
+        return "respond" if len(state["messages"]) < n_turns else END
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "respond")
+    builder.add_conditional_edges("respond", should_continue)
+    return builder
+
+
+def long_history_input(n_messages: int) -> dict:
+    return {
+        "messages": [HumanMessage(f"message {i}", id=str(i)) for i in range(n_messages)]
+    }
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    graph = long_history(2100).compile(checkpointer=MemorySaver())
+    input = long_history_input(2000)
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 1000000000}
+
+    async def run():
+        len([c async for c in graph.astream(input, config=config)])
+
+    uvloop.install()
+    asyncio.run(run())
@@ -0,0 +1,60 @@
+import operator
+from typing import Annotated, TypedDict
+
+from langgraph.constants import END, START, Send
+from langgraph.graph.state import StateGraph
+
+
+def map_reduce(n_items: int) -> StateGraph:
+    """A single step fanning out to `n_items` cheap Send tasks, whose results
+    are reduced into one list, so that the cost of preparing tasks dominates."""
+
+    class State(TypedDict):
+        results: Annotated[list[int], operator.add]
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("square", i) for i in range(n_items)]
+
+    async def square(item: int) -> dict:
+        return {"results": [item * item]}
+
+    builder = StateGraph(State)
+    builder.add_node("square", square)
+    builder.add_conditional_edges(START, fan_out, ["square"])
+    builder.add_edge("square", END)
+    return builder
+
+
+def map_reduce_sync(n_items: int) -> StateGraph:
+    class State(TypedDict):
+        results: Annotated[list[int], operator.add]
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("square", i) for i in range(n_items)]
+
+    def square(item: int) -> dict:
+        return {"results": [item * item]}
+
+    builder = StateGraph(State)
+    builder.add_node("square", square)
+    builder.add_conditional_edges(START, fan_out, ["square"])
+    builder.add_edge("square", END)
+    return builder
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    graph = map_reduce(10000).compile(checkpointer=MemorySaver())
+    input = {"results": []}
+    config = {"configurable": {"thread_id": "1"}}
+
+    async def run():
+        len([c async for c in graph.astream(input, config=config)])
+
+    uvloop.install()
+    asyncio.run(run())
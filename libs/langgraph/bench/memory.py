@@ -0,0 +1,86 @@
+"""Memory footprint of graph runs, measured with tracemalloc: the peak memory
+allocated while compiling and running a graph, and the memory still allocated
+once the graph and its checkpointer are released, which should stay close to
+zero, as anything retained accumulates in long-running workers.
+
+    python -m bench.memory [-o out/memory.json] [--compare out/memory-baseline.json]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from bench.long_history import long_history_input, long_history_sync
+from bench.map_reduce import map_reduce_sync
+from bench.nested_subgraphs import nested_subgraphs_sync
+from bench.savers import new_config
+from bench.sequential import sequential_sync
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph.state import StateGraph
+
+# (name, graph, input)
+scenarios: tuple[tuple[str, Callable[[], StateGraph], Any], ...] = (
+    ("sequential_1000x", lambda: sequential_sync(1000), {"count": 0}),
+    (
+        "long_history_2000x100",
+        lambda: long_history_sync(2100),
+        long_history_input(2000),
+    ),
+    ("map_reduce_1000x", lambda: map_reduce_sync(1000), {"results": []}),
+    ("nested_subgraphs_4x25", lambda: nested_subgraphs_sync(4, 25), {"count": 0}),
+)
+
+
+def measure(build: Callable[[], StateGraph], input: Any, checkpoint: bool) -> dict:
+    """Peak and retained bytes of compiling and running a graph once."""
+
+    def run() -> None:
+        graph = build().compile(checkpointer=MemorySaver() if checkpoint else None)
+        for _ in graph.stream(input, new_config()):
+            pass
+
+    # warm up, so that lazy imports and caches aren't counted as retained
+    run()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak": peak - start, "retained": retained - start}
+
+
+def main(output: Optional[str], compare: Optional[str]) -> None:
+    baseline = {}
+    if compare is not None:
+        with open(compare) as f:
+            baseline = json.load(f)
+    results = {}
+    for name, build, input in scenarios:
+        for checkpoint in (False, True):
+            key = f"{name}_checkpoint" if checkpoint else name
+            results[key] = measure(build, input, checkpoint)
+            line = f"{key:40} peak {results[key]['peak'] / 1024:12.1f} KiB"
+            line += f"  retained {results[key]['retained'] / 1024:10.1f} KiB"
+            if key in baseline:
+                for metric in ("peak", "retained"):
+                    delta = results[key][metric] - baseline[key][metric]
+                    line += f"  {metric} {delta / 1024:+.1f} KiB"
+            print(line)
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-o", "--output", help="save the results as JSON")
+    parser.add_argument("--compare", help="JSON results to compare against")
+    args = parser.parse_args()
+    main(args.output, args.compare)
@@ -0,0 +1,70 @@
+from typing import Any, Callable, TypedDict
+
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+
+
+class State(TypedDict):
+    count: int
+
+
+def nested_subgraphs(depth: int, n_loops: int) -> StateGraph:
+    """`depth` levels of subgraphs, each running a step before and after the next
+    level, run `n_loops` times, so that entering subgraphs and namespacing their
+    checkpoints dominates."""
+
+    async def step(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    def should_continue(state: State) -> str:
+        return "before" if state["count"] < n_loops * 2 * depth else END
+
+    builder = _level(depth, step)
+    builder.add_conditional_edges("after", should_continue)
+    return builder
+
+
+def nested_subgraphs_sync(depth: int, n_loops: int) -> StateGraph:
+    def step(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    def should_continue(state: State) -> str:
+        return "before" if state["count"] < n_loops * 2 * depth else END
+
+    builder = _level(depth, step)
+    builder.add_conditional_edges("after", should_continue)
+    return builder
+
+
+def _level(depth: int, step: Callable[[State], Any]) -> StateGraph:
+    builder = StateGraph(State)
+    builder.add_node("before", step)
+    builder.add_node("after", step)
+    builder.add_edge(START, "before")
+    if depth > 1:
+        subgraph = _level(depth - 1, step)
+        subgraph.add_edge("after", END)
+        builder.add_node("subgraph", subgraph.compile())
+        builder.add_edge("before", "subgraph")
+        builder.add_edge("subgraph", "after")
+    else:
+        builder.add_edge("before", "after")
+    return builder
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    graph = nested_subgraphs(4, 25).compile(checkpointer=MemorySaver())
+    input = {"count": 0}
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 1000000000}
+
+    async def run():
+        len([c async for c in graph.astream(input, config=config)])
+
+    uvloop.install()
+    asyncio.run(run())
@@ -0,0 +1,157 @@
+from contextlib import asynccontextmanager, contextmanager
+from time import perf_counter
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+from uuid import uuid4
+
+from uvloop import new_event_loop
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.duckdb import DuckDBSaver
+from langgraph.checkpoint.duckdb.aio import AsyncDuckDBSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.pregel import Pregel
+
+SAVERS = ("memory", "sqlite", "duckdb")
+
+Build = Callable[[BaseCheckpointSaver], Pregel]
+Run = Callable[[Pregel, dict, Any], None]
+ARun = Callable[[Pregel, dict, Any], Awaitable[None]]
+
+
+@contextmanager
+def saver(kind: str) -> Iterator[BaseCheckpointSaver]:
+    """A new, empty, in-memory checkpointer of the given kind."""
+    if kind == "memory":
+        yield MemorySaver()
+    elif kind == "sqlite":
+        with SqliteSaver.from_conn_string(":memory:") as sqlite:
+            yield sqlite
+    elif kind == "duckdb":
+        with DuckDBSaver.from_conn_string(":memory:") as duckdb:
+            duckdb.setup()
+            yield duckdb
+    else:
+        raise ValueError(f"Unknown checkpointer {kind}")
+
+
+@asynccontextmanager
+async def asaver(kind: str) -> AsyncIterator[BaseCheckpointSaver]:
+    """A new, empty, in-memory async checkpointer of the given kind, bound to
+    the running event loop."""
+    if kind == "memory":
+        yield MemorySaver()
+    elif kind == "sqlite":
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as sqlite:
+            yield sqlite
+    elif kind == "duckdb":
+        async with AsyncDuckDBSaver.from_conn_string(":memory:") as duckdb:
+            await duckdb.setup()
+            yield duckdb
+    else:
+        raise ValueError(f"Unknown checkpointer {kind}")
+
+
+def new_config() -> dict:
+    return {
+        "configurable": {"thread_id": str(uuid4())},
+        "recursion_limit": 1000000000,
+    }
+
+
+def time_sync(
+    loops: int,
+    build: Build,
+    kind: str,
+    input: Any,
+    run: Run,
+    prepare: Optional[Run] = None,
+) -> float:
+    """pyperf time function, running a graph with a new checkpointer each loop.
+    Only `run` is timed, compiling the graph and `prepare` are not."""
+    elapsed = 0.0
+    for _ in range(loops):
+        with saver(kind) as checkpointer:
+            graph = build(checkpointer)
+            config = new_config()
+            if prepare is not None:
+                prepare(graph, config, input)
+            start = perf_counter()
+            run(graph, config, input)
+            elapsed += perf_counter() - start
+    return elapsed
+
+
+def time_async(
+    loops: int,
+    build: Build,
+    kind: str,
+    input: Any,
+    run: ARun,
+    prepare: Optional[ARun] = None,
+) -> float:
+    """Same as `time_sync`, for async runs, in a new uvloop event loop."""
+
+    async def main() -> float:
+        elapsed = 0.0
+        for _ in range(loops):
+            async with asaver(kind) as checkpointer:
+                graph = build(checkpointer)
+                config = new_config()
+                if prepare is not None:
+                    await prepare(graph, config, input)
+                start = perf_counter()
+                await run(graph, config, input)
+                elapsed += perf_counter() - start
+        return elapsed
+
+    loop = new_event_loop()
+    try:
+        return loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+def stream(graph: Pregel, config: dict, input: Any) -> None:
+    for _ in graph.stream(input, config):
+        pass
+
+
+async def astream(graph: Pregel, config: dict, input: Any) -> None:
+    async for _ in graph.astream(input, config):
+        pass
+
+
+def resume(n_cycles: int, graph: Pregel, config: dict, input: Any) -> None:
+    stream(graph, config, input)
+    for _ in range(n_cycles):
+        stream(graph, config, None)
+
+
+async def aresume(n_cycles: int, graph: Pregel, config: dict, input: Any) -> None:
+    await astream(graph, config, input)
+    for _ in range(n_cycles):
+        await astream(graph, config, None)
+
+
+def state_history(graph: Pregel, config: dict, input: Any) -> None:
+    for _ in graph.get_state_history(config):
+        pass
+
+
+async def astate_history(graph: Pregel, config: dict, input: Any) -> None:
+    async for _ in graph.aget_state_history(config):
+        pass
+
+
+def update_state(n_updates: int, graph: Pregel, config: dict, input: Any) -> None:
+    for i in range(n_updates):
+        graph.update_state(config, {"count": i}, as_node="step")
+
+
+async def aupdate_state(
+    n_updates: int, graph: Pregel, config: dict, input: Any
+) -> None:
+    for i in range(n_updates):
+        await graph.aupdate_state(config, {"count": i}, as_node="step")
@@ -0,0 +1,57 @@
+from typing import TypedDict
+
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+
+
+class State(TypedDict):
+    count: int
+
+
+def sequential(n_steps: int) -> StateGraph:
+    """A single node looping on itself for `n_steps` steps, so that the per-step
+    overhead of the loop and the checkpointer dominates."""
+
+    async def step(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    def should_continue(state: State) -> str:
+        return "step" if state["count"] < n_steps else END
+
+    builder = StateGraph(State)
+    builder.add_node("step", step)
+    builder.add_edge(START, "step")
+    builder.add_conditional_edges("step", should_continue)
+    return builder
+
+
+def sequential_sync(n_steps: int) -> StateGraph:
+    def step(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    def should_continue(state: State) -> str:
+        return "step" if state["count"] < n_steps else END
+
+    builder = StateGraph(State)
+    builder.add_node("step", step)
+    builder.add_edge(START, "step")
+    builder.add_conditional_edges("step", should_continue)
+    return builder
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    graph = sequential(10000).compile(checkpointer=MemorySaver())
+    input = {"count": 0}
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 1000000000}
+
+    async def run():
+        len([c async for c in graph.astream(input, config=config)])
+
+    uvloop.install()
+    asyncio.run(run())
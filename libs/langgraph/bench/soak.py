@@ -0,0 +1,106 @@
+"""Run a graph with subgraphs, interrupts and retries many times in one process,
+and fail if the memory still allocated after each batch of runs keeps growing,
+or if module-level state isn't cleaned up after runs.
+
+    python -m bench.soak [--runs 100000] [--max-growth 1048576]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from typing import TypedDict
+from uuid import uuid4
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.constants import END, START
+from langgraph.errors import _SEEN_CHECKPOINT_NS
+from langgraph.graph.state import StateGraph
+from langgraph.pregel import Pregel
+from langgraph.types import RetryPolicy
+
+
+class State(TypedDict):
+    count: int
+
+
+class Flaky(Exception):
+    pass
+
+
+def soak_graph() -> Pregel:
+    """A graph with a node failing on its first attempt, a subgraph with its
+    own checkpoints, and an interrupt before its last node."""
+    attempts = {"n": 0}
+
+    def flaky(state: State) -> dict:
+        attempts["n"] += 1
+        if attempts["n"] % 2:
+            raise Flaky()
+        return {"count": state["count"] + 1}
+
+    def step(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    subgraph = StateGraph(State)
+    subgraph.add_node("inner", step)
+    subgraph.add_edge(START, "inner")
+    subgraph.add_edge("inner", END)
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "flaky",
+        flaky,
+        retry=RetryPolicy(initial_interval=0, jitter=False, retry_on=Flaky),
+    )
+    builder.add_node("subgraph", subgraph.compile())
+    builder.add_node("last", step)
+    builder.add_edge(START, "flaky")
+    builder.add_edge("flaky", "subgraph")
+    builder.add_edge("subgraph", "last")
+    builder.add_edge("last", END)
+    return builder.compile(interrupt_before=["last"])
+
+
+def run(graph: Pregel) -> None:
+    # a new checkpointer for each run, so that only leaks are retained
+    graph = graph.copy({"checkpointer": MemorySaver()})
+    config = {"configurable": {"thread_id": str(uuid4())}}
+    for _ in graph.stream({"count": 0}, config):
+        pass
+    # resume after the interrupt
+    for _ in graph.stream(None, config):
+        pass
+    assert graph.get_state(config).values == {"count": 3}
+
+
+def main(runs: int, max_growth: int) -> None:
+    graph = soak_graph()
+    # warm up, so that lazy imports and caches aren't counted as retained
+    for _ in range(100):
+        run(graph)
+    gc.collect()
+    tracemalloc.start()
+    samples = []
+    for i in range(1, runs + 1):
+        run(graph)
+        if i % max(runs // 10, 1) == 0:
+            gc.collect()
+            samples.append(tracemalloc.get_traced_memory()[0])
+            print(f"{i:8} runs  retained {samples[-1] / 1024:10.1f} KiB")
+    tracemalloc.stop()
+    if _SEEN_CHECKPOINT_NS:
+        sys.exit(f"{len(_SEEN_CHECKPOINT_NS)} subgraph namespaces left after runs")
+    if samples[-1] - samples[0] > max_growth:
+        sys.exit(
+            f"Retained memory grew by {samples[-1] - samples[0]} bytes "
+            f"over {runs} runs, more than {max_growth}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=100_000)
+    parser.add_argument("--max-growth", type=int, default=1024 * 1024)
+    args = parser.parse_args()
+    main(args.runs, args.max_growth)
@@ -0,0 +1,175 @@
+"""Database size, put latency by step and read latency of SqliteSaver over long
+threads, storing each channel value once per version in `checkpoint_blobs`, and
+growing lists as the items appended to their previous version, compared to
+storing all channel values inline in every checkpoint, as done before.
+
+    python -m bench.sqlite_storage [--steps 500] [--threads 4]
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import tempfile
+from contextlib import closing
+from time import perf_counter
+from typing import Annotated, Any, TypedDict
+
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage
+
+from bench.savers import new_config
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+)
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.constants import END, START
+from langgraph.graph.message import add_messages
+from langgraph.graph.state import StateGraph
+
+
+class InlineSqliteSaver(SqliteSaver):
+    """Saves the values of all channels inline with every checkpoint."""
+
+    def put(
+        self,
+        config: Any,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> Any:
+        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        with self.cursor() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(config["configurable"]["thread_id"]),
+                    config["configurable"]["checkpoint_ns"],
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    serialized_checkpoint,
+                    self.jsonplus_serde.dumps(metadata),
+                ),
+            )
+        return {
+            "configurable": {
+                "thread_id": config["configurable"]["thread_id"],
+                "checkpoint_ns": config["configurable"]["checkpoint_ns"],
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+
+class State(TypedDict):
+    messages: Annotated[list[AnyMessage], add_messages]
+    # written once, by the input
+    documents: list[str]
+    turns: int
+
+
+def conversation(n_steps: int) -> StateGraph:
+    """A conversation appending one message per step, next to a large channel
+    which is never updated after the input."""
+
+    def respond(state: State) -> dict:
+        return {
+            "messages": [AIMessage(f"reply {state['turns']} " + "x" * 200)],
+            "turns": state["turns"] + 1,
+        }
+
+    def should_continue(state: State) -> str:
+        return "respond" if state["turns"] < n_steps else END
+
+    builder = StateGraph(State)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "respond")
+    builder.add_conditional_edges("respond", should_continue)
+    return builder
+
+
+def measure(saver_cls: type[SqliteSaver], n_steps: int, n_threads: int) -> dict:
+    """Run `n_threads` threads of `n_steps` steps, returning the size of the
+    database, the latencies of the puts of each thread, and the latencies of
+    getting the last checkpoint and of listing the last 200 checkpoints of each
+    thread, in seconds."""
+    latencies: list[list[float]] = []
+    get_latencies: list[float] = []
+    list_latencies: list[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "checkpoints.sqlite")
+        with closing(sqlite3.connect(path, check_same_thread=False)) as conn:
+            saver = saver_cls(conn)
+            put = saver.put
+
+            def timed_put(*args: Any) -> Any:
+                start = perf_counter()
+                try:
+                    return put(*args)
+                finally:
+                    latencies[-1].append(perf_counter() - start)
+
+            saver.put = timed_put  # type: ignore[method-assign]
+            graph = conversation(n_steps).compile(checkpointer=saver)
+            input = {
+                "messages": [HumanMessage("hi")],
+                "documents": [f"document {i} " + "y" * 1000 for i in range(20)],
+                "turns": 0,
+            }
+            configs = [new_config() for _ in range(n_threads)]
+            for config in configs:
+                latencies.append([])
+                graph.invoke(input, config)
+            for config in configs:
+                for _ in range(10):
+                    start = perf_counter()
+                    saver.get_tuple(config)
+                    get_latencies.append(perf_counter() - start)
+                start = perf_counter()
+                for _ in saver.list(config, limit=200):
+                    pass
+                list_latencies.append(perf_counter() - start)
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        size = os.path.getsize(path)
+    return {
+        "size": size,
+        "latencies": latencies,
+        "get_latencies": get_latencies,
+        "list_latencies": list_latencies,
+    }
+
+
+def by_step(latencies: list[list[float]], n_buckets: int = 5) -> list[str]:
+    """The mean latency of the puts of each range of steps, across threads."""
+    n_puts = max(len(thread) for thread in latencies)
+    width = max(n_puts // n_buckets, 1)
+    return [
+        f"{start:>5}-{min(start + width, n_puts):<5}"
+        f" {statistics.mean(t for thread in latencies for t in thread[start : start + width]) * 1e6:8.0f} us"
+        for start in range(0, n_puts, width)
+    ]
+
+
+def main(n_steps: int, n_threads: int) -> None:
+    for name, saver_cls in (("inline", InlineSqliteSaver), ("blobs", SqliteSaver)):
+        result = measure(saver_cls, n_steps, n_threads)
+        latencies = sorted(t for thread in result["latencies"] for t in thread)
+        print(
+            f"{name:8} size {result['size'] / 2**20:8.1f} MiB"
+            f"  put mean {statistics.mean(latencies) * 1e6:8.0f} us"
+            f"  p50 {latencies[len(latencies) // 2] * 1e6:8.0f} us"
+            f"  p99 {latencies[int(len(latencies) * 0.99)] * 1e6:8.0f} us"
+            f"  get mean {statistics.mean(result['get_latencies']) * 1e3:6.1f} ms"
+            f"  list(200) mean {statistics.mean(result['list_latencies']):6.2f} s"
+        )
+        # should stay flat as threads grow, if puts don't depend on their length
+        print("         put mean by step " + "  ".join(by_step(result["latencies"])))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+    main(args.steps, args.threads)
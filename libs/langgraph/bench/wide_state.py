@@ -1,7 +1,7 @@
 import operator
 from dataclasses import dataclass, field
 from functools import partial
-from typing import Annotated, Optional, Sequence
+from typing import Annotated, Optional, Sequence, TypedDict
 
 from langgraph.constants import END, START
 from langgraph.graph.state import StateGraph
@@ -111,6 +111,35 @@ def wide_state(n: int) -> StateGraph:
     return builder
 
 
+def wide_state_keys(n_keys: int, n_steps: int) -> StateGraph:
+    """A state with `n_keys` keys, half of them reducers, where each step writes
+    to a single key."""
+    State = TypedDict(  # type: ignore[misc]
+        "State",
+        {
+            "count": int,
+            **{
+                f"key_{i}": Annotated[list, operator.add] if i % 2 else Optional[str]
+                for i in range(n_keys)
+            },
+        },
+    )
+
+    def write_one(state: State) -> dict:
+        count = state["count"]
+        key = f"key_{count % n_keys}"
+        return {"count": count + 1, key: [count] if count % n_keys % 2 else str(count)}
+
+    builder = StateGraph(State)
+    builder.add_node("write_one", write_one)
+    builder.add_edge(START, "write_one")
+    builder.add_conditional_edges(
+        "write_one", lambda state: END if state["count"] >= n_steps else "write_one"
+    )
+
+    return builder
+
+
 if __name__ == "__main__":
     import asyncio
 
@@ -1,17 +1,33 @@
+from typing import TYPE_CHECKING, Any
+
 from langgraph.channels.any_value import AnyValue
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
 from langgraph.channels.ephemeral_value import EphemeralValue
 from langgraph.channels.last_value import LastValue
-from langgraph.channels.topic import Topic
+from langgraph.channels.topic import AppendOnlyTopic, Topic
 from langgraph.channels.untracked_value import UntrackedValue
 
+if TYPE_CHECKING:
+    from langgraph.channels.messages import MessagesChannel
+
 __all__ = [
     "LastValue",
     "Topic",
+    "AppendOnlyTopic",
     "Context",
     "BinaryOperatorAggregate",
+    "MessagesChannel",
     "UntrackedValue",
     "EphemeralValue",
     "AnyValue",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # imported on first use, as it imports langchain_core messages
+    if name == "MessagesChannel":
+        from langgraph.channels.messages import MessagesChannel
+
+        return MessagesChannel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -27,6 +27,14 @@ class BaseChannel(Generic[Value, Update, C], ABC):
     def UpdateType(self) -> Any:
         """The type of the update received by the channel."""
 
+    @property
+    def notify_on_new_step(self) -> bool:
+        """Whether `update` must be called with an empty sequence at the end of
+        each step in which the channel received no updates, eg. to clear a value
+        that should only last for one step. Channels that are never changed by an
+        empty update should return False, to be skipped by Pregel."""
+        return True
+
     # serialize/deserialize methods
 
     def checkpoint(self) -> Optional[C]:
@@ -40,6 +48,16 @@ class BaseChannel(Generic[Value, Update, C], ABC):
         """Return a new identical channel, optionally initialized from a checkpoint.
         If the checkpoint contains complex data structures, they should be copied."""
 
+    def copy(self) -> Self:
+        """Return a new identical channel, with the same value, that can be updated
+        without affecting this one. By default, goes through `checkpoint()` and
+        `from_checkpoint()`, subclasses can override it with a cheaper copy."""
+        try:
+            checkpoint = self.checkpoint()
+        except EmptyChannelError:
+            checkpoint = None
+        return self.from_checkpoint(checkpoint)
+
     # state methods
 
     @abstractmethod
@@ -47,7 +65,8 @@ class BaseChannel(Generic[Value, Update, C], ABC):
         """Update the channel's value with the given sequence of updates.
         The order of the updates in the sequence is arbitrary.
         This method is called by Pregel for all channels at the end of each step.
-        If there are no updates, it is called with an empty sequence.
+        If there are no updates, it is called with an empty sequence, unless
+        `notify_on_new_step` is False.
         Raises InvalidUpdateError if the sequence of updates is invalid.
         Returns True if the channel was updated, False otherwise."""
 
@@ -1,5 +1,8 @@
 import collections.abc
+import copy
+import operator
 from typing import (
+    Any,
     Callable,
     Generic,
     Optional,
@@ -24,6 +27,24 @@ def _strip_extras(t):  # type: ignore[no-untyped-def]
     return t
 
 
+# in-place forms of built-in operators, per type of value they apply to, with
+# the types of updates they accept
+_INPLACE: dict[
+    Callable, dict[type, tuple[tuple[type, ...], Callable[[Any, Any], Any]]]
+] = {
+    operator.add: {list: ((list,), list.extend)},
+    operator.iadd: {list: ((list,), list.extend)},
+    operator.or_: {
+        dict: ((dict,), dict.update),
+        set: ((set, frozenset), set.update),
+    },
+    operator.ior: {
+        dict: ((dict,), dict.update),
+        set: ((set, frozenset), set.update),
+    },
+}
+
+
 class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
     """Stores the result of applying a binary operator to the current value and each new value.
 
@@ -32,13 +53,24 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
 
     total = Channels.BinaryOperatorAggregate(int, operator.add)
     ```
+
+    Operators can declare faster forms, as attributes of the function:
+    - `batch(value, updates) -> value`: folds all the updates of a step at once.
+    - `inplace(value, update) -> None`: applies an update by mutating the value.
+        The value is copied first if it was read since it was last copied,
+        so values returned by `get()` never change.
+
+    `operator.add` on lists and `operator.or_` on dicts and sets are applied
+    in place.
     """
 
-    __slots__ = ("value", "operator")
+    __slots__ = ("value", "operator", "shared")
 
     def __init__(self, typ: Type[Value], operator: Callable[[Value, Value], Value]):
         super().__init__(typ)
         self.operator = operator
+        # whether the value may be referenced outside the channel
+        self.shared = False
         # special forms from typing or collections.abc are not instantiable
         # so we need to replace them with their concrete counterparts
         typ = _strip_extras(typ)
@@ -71,11 +103,17 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
         """The type of the update received by the channel."""
         return self.typ
 
+    @property
+    def notify_on_new_step(self) -> bool:
+        """With no updates there is nothing to aggregate."""
+        return False
+
     def from_checkpoint(self, checkpoint: Optional[Value]) -> Self:
         empty = self.__class__(self.typ, self.operator)
         empty.key = self.key
         if checkpoint is not None:
             empty.value = checkpoint
+            empty.shared = True
         return empty
 
     def update(self, values: Sequence[Value]) -> bool:
@@ -83,13 +121,41 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
             return False
         if not hasattr(self, "value"):
             self.value = values[0]
+            self.shared = True
             values = values[1:]
+        if batch := getattr(self.operator, "batch", None):
+            self.value = batch(self.value, values)
+            self.shared = True
+            return True
+        inplace = getattr(self.operator, "inplace", None)
+        builtin = _INPLACE.get(self.operator)
         for value in values:
-            self.value = self.operator(self.value, value)
+            if inplace is not None:
+                self._own()
+                inplace(self.value, value)
+            elif (
+                builtin is not None
+                and (form := builtin.get(type(self.value))) is not None
+                and isinstance(value, form[0])
+            ):
+                self._own()
+                form[1](self.value, value)
+            else:
+                self.value = self.operator(self.value, value)
+                # the result may be one of the operands
+                self.shared = True
         return True
 
+    def _own(self) -> None:
+        """Copy the value before mutating it, if it may be referenced elsewhere."""
+        if self.shared:
+            self.value = copy.copy(self.value)
+            self.shared = False
+
     def get(self) -> Value:
         try:
-            return self.value
+            value = self.value
         except AttributeError:
             raise EmptyChannelError()
+        self.shared = True
+        return value
@@ -45,6 +45,11 @@ class DynamicBarrierValue(
         """The type of the update received by the channel."""
         return self.typ
 
+    @property
+    def notify_on_new_step(self) -> bool:
+        """Names seen are kept until the barrier is consumed."""
+        return False
+
     def checkpoint(self) -> tuple[Optional[set[Value]], set[Value]]:
         return (self.names, self.seen)
 
@@ -29,6 +29,11 @@ class LastValue(Generic[Value], BaseChannel[Value, Value, Value]):
         """The type of the update received by the channel."""
         return self.typ
 
+    @property
+    def notify_on_new_step(self) -> bool:
+        """An empty update leaves the last value in place."""
+        return False
+
     def from_checkpoint(self, checkpoint: Optional[Value]) -> Self:
         empty = self.__class__(self.typ)
         empty.key = self.key
@@ -0,0 +1,102 @@
+import uuid
+from typing import Any, Callable, Optional, Sequence, Type, cast
+
+from langchain_core.messages import (
+    AnyMessage,
+    BaseMessageChunk,
+    RemoveMessage,
+    convert_to_messages,
+    message_chunk_to_message,
+)
+from typing_extensions import Self
+
+from langgraph.channels.binop import BinaryOperatorAggregate
+
+
+def normalize_messages(messages: Any) -> list[AnyMessage]:
+    """Coerce a message or list of message-like values to a new list of
+    messages, converting chunks to messages and assigning missing ids."""
+    if not isinstance(messages, list):
+        messages = [messages]
+    normalized = [
+        message_chunk_to_message(cast(BaseMessageChunk, m))
+        for m in convert_to_messages(messages)
+    ]
+    for m in normalized:
+        if m.id is None:
+            m.id = str(uuid.uuid4())
+    return cast(list[AnyMessage], normalized)
+
+
+class MessagesChannel(BinaryOperatorAggregate[list[AnyMessage]]):
+    """Stores a list of messages merged with `add_messages`, with the same
+    results, but keeping the messages normalized along with an index of their
+    ids. Merging an update costs O(size of the update) instead of O(length of
+    the list), except for removals, which take a pass over the list per update.
+
+    The list returned by `get()` is never changed afterwards, it's copied before
+    the next update instead.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(
+        self, typ: Type[list[AnyMessage]], operator: Callable[[Any, Any], Any]
+    ):
+        super().__init__(typ, operator)
+        self.value: list[AnyMessage] = []
+        self.index: dict[str, int] = {}
+
+    def from_checkpoint(self, checkpoint: Optional[list[AnyMessage]]) -> Self:
+        empty = self.__class__(self.typ, self.operator)
+        empty.key = self.key
+        if checkpoint is not None:
+            empty.value = normalize_messages(checkpoint)
+            empty.index = {m.id: i for i, m in enumerate(empty.value)}  # type: ignore[misc]
+        return empty
+
+    def copy(self) -> Self:
+        # shares the list until either channel is updated
+        new = self.__class__(self.typ, self.operator)
+        new.key = self.key
+        new.value = self.value
+        new.index = self.index.copy()
+        new.shared = self.shared = True
+        return new
+
+    def update(self, values: Sequence[Any]) -> bool:
+        if not values:
+            return False
+        if self.shared:
+            self.value = self.value.copy()
+            self.shared = False
+        for value in values:
+            self._merge(normalize_messages(value))
+        return True
+
+    def _merge(self, right: list[AnyMessage]) -> None:
+        messages = self.value
+        # only messages present before this update are replaced or removed
+        existing = len(messages)
+        to_remove: set[str] = set()
+        for m in right:
+            idx = self.index.get(cast(str, m.id))
+            if idx is not None and idx < existing:
+                if isinstance(m, RemoveMessage):
+                    to_remove.add(cast(str, m.id))
+                else:
+                    messages[idx] = m
+            elif isinstance(m, RemoveMessage):
+                raise ValueError(
+                    f"Attempting to delete a message with an ID that doesn't exist ('{m.id}')"
+                )
+            else:
+                self.index[cast(str, m.id)] = len(messages)
+                messages.append(m)
+        if to_remove:
+            self.value = [m for m in messages if m.id not in to_remove]
+            self.index = {cast(str, m.id): i for i, m in enumerate(self.value)}
+
+    def get(self) -> list[AnyMessage]:
+        self.shared = True
+        return self.value
@@ -32,6 +32,11 @@ class NamedBarrierValue(Generic[Value], BaseChannel[Value, Value, set[Value]]):
         """The type of the update received by the channel."""
         return self.typ
 
+    @property
+    def notify_on_new_step(self) -> bool:
+        """Names seen so far are only reset by `consume()`."""
+        return False
+
     def checkpoint(self) -> set[Value]:
         return self.seen
 
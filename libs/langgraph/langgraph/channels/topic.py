@@ -1,4 +1,5 @@
-from typing import Any, Generic, Iterator, Optional, Sequence, Type, Union
+from itertools import islice
+from typing import Any, Generic, Iterator, Optional, Sequence, Type, Union, overload
 
 from typing_extensions import Self
 
@@ -49,6 +50,11 @@ class Topic(
         """The type of the update received by the channel."""
         return Union[self.typ, list[self.typ]]  # type: ignore[name-defined]
 
+    @property
+    def notify_on_new_step(self) -> bool:
+        """Only non-accumulating topics are emptied at the end of each step."""
+        return not self.accumulate
+
     def checkpoint(self) -> tuple[set[Value], list[Value]]:
         return self.values
 
@@ -75,3 +81,110 @@ class Topic(
             return list(self.values)
         else:
             raise EmptyChannelError
+
+
+class LogView(Sequence[Value]):
+    """Read-only view of the first `length` items of an append-only list.
+    As items are only ever appended to the list, the view never changes."""
+
+    __slots__ = ("items", "length")
+
+    def __init__(self, items: list[Value], length: int) -> None:
+        self.items = items
+        self.length = length
+
+    @overload
+    def __getitem__(self, index: int) -> Value: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Value]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Value, list[Value]]:
+        if isinstance(index, slice):
+            return self.items[: self.length][index]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("LogView index out of range")
+        return self.items[index]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[Value]:
+        return islice(self.items, self.length)
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, (list, tuple, LogView)):
+            return len(value) == self.length and all(
+                a == b for a, b in zip(self, value)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LogView({list(self)!r})"
+
+
+class AppendOnlyTopic(
+    Generic[Value],
+    BaseChannel[Sequence[Value], Union[Value, list[Value]], Sequence[Value]],
+):
+    """An accumulating Topic whose values are only ever appended to.
+
+    Unlike `Topic(typ, accumulate=True)`, updating it costs O(new values), and
+    reading it returns a read-only `LogView` of the values instead of a copy.
+
+    Args:
+        typ: The type of the value stored in the channel.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, typ: Type[Value]) -> None:
+        super().__init__(typ)
+        # state
+        self.values = list[Value]()
+
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, AppendOnlyTopic)
+
+    @property
+    def ValueType(self) -> Any:
+        """The type of the value stored in the channel."""
+        return Sequence[self.typ]  # type: ignore[name-defined]
+
+    @property
+    def UpdateType(self) -> Any:
+        """The type of the update received by the channel."""
+        return Union[self.typ, list[self.typ]]  # type: ignore[name-defined]
+
+    @property
+    def notify_on_new_step(self) -> bool:
+        """Values are never removed, so empty updates change nothing."""
+        return False
+
+    def checkpoint(self) -> Sequence[Value]:
+        # a view, as later updates only append values past its end
+        return LogView(self.values, len(self.values))
+
+    def from_checkpoint(self, checkpoint: Optional[Sequence[Value]]) -> Self:
+        empty = self.__class__(self.typ)
+        empty.key = self.key
+        if isinstance(checkpoint, LogView):
+            # the values of the view, not those appended to its list since
+            empty.values = checkpoint.items[: checkpoint.length]
+        elif checkpoint is not None:
+            # copied, as values are appended to it in place
+            empty.values = list(checkpoint)
+        return empty
+
+    def update(self, values: Sequence[Union[Value, list[Value]]]) -> bool:
+        length = len(self.values)
+        self.values.extend(flatten(values))
+        return len(self.values) != length
+
+    def get(self) -> Sequence[Value]:
+        if self.values:
+            return LogView(self.values, len(self.values))
+        else:
+            raise EmptyChannelError
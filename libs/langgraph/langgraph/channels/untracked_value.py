@@ -28,6 +28,11 @@ class UntrackedValue(Generic[Value], BaseChannel[Value, Value, Value]):
         """The type of the update received by the channel."""
         return self.typ
 
+    @property
+    def notify_on_new_step(self) -> bool:
+        """The value is kept until it is overwritten."""
+        return False
+
     def checkpoint(self) -> Value:
         raise EmptyChannelError()
 
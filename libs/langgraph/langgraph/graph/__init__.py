@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING, Any
+
 from langgraph.graph.graph import END, START, Graph
-from langgraph.graph.message import MessageGraph, MessagesState, add_messages
 from langgraph.graph.state import StateGraph
 
+if TYPE_CHECKING:
+    from langgraph.graph.message import MessageGraph, MessagesState, add_messages
+
 __all__ = [
     "END",
     "START",
@@ -11,3 +15,12 @@ __all__ = [
     "add_messages",
     "MessagesState",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # imported on first use, as they import langchain_core messages
+    if name in ("MessageGraph", "MessagesState", "add_messages"):
+        from langgraph.graph import message
+
+        return getattr(message, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -38,7 +38,7 @@ from langgraph.errors import InvalidUpdateError
 from langgraph.pregel import Channel, Pregel
 from langgraph.pregel.read import PregelNode
 from langgraph.pregel.write import ChannelWrite, ChannelWriteEntry
-from langgraph.types import All, Checkpointer
+from langgraph.types import All, Checkpointer, Durability
 from langgraph.utils.runnable import RunnableCallable, coerce_to_runnable
 
 logger = logging.getLogger(__name__)
@@ -409,6 +409,7 @@ class Graph:
         interrupt_before: Optional[Union[All, list[str]]] = None,
         interrupt_after: Optional[Union[All, list[str]]] = None,
         debug: bool = False,
+        durability: Optional[Durability] = None,
     ) -> "CompiledGraph":
         # assign default values
         interrupt_before = interrupt_before or []
@@ -437,6 +438,7 @@ class Graph:
             interrupt_after_nodes=interrupt_after,
             auto_validate=False,
             debug=debug,
+            durability=durability,
         )
 
         # attach nodes, edges, and branches
@@ -1,8 +1,10 @@
 import inspect
 import logging
+import sys
 import typing
 import warnings
-from functools import partial
+import weakref
+from functools import partial, update_wrapper
 from inspect import isclass, isfunction, ismethod, signature
 from typing import (
     Any,
@@ -26,6 +28,7 @@ from pydantic.v1 import BaseModel as BaseModelV1
 from typing_extensions import Self
 
 from langgraph._api.deprecation import LangGraphDeprecationWarning
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.dynamic_barrier_value import DynamicBarrierValue, WaitForNames
@@ -43,13 +46,18 @@ from langgraph.managed.base import (
     is_managed_value,
     is_writable_managed_value,
 )
+from langgraph.pregel.executor import run_in_process
 from langgraph.pregel.read import ChannelRead, PregelNode
 from langgraph.pregel.write import SKIP_WRITE, ChannelWrite, ChannelWriteEntry
 from langgraph.store.base import BaseStore
-from langgraph.types import All, Checkpointer, RetryPolicy
+from langgraph.types import All, CachePolicy, Checkpointer, Durability, RetryPolicy
 from langgraph.utils.fields import get_field_default
 from langgraph.utils.pydantic import create_model
-from langgraph.utils.runnable import coerce_to_runnable
+from langgraph.utils.runnable import (
+    coerce_to_runnable,
+    is_async_callable,
+    is_async_generator,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +79,10 @@ class StateNodeSpec(NamedTuple):
     metadata: Optional[dict[str, Any]]
     input: Type[Any]
     retry_policy: Optional[RetryPolicy]
+    cache_policy: Optional[CachePolicy] = None
+    max_concurrency: Optional[int] = None
+    concurrency_weight: int = 1
+    batched: Union[bool, Callable[[list[Any]], Sequence[Any]]] = False
 
 
 class StateGraph(Graph):
@@ -211,6 +223,11 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_concurrency: Optional[int] = None,
+        concurrency_weight: int = 1,
+        batch: Union[bool, Callable[[list[Any]], Sequence[Any]]] = False,
     ) -> Self:
         """Adds a new node to the state graph.
         Will take the name of the function/runnable as the node name.
@@ -235,6 +252,11 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_concurrency: Optional[int] = None,
+        concurrency_weight: int = 1,
+        batch: Union[bool, Callable[[list[Any]], Sequence[Any]]] = False,
     ) -> Self:
         """Adds a new node to the state graph.
 
@@ -258,6 +280,11 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_concurrency: Optional[int] = None,
+        concurrency_weight: int = 1,
+        batch: Union[bool, Callable[[list[Any]], Sequence[Any]]] = False,
     ) -> Self:
         """Adds a new node to the state graph.
 
@@ -269,6 +296,11 @@ class StateGraph(Graph):
             metadata (Optional[dict[str, Any]]): The metadata associated with the node. (default: None)
             input (Optional[Type[Any]]): The input schema for the node. (default: the graph's input schema)
             retry (Optional[RetryPolicy]): The policy for retrying the node. (default: None)
+            cache_policy (Optional[CachePolicy]): The policy for caching the node's results. Only used if the graph is compiled with a cache. (default: None)
+            executor (Literal["thread", "process"]): Where to run the node. Use "process" for CPU-bound sync functions, which then run in a shared process pool. They must be defined at the top level of a module, accept only the node input, and their input and output must be picklable. (default: "thread")
+            max_concurrency (Optional[int]): The maximum number of tasks of this node to run concurrently, eg. when fanned out with `Send`. Can be overridden per run with `config["configurable"]["max_node_concurrency"]`, which only applies to the nodes of the invoked graph, not to those of its subgraphs. (default: None)
+            concurrency_weight (int): The number of slots of the run's `max_concurrency` each task of this node takes up. (default: 1)
+            batch (Union[bool, Callable[[list[Any]], Sequence[Any]]]): Run the `Send` tasks of this node in the same step with a single call, instead of one task each. If True, the node's runnable is called with `batch`/`abatch`. If a function, it's called with the list of inputs and must return a list of outputs in the same order, an output can be an exception to fail only that task. Tasks that fail are retried individually if the node has a retry policy. (default: False)
         Raises:
             ValueError: If the key is already being used as a state key.
 
@@ -338,15 +370,31 @@ class StateGraph(Graph):
                     f"'{character}' is a reserved character and is not allowed in the node names."
                 )
 
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency of node '{node}' must be at least 1")
+        if concurrency_weight < 1:
+            raise ValueError(f"concurrency_weight of node '{node}' must be at least 1")
+
         if input is None:
             input = _get_input_schema_from_type_hint(action)
         if input is not None:
             self._add_schema(input)
+        if executor == "process":
+            action = _process_action(cast(str, node), action)
+        elif executor != "thread":
+            raise ValueError(
+                f"Invalid executor '{executor}' for node '{node}', "
+                "expected 'thread' or 'process'"
+            )
         self.nodes[cast(str, node)] = StateNodeSpec(
             coerce_to_runnable(action, name=cast(str, node), trace=False),
             metadata,
             input=input or self.schema,
             retry_policy=retry,
+            cache_policy=cache_policy,
+            max_concurrency=max_concurrency,
+            concurrency_weight=concurrency_weight,
+            batched=batch,
         )
         return self
 
@@ -391,6 +439,8 @@ class StateGraph(Graph):
         checkpointer: Checkpointer = None,
         *,
         store: Optional[BaseStore] = None,
+        cache: Optional[BaseCache] = None,
+        durability: Optional[Durability] = None,
         interrupt_before: Optional[Union[All, list[str]]] = None,
         interrupt_after: Optional[Union[All, list[str]]] = None,
         debug: bool = False,
@@ -404,6 +454,10 @@ class StateGraph(Graph):
             checkpointer (Checkpointer): An optional checkpoint saver object.
                 This serves as a fully versioned "memory" for the graph, allowing
                 the graph to be paused and resumed, and replayed from any point.
+            cache (Optional[BaseCache]): An optional cache for the results of nodes
+                with a cache policy.
+            durability (Optional[Durability]): When to save checkpoints, "sync",
+                "async" (the default) or "exit". Can be overridden for each run.
             interrupt_before (Optional[Sequence[str]]): An optional list of node names to interrupt before.
             interrupt_after (Optional[Sequence[str]]): An optional list of node names to interrupt after.
             debug (bool): A flag indicating whether to enable debug mode.
@@ -462,6 +516,8 @@ class StateGraph(Graph):
             auto_validate=False,
             debug=debug,
             store=store,
+            cache=cache,
+            durability=durability,
         )
 
         compiled.attach_node(START, None)
@@ -487,22 +543,25 @@ class CompiledStateGraph(CompiledGraph):
     def get_input_schema(
         self, config: Optional[RunnableConfig] = None
     ) -> type[BaseModel]:
-        return _get_schema(
-            typ=self.builder.input,
-            schemas=self.builder.schemas,
-            channels=self.builder.channels,
-            name=self.get_name("Input"),
-        )
+        return self._get_schema(self.builder.input, self.get_name("Input"))
 
     def get_output_schema(
         self, config: Optional[RunnableConfig] = None
     ) -> type[BaseModel]:
-        return _get_schema(
-            typ=self.builder.output,
-            schemas=self.builder.schemas,
-            channels=self.builder.channels,
-            name=self.get_name("Output"),
-        )
+        return self._get_schema(self.builder.output, self.get_name("Output"))
+
+    def _get_schema(self, typ: Type[Any], name: str) -> type[BaseModel]:
+        """Create the pydantic model of a schema on first use, then reuse it."""
+        # kept out of the instance attributes, which copy() passes to __init__
+        cache = _SCHEMA_CACHE.setdefault(self, {})
+        if (typ, name) not in cache:
+            cache[(typ, name)] = _get_schema(
+                typ=typ,
+                schemas=self.builder.schemas,
+                channels=self.builder.channels,
+                name=name,
+            )
+        return cache[(typ, name)]
 
     def attach_node(self, key: str, node: Optional[StateNodeSpec]) -> None:
         if key == START:
@@ -583,6 +642,10 @@ class CompiledStateGraph(CompiledGraph):
                 ],
                 metadata=node.metadata,
                 retry_policy=node.retry_policy,
+                cache_policy=node.cache_policy,
+                max_concurrency=node.max_concurrency,
+                concurrency_weight=node.concurrency_weight,
+                batched=node.batched,
                 bound=node.runnable,
             )
         else:
@@ -697,8 +760,39 @@ def _coerce_state(schema: Type[Any], input: dict[str, Any]) -> dict[str, Any]:
     return schema(**input)
 
 
+# pydantic models of the input and output schemas of each compiled graph
+_SCHEMA_CACHE: weakref.WeakKeyDictionary[
+    CompiledStateGraph, dict[tuple[Any, str], type[BaseModel]]
+] = weakref.WeakKeyDictionary()
+
+# channels and managed values of each state schema, without their copies
+_CHANNELS_CACHE: weakref.WeakKeyDictionary[
+    Any, tuple[dict[str, BaseChannel], dict[str, ManagedValueSpec]]
+] = weakref.WeakKeyDictionary()
+
+
 def _get_channels(
     schema: Type[dict],
+) -> tuple[dict[str, BaseChannel], dict[str, ManagedValueSpec]]:
+    """Get the channels and managed values of a state schema, introspecting each
+    schema only once, and returning new channels for each graph."""
+    try:
+        cached = _CHANNELS_CACHE.get(schema)
+    except TypeError:
+        # schema can't be weakly referenced, eg. an Annotated type
+        cached = None
+    if cached is None:
+        cached = _introspect_channels(schema)
+        try:
+            _CHANNELS_CACHE[schema] = cached
+        except TypeError:
+            pass
+    channels, managed = cached
+    return {k: v.from_checkpoint(None) for k, v in channels.items()}, dict(managed)
+
+
+def _introspect_channels(
+    schema: Type[dict],
 ) -> tuple[dict[str, BaseChannel], dict[str, ManagedValueSpec]]:
     if not hasattr(schema, "__annotations__"):
         return {"__root__": _get_channel("__root__", schema, allow_managed=False)}, {}
@@ -765,6 +859,12 @@ def _is_field_binop(typ: Type[Any]) -> Optional[BinaryOperatorAggregate]:
             if len(params) == 2 and all(
                 p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params
             ):
+                # add_messages can only be used if its module was imported
+                message = sys.modules.get("langgraph.graph.message")
+                if message is not None and meta[0] is message.add_messages:
+                    from langgraph.channels.messages import MessagesChannel
+
+                    return MessagesChannel(typ, meta[0])
                 return BinaryOperatorAggregate(typ, meta[0])
             else:
                 raise ValueError(
@@ -825,6 +925,26 @@ def _get_schema(
             )
 
 
+def _process_action(node: str, action: RunnableLike) -> RunnableLike:
+    if (
+        isinstance(action, Runnable)
+        or not callable(action)
+        or is_async_callable(action)
+        or is_async_generator(action)
+        or inspect.isgeneratorfunction(action)
+    ):
+        raise ValueError(
+            f"Node '{node}' can't use executor='process', "
+            "only sync functions can run in a process pool"
+        )
+    if len(inspect.signature(action).parameters) != 1:
+        raise ValueError(
+            f"Node '{node}' can't use executor='process', "
+            "functions run in a process pool must accept only the node input"
+        )
+    return update_wrapper(partial(run_in_process, action), action)
+
+
 def _get_input_schema_from_type_hint(
     action: Optional[RunnableLike],
 ) -> Optional[Type[Any]]:
@@ -1,14 +1,18 @@
 """langgraph.prebuilt exposes a higher-level API for creating and executing agents and tools."""
 
-from langgraph.prebuilt.chat_agent_executor import create_react_agent
-from langgraph.prebuilt.tool_executor import ToolExecutor, ToolInvocation
-from langgraph.prebuilt.tool_node import (
-    InjectedState,
-    InjectedStore,
-    ToolNode,
-    tools_condition,
-)
-from langgraph.prebuilt.tool_validator import ValidationNode
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langgraph.prebuilt.chat_agent_executor import create_react_agent
+    from langgraph.prebuilt.tool_executor import ToolExecutor, ToolInvocation
+    from langgraph.prebuilt.tool_node import (
+        InjectedState,
+        InjectedStore,
+        ToolNode,
+        tools_condition,
+    )
+    from langgraph.prebuilt.tool_validator import ValidationNode
 
 __all__ = [
     "create_react_agent",
@@ -20,3 +24,21 @@ __all__ = [
     "InjectedState",
     "InjectedStore",
 ]
+
+# modules are imported on first use, as they import langchain_core tools
+_MODULES = {
+    "create_react_agent": "langgraph.prebuilt.chat_agent_executor",
+    "ToolExecutor": "langgraph.prebuilt.tool_executor",
+    "ToolInvocation": "langgraph.prebuilt.tool_executor",
+    "ToolNode": "langgraph.prebuilt.tool_node",
+    "tools_condition": "langgraph.prebuilt.tool_node",
+    "ValidationNode": "langgraph.prebuilt.tool_validator",
+    "InjectedState": "langgraph.prebuilt.tool_node",
+    "InjectedStore": "langgraph.prebuilt.tool_node",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if module := _MODULES.get(name):
+        return getattr(import_module(module), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -42,6 +42,7 @@ from langchain_core.tracers._streaming import _StreamingCallbackHandler
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import (
     BaseChannel,
 )
@@ -54,8 +55,10 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.constants import (
     CONF,
+    CONFIG_KEY_CACHE,
     CONFIG_KEY_CHECKPOINT_NS,
     CONFIG_KEY_CHECKPOINTER,
+    CONFIG_KEY_DURABILITY,
     CONFIG_KEY_NODE_FINISHED,
     CONFIG_KEY_READ,
     CONFIG_KEY_RESUMING,
@@ -86,7 +89,6 @@ from langgraph.pregel.debug import tasks_w_writes
 from langgraph.pregel.io import read_channels
 from langgraph.pregel.loop import AsyncPregelLoop, StreamProtocol, SyncPregelLoop
 from langgraph.pregel.manager import AsyncChannelsManager, ChannelsManager
-from langgraph.pregel.messages import StreamMessagesHandler
 from langgraph.pregel.protocol import PregelProtocol
 from langgraph.pregel.read import PregelNode
 from langgraph.pregel.retry import RetryPolicy
@@ -95,7 +97,16 @@ from langgraph.pregel.utils import find_subgraph_pregel, get_new_channel_version
 from langgraph.pregel.validate import validate_graph, validate_keys
 from langgraph.pregel.write import ChannelWrite, ChannelWriteEntry
 from langgraph.store.base import BaseStore
-from langgraph.types import All, Checkpointer, LoopProtocol, StateSnapshot, StreamMode
+from langgraph.types import (
+    All,
+    Checkpointer,
+    Durability,
+    LoopProtocol,
+    StateSnapshot,
+    StreamBuffer,
+    StreamMode,
+    TokenCoalescing,
+)
 from langgraph.utils.config import (
     ensure_config,
     merge_configs,
@@ -104,7 +115,12 @@ from langgraph.utils.config import (
     patch_configurable,
 )
 from langgraph.utils.pydantic import create_model
-from langgraph.utils.queue import AsyncQueue, SyncQueue  # type: ignore[attr-defined]
+from langgraph.utils.queue import (  # type: ignore[attr-defined]
+    AsyncQueue,
+    BoundedAsyncQueue,
+    BoundedSyncQueue,
+    SyncQueue,
+)
 
 WriteValue = Union[Callable[[Input], Output], Any]
 
@@ -212,6 +228,20 @@ class Pregel(PregelProtocol):
     store: Optional[BaseStore] = None
     """Memory store to use for SharedValues. Defaults to None."""
 
+    cache: Optional[BaseCache] = None
+    """Cache to use for storing node results. Defaults to None."""
+
+    durability: Optional[Durability] = None
+    """When to save checkpoints, "sync", "async" or "exit". Defaults to the
+    durability of the parent graph for subgraphs, otherwise to "async"."""
+
+    stream_buffer: Optional[StreamBuffer] = None
+    """Bound of the chunks buffered while streaming. Defaults to unbounded."""
+
+    token_coalescing: Optional[TokenCoalescing] = None
+    """How to merge tokens in "messages" stream mode. Defaults to one chunk per
+    token."""
+
     retry_policy: Optional[RetryPolicy] = None
     """Retry policy to use when running tasks. Set to None to disable."""
 
@@ -221,6 +251,10 @@ class Pregel(PregelProtocol):
 
     name: str = "LangGraph"
 
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]]
+    """Mapping of each channel to the nodes it triggers, built by `validate()`.
+    Until then all nodes are checked for triggers at every step."""
+
     def __init__(
         self,
         *,
@@ -237,10 +271,15 @@ class Pregel(PregelProtocol):
         debug: Optional[bool] = None,
         checkpointer: Optional[BaseCheckpointSaver] = None,
         store: Optional[BaseStore] = None,
+        cache: Optional[BaseCache] = None,
+        durability: Optional[Durability] = None,
+        stream_buffer: Optional[StreamBuffer] = None,
+        token_coalescing: Optional[TokenCoalescing] = None,
         retry_policy: Optional[RetryPolicy] = None,
         config_type: Optional[Type[Any]] = None,
         config: Optional[RunnableConfig] = None,
         name: str = "LangGraph",
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
     ) -> None:
         self.nodes = nodes
         self.channels = channels or {}
@@ -254,10 +293,15 @@ class Pregel(PregelProtocol):
         self.debug = debug if debug is not None else get_debug()
         self.checkpointer = checkpointer
         self.store = store
+        self.cache = cache
+        self.durability = durability
+        self.stream_buffer = stream_buffer
+        self.token_coalescing = token_coalescing
         self.retry_policy = retry_policy
         self.config_type = config_type
         self.config = config
         self.name = name
+        self.trigger_to_nodes = trigger_to_nodes
         if auto_validate:
             self.validate()
 
@@ -290,6 +334,12 @@ class Pregel(PregelProtocol):
             self.interrupt_after_nodes,
             self.interrupt_before_nodes,
         )
+        # index nodes by the channels that trigger them, in graph order
+        trigger_to_nodes: dict[str, list[str]] = {}
+        for name, node in self.nodes.items():
+            for trigger in node.triggers:
+                trigger_to_nodes.setdefault(trigger, []).append(name)
+        self.trigger_to_nodes = trigger_to_nodes
         return self
 
     @property
@@ -913,7 +963,7 @@ class Pregel(PregelProtocol):
             if saved:
                 checkpointer.put_writes(checkpoint_config, task.writes, task_id)
             # apply to checkpoint and save
-            mv_writes = apply_writes(
+            mv_writes, _ = apply_writes(
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
@@ -1063,7 +1113,7 @@ class Pregel(PregelProtocol):
             if saved:
                 await checkpointer.aput_writes(checkpoint_config, writes, task_id)
             # apply to checkpoint and save
-            mv_writes = apply_writes(
+            mv_writes, _ = apply_writes(
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
@@ -1083,6 +1133,18 @@ class Pregel(PregelProtocol):
             )
             return patch_checkpoint_map(next_config, saved.metadata if saved else None)
 
+    def _node_max_concurrency(self, config: RunnableConfig) -> dict[str, int]:
+        limits = {
+            k: n.max_concurrency
+            for k, n in self.nodes.items()
+            if n.max_concurrency is not None
+        }
+        # limits passed in config are for the nodes of the graph being invoked,
+        # subgraphs inherit its config but may have nodes with the same names
+        if CONFIG_KEY_TASK_ID not in config[CONF]:
+            limits.update(config[CONF].get("max_node_concurrency", {}))
+        return limits
+
     def _defaults(
         self,
         config: RunnableConfig,
@@ -1092,6 +1154,7 @@ class Pregel(PregelProtocol):
         interrupt_before: Optional[Union[All, Sequence[str]]],
         interrupt_after: Optional[Union[All, Sequence[str]]],
         debug: Optional[bool],
+        durability: Optional[Durability],
     ) -> tuple[
         bool,
         set[StreamMode],
@@ -1100,6 +1163,8 @@ class Pregel(PregelProtocol):
         Union[All, Sequence[str]],
         Optional[BaseCheckpointSaver],
         Optional[BaseStore],
+        Optional[BaseCache],
+        Durability,
     ]:
         if config["recursion_limit"] < 1:
             raise ValueError("recursion_limit must be at least 1")
@@ -1130,6 +1195,23 @@ class Pregel(PregelProtocol):
             store: Optional[BaseStore] = config[CONF][CONFIG_KEY_STORE]
         else:
             store = self.store
+        # a cache passed down from the parent graph takes precedence
+        cache: Optional[BaseCache] = (
+            config.get(CONF, {}).get(CONFIG_KEY_CACHE) or self.cache
+        )
+        # the durability of the parent graph is inherited, unless set for this
+        # run or for this graph
+        durability = (
+            durability
+            or self.durability
+            or config.get(CONF, {}).get(CONFIG_KEY_DURABILITY)
+            or "async"
+        )
+        if durability not in ("sync", "async", "exit"):
+            raise ValueError(
+                f"Invalid durability '{durability}', "
+                "expected one of 'sync', 'async' or 'exit'"
+            )
         return (
             debug,
             set(stream_mode),
@@ -1138,6 +1220,8 @@ class Pregel(PregelProtocol):
             interrupt_after,
             checkpointer,
             store,
+            cache,
+            durability,
         )
 
     def stream(
@@ -1151,6 +1235,9 @@ class Pregel(PregelProtocol):
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
         subgraphs: bool = False,
+        durability: Optional[Durability] = None,
+        stream_buffer: Optional[StreamBuffer] = None,
+        token_coalescing: Optional[TokenCoalescing] = None,
     ) -> Iterator[Union[dict[str, Any], Any]]:
         """Stream graph steps for a single input.
 
@@ -1163,11 +1250,22 @@ class Pregel(PregelProtocol):
                 updates: Emit only the updates to the state for each step.
                     Output is a dict with the node name as key and the updated values as value.
                 debug: Emit debug events for each step.
+                timings: Emit the durations of the phases and tasks of each step,
+                    and the metrics of the stream buffer if bounded.
             output_keys: The keys to stream, defaults to all non-context channels.
             interrupt_before: Nodes to interrupt before, defaults to all nodes in the graph.
             interrupt_after: Nodes to interrupt after, defaults to all nodes in the graph.
             debug: Whether to print debug information during execution, defaults to False.
             subgraphs: Whether to stream subgraphs, defaults to False.
+            durability: When to save checkpoints, defaults to self.durability.
+                sync: Save the checkpoint of each step before starting the next step.
+                async: Save checkpoints in the background, while the next step runs.
+                exit: Save only the last checkpoint, when the run exits.
+            stream_buffer: Bound of the chunks buffered until consumed, and what
+                to do with new chunks when full, defaults to self.stream_buffer.
+                Unbounded if None.
+            token_coalescing: How to merge tokens in "messages" stream mode,
+                defaults to self.token_coalescing. One chunk per token if None.
 
         Yields:
             The output of each step in the graph. The output shape depends on the stream_mode.
@@ -1220,7 +1318,8 @@ class Pregel(PregelProtocol):
             ```
         """
 
-        stream = SyncQueue()
+        stream_buffer = stream_buffer or self.stream_buffer
+        stream = BoundedSyncQueue(stream_buffer) if stream_buffer else SyncQueue()
 
         def output() -> Iterator:
             while True:
@@ -1255,6 +1354,8 @@ class Pregel(PregelProtocol):
                 interrupt_after_,
                 checkpointer,
                 store,
+                cache,
+                durability_,
             ) = self._defaults(
                 config,
                 stream_mode=stream_mode,
@@ -1262,11 +1363,16 @@ class Pregel(PregelProtocol):
                 interrupt_before=interrupt_before,
                 interrupt_after=interrupt_after,
                 debug=debug,
+                durability=durability,
             )
             # set up messages stream mode
             if "messages" in stream_modes:
+                from langgraph.pregel.messages import StreamMessagesHandler
+
                 run_manager.inheritable_handlers.append(
-                    StreamMessagesHandler(stream.put)
+                    StreamMessagesHandler(
+                        stream.put, token_coalescing or self.token_coalescing
+                    )
                 )
             # set up custom stream mode
             if "custom" in stream_modes:
@@ -1279,10 +1385,13 @@ class Pregel(PregelProtocol):
                 config=config,
                 store=store,
                 checkpointer=checkpointer,
+                cache=cache,
+                durability=durability_,
                 nodes=self.nodes,
                 specs=self.channels,
                 output_keys=output_keys,
                 stream_keys=self.stream_channels_asis,
+                trigger_to_nodes=self.trigger_to_nodes,
                 debug=debug,
             ) as loop:
                 # create runner
@@ -1290,10 +1399,24 @@ class Pregel(PregelProtocol):
                     submit=loop.submit,
                     put_writes=loop.put_writes,
                     node_finished=config[CONF].get(CONFIG_KEY_NODE_FINISHED),
+                    max_concurrency=config.get("max_concurrency"),
+                    node_max_concurrency=self._node_max_concurrency(config),
+                    node_weights={
+                        k: n.concurrency_weight
+                        for k, n in self.nodes.items()
+                        if n.concurrency_weight != 1
+                    },
+                    batched_nodes={k: n for k, n in self.nodes.items() if n.batched},
+                    on_task_timing=loop.timer.task if loop.timer else None,
                 )
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = loop.stream
+                if stream_buffer:
+                    # unblock waiting producers on exit
+                    loop.stack.callback(stream.close)
+                    if loop.timer is not None:
+                        loop.timer.buffer_stats = stream.stats
                 # enable concurrent streaming
                 if subgraphs or "messages" in stream_modes or "custom" in stream_modes:
                     # we are careful to have a single waiter live at any one time
@@ -1325,6 +1448,8 @@ class Pregel(PregelProtocol):
                     interrupt_after=interrupt_after_,
                     manager=run_manager,
                 ):
+                    loop.wait_for_checkpoint()
+                    loop.match_cached_writes()
                     for _ in runner.tick(
                         loop.tasks.values(),
                         timeout=self.step_timeout,
@@ -1363,6 +1488,9 @@ class Pregel(PregelProtocol):
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
         subgraphs: bool = False,
+        durability: Optional[Durability] = None,
+        stream_buffer: Optional[StreamBuffer] = None,
+        token_coalescing: Optional[TokenCoalescing] = None,
     ) -> AsyncIterator[Union[dict[str, Any], Any]]:
         """Stream graph steps for a single input.
 
@@ -1375,11 +1503,22 @@ class Pregel(PregelProtocol):
                 updates: Emit only the updates to the state for each step.
                     Output is a dict with the node name as key and the updated values as value.
                 debug: Emit debug events for each step.
+                timings: Emit the durations of the phases and tasks of each step,
+                    and the metrics of the stream buffer if bounded.
             output_keys: The keys to stream, defaults to all non-context channels.
             interrupt_before: Nodes to interrupt before, defaults to all nodes in the graph.
             interrupt_after: Nodes to interrupt after, defaults to all nodes in the graph.
             debug: Whether to print debug information during execution, defaults to False.
             subgraphs: Whether to stream subgraphs, defaults to False.
+            durability: When to save checkpoints, defaults to self.durability.
+                sync: Save the checkpoint of each step before starting the next step.
+                async: Save checkpoints in the background, while the next step runs.
+                exit: Save only the last checkpoint, when the run exits.
+            stream_buffer: Bound of the chunks buffered until consumed, and what
+                to do with new chunks when full, defaults to self.stream_buffer.
+                Unbounded if None.
+            token_coalescing: How to merge tokens in "messages" stream mode,
+                defaults to self.token_coalescing. One chunk per token if None.
 
         Yields:
             The output of each step in the graph. The output shape depends on the stream_mode.
@@ -1432,7 +1571,8 @@ class Pregel(PregelProtocol):
             ```
         """
 
-        stream = AsyncQueue()
+        stream_buffer = stream_buffer or self.stream_buffer
+        stream = BoundedAsyncQueue(stream_buffer) if stream_buffer else AsyncQueue()
         aioloop = asyncio.get_running_loop()
 
         def output() -> Iterator:
@@ -1477,6 +1617,8 @@ class Pregel(PregelProtocol):
                 interrupt_after_,
                 checkpointer,
                 store,
+                cache,
+                durability_,
             ) = self._defaults(
                 config,
                 stream_mode=stream_mode,
@@ -1484,11 +1626,16 @@ class Pregel(PregelProtocol):
                 interrupt_before=interrupt_before,
                 interrupt_after=interrupt_after,
                 debug=debug,
+                durability=durability,
             )
             # set up messages stream mode
             if "messages" in stream_modes:
+                from langgraph.pregel.messages import StreamMessagesHandler
+
                 run_manager.inheritable_handlers.append(
-                    StreamMessagesHandler(stream.put_nowait)
+                    StreamMessagesHandler(
+                        stream.put_nowait, token_coalescing or self.token_coalescing
+                    )
                 )
             # set up custom stream mode
             if "custom" in stream_modes:
@@ -1501,10 +1648,13 @@ class Pregel(PregelProtocol):
                 config=config,
                 store=store,
                 checkpointer=checkpointer,
+                cache=cache,
+                durability=durability_,
                 nodes=self.nodes,
                 specs=self.channels,
                 output_keys=output_keys,
                 stream_keys=self.stream_channels_asis,
+                trigger_to_nodes=self.trigger_to_nodes,
             ) as loop:
                 # create runner
                 runner = PregelRunner(
@@ -1512,10 +1662,21 @@ class Pregel(PregelProtocol):
                     put_writes=loop.put_writes,
                     use_astream=do_stream is not None,
                     node_finished=config[CONF].get(CONFIG_KEY_NODE_FINISHED),
+                    max_concurrency=config.get("max_concurrency"),
+                    node_max_concurrency=self._node_max_concurrency(config),
+                    node_weights={
+                        k: n.concurrency_weight
+                        for k, n in self.nodes.items()
+                        if n.concurrency_weight != 1
+                    },
+                    batched_nodes={k: n for k, n in self.nodes.items() if n.batched},
+                    on_task_timing=loop.timer.task if loop.timer else None,
                 )
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = loop.stream
+                if stream_buffer and loop.timer is not None:
+                    loop.timer.buffer_stats = stream.stats
                 # enable concurrent streaming
                 if subgraphs or "messages" in stream_modes or "custom" in stream_modes:
 
@@ -1535,6 +1696,8 @@ class Pregel(PregelProtocol):
                     interrupt_after=interrupt_after_,
                     manager=run_manager,
                 ):
+                    await loop.await_checkpoint()
+                    await loop.amatch_cached_writes()
                     async for _ in runner.atick(
                         loop.tasks.values(),
                         timeout=self.step_timeout,
@@ -1574,6 +1737,7 @@ class Pregel(PregelProtocol):
         interrupt_before: Optional[Union[All, Sequence[str]]] = None,
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
+        durability: Optional[Durability] = None,
         **kwargs: Any,
     ) -> Union[dict[str, Any], Any]:
         """Run the graph with a single input and config.
@@ -1586,6 +1750,7 @@ class Pregel(PregelProtocol):
             interrupt_before: Optional. The nodes to interrupt the graph run before.
             interrupt_after: Optional. The nodes to interrupt the graph run after.
             debug: Optional. Enable debug mode for the graph run.
+            durability: Optional. When to save checkpoints, "sync", "async" or "exit".
             **kwargs: Additional keyword arguments to pass to the graph run.
 
         Returns:
@@ -1605,6 +1770,7 @@ class Pregel(PregelProtocol):
             interrupt_before=interrupt_before,
             interrupt_after=interrupt_after,
             debug=debug,
+            durability=durability,
             **kwargs,
         ):
             if stream_mode == "values":
@@ -1626,6 +1792,7 @@ class Pregel(PregelProtocol):
         interrupt_before: Optional[Union[All, Sequence[str]]] = None,
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
+        durability: Optional[Durability] = None,
         **kwargs: Any,
     ) -> Union[dict[str, Any], Any]:
         """Asynchronously invoke the graph on a single input.
@@ -1638,6 +1805,7 @@ class Pregel(PregelProtocol):
             interrupt_before: Optional. The nodes to interrupt before. Default is None.
             interrupt_after: Optional. The nodes to interrupt after. Default is None.
             debug: Optional. Whether to enable debug mode. Default is None.
+            durability: Optional. When to save checkpoints, "sync", "async" or "exit".
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -1658,6 +1826,7 @@ class Pregel(PregelProtocol):
             interrupt_before=interrupt_before,
             interrupt_after=interrupt_after,
             debug=debug,
+            durability=durability,
             **kwargs,
         ):
             if stream_mode == "values":
@@ -1,6 +1,6 @@
-from collections import defaultdict, deque
+from collections import ChainMap, defaultdict, deque
 from functools import partial
-from hashlib import sha1
+from hashlib import blake2b, sha1
 from typing import (
     Any,
     Callable,
@@ -21,15 +21,16 @@ from uuid import UUID
 from langchain_core.callbacks.manager import AsyncParentRunManager, ParentRunManager
 from langchain_core.runnables.config import RunnableConfig
 
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import BaseChannel
 from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
     Checkpoint,
     V,
-    copy_checkpoint,
 )
 from langgraph.constants import (
     CONF,
+    CONFIG_KEY_CACHE,
     CONFIG_KEY_CHECKPOINT_ID,
     CONFIG_KEY_CHECKPOINT_MAP,
     CONFIG_KEY_CHECKPOINT_NS,
@@ -54,10 +55,15 @@ from langgraph.errors import EmptyChannelError, InvalidUpdateError
 from langgraph.managed.base import ManagedValueMapping
 from langgraph.pregel.io import read_channel, read_channels
 from langgraph.pregel.log import logger
-from langgraph.pregel.manager import ChannelsManager
 from langgraph.pregel.read import PregelNode
 from langgraph.store.base import BaseStore
-from langgraph.types import All, LoopProtocol, PregelExecutableTask, PregelTask
+from langgraph.types import (
+    All,
+    CacheKey,
+    CachePolicy,
+    PregelExecutableTask,
+    PregelTask,
+)
 from langgraph.utils.config import merge_configs, patch_config
 
 GetNextVersion = Callable[[Optional[V], BaseChannel], V]
@@ -145,14 +151,14 @@ def local_read(
         select = [k for k in select if k not in managed]
         updated = set(select).intersection(c for c, _ in task.writes)
     if fresh and updated:
-        with ChannelsManager(
-            {k: v for k, v in channels.items() if k in updated},
-            checkpoint,
-            LoopProtocol(config=config, step=step, stop=step + 1),
-            skip_context=True,
-        ) as (local_channels, _):
-            apply_writes(copy_checkpoint(checkpoint), local_channels, [task], None)
-            values = read_channels({**channels, **local_channels}, select)
+        # overlay copies of the updated channels, with the writes of this task
+        # applied, on top of the channels shared with other tasks
+        local_channels: dict[str, BaseChannel] = {}
+        for k in updated:
+            if k in channels:
+                local_channels[k] = channels[k].copy()
+                local_channels[k].update([v for c, v in task.writes if c == k])
+        values = read_channels(ChainMap(local_channels, channels), select)
     else:
         values = read_channels(channels, select)
     if managed_keys:
@@ -186,10 +192,16 @@ def apply_writes(
     channels: Mapping[str, BaseChannel],
     tasks: Iterable[WritesProtocol],
     get_next_version: Optional[GetNextVersion],
-) -> dict[str, list[Any]]:
+    *,
+    notify_channels: Optional[Iterable[str]] = None,
+) -> tuple[dict[str, list[Any]], set[str]]:
     """Apply writes from a set of tasks (usually the tasks from a Pregel step)
     to the checkpoint and channels, and return managed values writes to be applied
-    externally."""
+    externally, along with the set of channels that were updated in this step.
+
+    Channels that weren't written to are notified of the new step only if listed
+    in `notify_channels`, which defaults to all channels with `notify_on_new_step`.
+    """
     # update seen versions
     for task in tasks:
         checkpoint["versions_seen"].setdefault(task.name, {}).update(
@@ -206,18 +218,26 @@ def apply_writes(
     else:
         max_version = None
 
+    # Track the channels that changed, used to find the nodes triggered next
+    updated_channels: set[str] = set()
+
     # Consume all channels that were read
+    consumed_max_version = max_version
     for chan in {
         chan
         for task in tasks
         for chan in task.triggers
         if chan not in RESERVED and chan in channels
     }:
-        if channels[chan].consume() and get_next_version is not None:
-            checkpoint["channel_versions"][chan] = get_next_version(
-                max_version,
-                channels[chan],
-            )
+        if channels[chan].consume():
+            if get_next_version is not None:
+                version = get_next_version(max_version, channels[chan])
+                checkpoint["channel_versions"][chan] = version
+                if consumed_max_version is None or version > consumed_max_version:
+                    consumed_max_version = version
+            updated_channels.add(chan)
+    # Keep the highest version up to date, instead of recomputing it
+    max_version = consumed_max_version
 
     # clear pending sends
     if checkpoint["pending_sends"]:
@@ -237,34 +257,141 @@ def apply_writes(
             else:
                 pending_writes_by_managed[chan].append(val)
 
-    # Find the highest version of all channels
-    if checkpoint["channel_versions"]:
-        max_version = max(checkpoint["channel_versions"].values())
-    else:
-        max_version = None
-
     # Apply writes to channels
-    updated_channels: set[str] = set()
     for chan, vals in pending_writes_by_channel.items():
         if chan in channels:
-            if channels[chan].update(vals) and get_next_version is not None:
-                checkpoint["channel_versions"][chan] = get_next_version(
-                    max_version,
-                    channels[chan],
-                )
-            updated_channels.add(chan)
+            if channels[chan].update(vals):
+                if get_next_version is not None:
+                    checkpoint["channel_versions"][chan] = get_next_version(
+                        max_version,
+                        channels[chan],
+                    )
+                updated_channels.add(chan)
 
     # Channels that weren't updated in this step are notified of a new step
-    for chan in channels:
-        if chan not in updated_channels:
-            if channels[chan].update([]) and get_next_version is not None:
-                checkpoint["channel_versions"][chan] = get_next_version(
-                    max_version,
-                    channels[chan],
-                )
-
-    # Return managed values writes to be applied externally
-    return pending_writes_by_managed
+    if notify_channels is None:
+        notify_channels = [
+            chan for chan, channel in channels.items() if channel.notify_on_new_step
+        ]
+    for chan in notify_channels:
+        if chan not in pending_writes_by_channel:
+            if channels[chan].update([]):
+                if get_next_version is not None:
+                    checkpoint["channel_versions"][chan] = get_next_version(
+                        max_version,
+                        channels[chan],
+                    )
+                updated_channels.add(chan)
+
+    # Return managed values writes to be applied externally, and updated channels
+    return pending_writes_by_managed, updated_channels
+
+
+class StepContext:
+    """Values shared by all the tasks of a step, computed once per step rather
+    than once per task, which adds up for steps with thousands of Send tasks."""
+
+    def __init__(
+        self,
+        checkpoint: Checkpoint,
+        processes: Mapping[str, PregelNode],
+        channels: Mapping[str, BaseChannel],
+        managed: ManagedValueMapping,
+        config: RunnableConfig,
+        step: int,
+        *,
+        store: Optional[BaseStore] = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+        manager: Union[None, ParentRunManager, AsyncParentRunManager] = None,
+        cache: Optional[BaseCache] = None,
+    ) -> None:
+        configurable = config.get(CONF, {})
+        self.config = config
+        self.step = step
+        self.manager = manager
+        self.process_keys = processes.keys()
+        self.checkpoint_id = UUID(checkpoint["id"]).bytes
+        self.parent_ns: str = configurable.get(CONFIG_KEY_CHECKPOINT_NS, "")
+        # configurable keys with the same value for all tasks
+        self.configurable: dict[str, Any] = {
+            CONFIG_KEY_STORE: store or configurable.get(CONFIG_KEY_STORE),
+            CONFIG_KEY_CACHE: cache or configurable.get(CONFIG_KEY_CACHE),
+            CONFIG_KEY_CHECKPOINTER: (
+                checkpointer or configurable.get(CONFIG_KEY_CHECKPOINTER)
+            ),
+            CONFIG_KEY_CHECKPOINT_MAP: {
+                **configurable.get(CONFIG_KEY_CHECKPOINT_MAP, {}),
+                self.parent_ns: checkpoint["id"],
+            },
+            CONFIG_KEY_CHECKPOINT_ID: None,
+        }
+        self.read = partial(local_read, step, checkpoint, channels, managed)
+        # task configs of each node, before task-specific values are added
+        self.templates: dict[str, RunnableConfig] = {}
+        # task id hashes of each node, before task-specific parts are added
+        self.id_prefixes: dict[tuple[str, str], Any] = {}
+
+    def task_id(self, checkpoint_ns: str, name: str, kind: str, *parts: str) -> str:
+        """Generate a task id from the SHA-1 hash of the checkpoint id, the task
+        namespace, step, node name, kind of task and any other parts. The prefix
+        shared by all tasks of a node is hashed only once."""
+        if (prefix := self.id_prefixes.get((checkpoint_ns, kind))) is None:
+            prefix = self.id_prefixes[(checkpoint_ns, kind)] = sha1(
+                self.checkpoint_id, usedforsecurity=False
+            )
+            prefix.update(f"{checkpoint_ns}{self.step}{name}{kind}".encode())
+        sha = prefix.copy()
+        sha.update("".join(parts).encode())
+        hex = sha.hexdigest()
+        return f"{hex[:8]}-{hex[8:12]}-{hex[12:16]}-{hex[16:20]}-{hex[20:32]}"
+
+    def task_config(
+        self,
+        proc: PregelNode,
+        name: str,
+        task_id: str,
+        task_checkpoint_ns: str,
+        task_path: tuple[str, Union[int, str]],
+        triggers: list[str],
+        writes: deque[tuple[str, Any]],
+    ) -> RunnableConfig:
+        """Build the config of a task, merging the run config with the node's
+        metadata and tags only once per node."""
+        if (template := self.templates.get(name)) is None:
+            template = self.templates[name] = merge_configs(
+                self.config,
+                {
+                    "metadata": {"langgraph_step": self.step, "langgraph_node": name},
+                    "tags": proc.tags,
+                },
+            )
+        metadata = {
+            **template["metadata"],
+            "langgraph_triggers": triggers,
+            "langgraph_path": task_path,
+            "langgraph_checkpoint_ns": task_checkpoint_ns,
+        }
+        if proc.metadata:
+            metadata.update(proc.metadata)
+        return patch_config(
+            {**template, "metadata": metadata},
+            run_name=name,
+            callbacks=(
+                self.manager.get_child(f"graph:step:{self.step}")
+                if self.manager
+                else None
+            ),
+            configurable={
+                **self.configurable,
+                CONFIG_KEY_TASK_ID: task_id,
+                # deque.extend is thread-safe
+                CONFIG_KEY_SEND: partial(local_write, writes.extend, self.process_keys),
+                CONFIG_KEY_READ: partial(
+                    self.read, PregelTaskWrites(name, writes, triggers), self.config
+                ),
+                CONFIG_KEY_CHECKPOINT_NS: task_checkpoint_ns,
+            },
+        )
 
 
 @overload
@@ -280,6 +407,9 @@ def prepare_next_tasks(
     store: Literal[None] = None,
     checkpointer: Literal[None] = None,
     manager: Literal[None] = None,
+    cache: Literal[None] = None,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelTask]: ...
 
 
@@ -296,6 +426,9 @@ def prepare_next_tasks(
     store: Optional[BaseStore],
     checkpointer: Optional[BaseCheckpointSaver],
     manager: Union[None, ParentRunManager, AsyncParentRunManager],
+    cache: Optional[BaseCache] = None,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelExecutableTask]: ...
 
 
@@ -311,11 +444,31 @@ def prepare_next_tasks(
     store: Optional[BaseStore] = None,
     checkpointer: Optional[BaseCheckpointSaver] = None,
     manager: Union[None, ParentRunManager, AsyncParentRunManager] = None,
+    cache: Optional[BaseCache] = None,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> Union[dict[str, PregelTask], dict[str, PregelExecutableTask]]:
     """Prepare the set of tasks that will make up the next Pregel step.
     This is the union of all PUSH tasks (Sends) and PULL tasks (nodes triggered
-    by edges)."""
+    by edges).
+
+    When both `trigger_to_nodes` (a mapping of channel to the nodes it triggers)
+    and `updated_channels` (the channels updated by the previous `apply_writes`)
+    are provided, only the nodes subscribed to an updated channel are considered
+    for PULL tasks, instead of every node in the graph."""
     tasks: dict[str, Union[PregelTask, PregelExecutableTask]] = {}
+    context = StepContext(
+        checkpoint,
+        processes,
+        channels,
+        managed,
+        config,
+        step,
+        store=store,
+        checkpointer=checkpointer,
+        manager=manager,
+        cache=cache,
+    )
     # Consume pending packets
     for idx, _ in enumerate(checkpoint["pending_sends"]):
         if task := prepare_single_task(
@@ -331,11 +484,27 @@ def prepare_next_tasks(
             store=store,
             checkpointer=checkpointer,
             manager=manager,
+            cache=cache,
+            context=context,
         ):
             tasks[task.id] = task
+    # Find the nodes that could be triggered in the next step
+    if updated_channels is not None and trigger_to_nodes is not None:
+        triggered_nodes: set[str] = set()
+        for chan in updated_channels:
+            if node_names := trigger_to_nodes.get(chan):
+                triggered_nodes.update(node_names)
+        # keep graph order, which determines the order writes are applied in
+        candidate_nodes: Iterable[str] = (
+            [name for name in processes if name in triggered_nodes]
+            if len(triggered_nodes) > 1
+            else triggered_nodes
+        )
+    else:
+        candidate_nodes = processes
     # Check if any processes should be run in next step
     # If so, prepare the values to be passed to them
-    for name in processes:
+    for name in candidate_nodes:
         if task := prepare_single_task(
             (PULL, name),
             None,
@@ -349,6 +518,8 @@ def prepare_next_tasks(
             store=store,
             checkpointer=checkpointer,
             manager=manager,
+            cache=cache,
+            context=context,
         ):
             tasks[task.id] = task
     return tasks
@@ -368,12 +539,28 @@ def prepare_single_task(
     store: Optional[BaseStore] = None,
     checkpointer: Optional[BaseCheckpointSaver] = None,
     manager: Union[None, ParentRunManager, AsyncParentRunManager] = None,
+    cache: Optional[BaseCache] = None,
+    context: Optional["StepContext"] = None,
 ) -> Union[None, PregelTask, PregelExecutableTask]:
     """Prepares a single task for the next Pregel step, given a task path, which
-    uniquely identifies a PUSH or PULL task within the graph."""
-    checkpoint_id = UUID(checkpoint["id"]).bytes
-    configurable = config.get(CONF, {})
-    parent_ns = configurable.get(CONFIG_KEY_CHECKPOINT_NS, "")
+    uniquely identifies a PUSH or PULL task within the graph.
+
+    Pass the same `context` when preparing all the tasks of a step, to compute
+    the values they share only once."""
+    if context is None:
+        context = StepContext(
+            checkpoint,
+            processes,
+            channels,
+            managed,
+            config,
+            step,
+            store=store,
+            checkpointer=checkpointer,
+            manager=manager,
+            cache=cache,
+        )
+    parent_ns = context.parent_ns
 
     if task_path[0] == PUSH:
         idx = int(task_path[1])
@@ -393,80 +580,40 @@ def prepare_single_task(
         checkpoint_ns = (
             f"{parent_ns}{NS_SEP}{packet.node}" if parent_ns else packet.node
         )
-        task_id = _uuid5_str(
-            checkpoint_id,
-            checkpoint_ns,
-            str(step),
-            packet.node,
-            PUSH,
-            str(idx),
-        )
+        task_id = context.task_id(checkpoint_ns, packet.node, PUSH, str(idx))
         task_checkpoint_ns = f"{checkpoint_ns}:{task_id}"
-        metadata = {
-            "langgraph_step": step,
-            "langgraph_node": packet.node,
-            "langgraph_triggers": triggers,
-            "langgraph_path": task_path,
-            "langgraph_checkpoint_ns": task_checkpoint_ns,
-        }
         if task_id_checksum is not None:
             assert task_id == task_id_checksum
         if for_execution:
             proc = processes[packet.node]
             if node := proc.node:
-                if proc.metadata:
-                    metadata.update(proc.metadata)
                 writes: deque[tuple[str, Any]] = deque()
                 return PregelExecutableTask(
                     packet.node,
                     packet.arg,
                     node,
                     writes,
-                    patch_config(
-                        merge_configs(
-                            config, {"metadata": metadata, "tags": proc.tags}
-                        ),
-                        run_name=packet.node,
-                        callbacks=(
-                            manager.get_child(f"graph:step:{step}") if manager else None
-                        ),
-                        configurable={
-                            CONFIG_KEY_TASK_ID: task_id,
-                            # deque.extend is thread-safe
-                            CONFIG_KEY_SEND: partial(
-                                local_write,
-                                writes.extend,
-                                processes.keys(),
-                            ),
-                            CONFIG_KEY_READ: partial(
-                                local_read,
-                                step,
-                                checkpoint,
-                                channels,
-                                managed,
-                                PregelTaskWrites(packet.node, writes, triggers),
-                                config,
-                            ),
-                            CONFIG_KEY_STORE: (
-                                store or configurable.get(CONFIG_KEY_STORE)
-                            ),
-                            CONFIG_KEY_CHECKPOINTER: (
-                                checkpointer
-                                or configurable.get(CONFIG_KEY_CHECKPOINTER)
-                            ),
-                            CONFIG_KEY_CHECKPOINT_MAP: {
-                                **configurable.get(CONFIG_KEY_CHECKPOINT_MAP, {}),
-                                parent_ns: checkpoint["id"],
-                            },
-                            CONFIG_KEY_CHECKPOINT_ID: None,
-                            CONFIG_KEY_CHECKPOINT_NS: task_checkpoint_ns,
-                        },
+                    context.task_config(
+                        proc,
+                        packet.node,
+                        task_id,
+                        task_checkpoint_ns,
+                        task_path,
+                        triggers,
+                        writes,
                     ),
                     triggers,
                     proc.retry_policy,
-                    None,
+                    proc.cache_policy,
                     task_id,
                     task_path,
+                    cache_key=(
+                        _cache_key(
+                            proc.cache_policy, parent_ns, packet.node, packet.arg
+                        )
+                        if cache is not None and proc.cache_policy is not None
+                        else None
+                    ),
                 )
 
         else:
@@ -500,81 +647,37 @@ def prepare_single_task(
 
             # create task id
             checkpoint_ns = f"{parent_ns}{NS_SEP}{name}" if parent_ns else name
-            task_id = _uuid5_str(
-                checkpoint_id,
-                checkpoint_ns,
-                str(step),
-                name,
-                PULL,
-                *triggers,
-            )
+            task_id = context.task_id(checkpoint_ns, name, PULL, *triggers)
             task_checkpoint_ns = f"{checkpoint_ns}{NS_END}{task_id}"
-            metadata = {
-                "langgraph_step": step,
-                "langgraph_node": name,
-                "langgraph_triggers": triggers,
-                "langgraph_path": task_path,
-                "langgraph_checkpoint_ns": task_checkpoint_ns,
-            }
             if task_id_checksum is not None:
                 assert task_id == task_id_checksum
             if for_execution:
                 if node := proc.node:
-                    if proc.metadata:
-                        metadata.update(proc.metadata)
                     writes = deque()
                     return PregelExecutableTask(
                         name,
                         val,
                         node,
                         writes,
-                        patch_config(
-                            merge_configs(
-                                config, {"metadata": metadata, "tags": proc.tags}
-                            ),
-                            run_name=name,
-                            callbacks=(
-                                manager.get_child(f"graph:step:{step}")
-                                if manager
-                                else None
-                            ),
-                            configurable={
-                                CONFIG_KEY_TASK_ID: task_id,
-                                # deque.extend is thread-safe
-                                CONFIG_KEY_SEND: partial(
-                                    local_write,
-                                    writes.extend,
-                                    processes.keys(),
-                                ),
-                                CONFIG_KEY_READ: partial(
-                                    local_read,
-                                    step,
-                                    checkpoint,
-                                    channels,
-                                    managed,
-                                    PregelTaskWrites(name, writes, triggers),
-                                    config,
-                                ),
-                                CONFIG_KEY_STORE: (
-                                    store or configurable.get(CONFIG_KEY_STORE)
-                                ),
-                                CONFIG_KEY_CHECKPOINTER: (
-                                    checkpointer
-                                    or configurable.get(CONFIG_KEY_CHECKPOINTER)
-                                ),
-                                CONFIG_KEY_CHECKPOINT_MAP: {
-                                    **configurable.get(CONFIG_KEY_CHECKPOINT_MAP, {}),
-                                    parent_ns: checkpoint["id"],
-                                },
-                                CONFIG_KEY_CHECKPOINT_ID: None,
-                                CONFIG_KEY_CHECKPOINT_NS: task_checkpoint_ns,
-                            },
+                        context.task_config(
+                            proc,
+                            name,
+                            task_id,
+                            task_checkpoint_ns,
+                            task_path,
+                            triggers,
+                            writes,
                         ),
                         triggers,
                         proc.retry_policy,
-                        None,
+                        proc.cache_policy,
                         task_id,
                         task_path,
+                        cache_key=(
+                            _cache_key(proc.cache_policy, parent_ns, name, val)
+                            if cache is not None and proc.cache_policy is not None
+                            else None
+                        ),
                     )
             else:
                 return PregelTask(task_id, name, task_path)
@@ -626,10 +729,24 @@ def _proc_input(
     yield val
 
 
-def _uuid5_str(namespace: bytes, *parts: str) -> str:
-    """Generate a UUID from the SHA-1 hash of a namespace UUID and a name."""
-
-    sha = sha1(namespace, usedforsecurity=False)
-    sha.update(b"".join(p.encode() for p in parts))
-    hex = sha.hexdigest()
-    return f"{hex[:8]}-{hex[8:12]}-{hex[12:16]}-{hex[16:20]}-{hex[20:32]}"
+def _cache_key(
+    policy: CachePolicy, parent_ns: str, name: str, input: Any
+) -> Optional[CacheKey]:
+    """Compute the cache key of a task. Entries are namespaced by the path of the
+    node in the graph, without task ids, so that they are shared across runs.
+    Returns None, to run the task without caching, if the key can't be computed."""
+    try:
+        key = policy.key_func(input)
+    except Exception as exc:
+        logger.warning(f"Not caching node {name}, failed to compute cache key: {exc}")
+        return None
+    return CacheKey(
+        (
+            *(part.split(NS_END)[0] for part in parent_ns.split(NS_SEP) if part),
+            name,
+        ),
+        blake2b(
+            key.encode() if isinstance(key, str) else key, digest_size=16
+        ).hexdigest(),
+        policy.ttl,
+    )
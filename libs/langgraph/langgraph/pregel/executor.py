@@ -1,10 +1,14 @@
 import asyncio
+import atexit
 import concurrent.futures
+import multiprocessing
 import sys
+import threading
 from contextlib import ExitStack
 from contextvars import copy_context
 from types import TracebackType
 from typing import (
+    Any,
     AsyncContextManager,
     Awaitable,
     Callable,
@@ -197,3 +201,40 @@ async def gated(semaphore: asyncio.Semaphore, coro: Coroutine[None, None, T]) ->
     """A coroutine that waits for a semaphore before running another coroutine."""
     async with semaphore:
         return await coro
+
+
+_process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_executor() -> concurrent.futures.ProcessPoolExecutor:
+    """Get the process pool shared by all nodes with `executor="process"`.
+    The pool is created on first use, with one worker per CPU, and shut down
+    when the interpreter exits."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # spawn, as forking a process that runs other threads is unsafe
+            _process_pool = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(shutdown_process_executor)
+        return _process_pool
+
+
+def shutdown_process_executor() -> None:
+    """Shut down the shared process pool, if it was created. It is created
+    again on next use."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        atexit.unregister(shutdown_process_executor)
+        pool.shutdown(cancel_futures=True)
+
+
+def run_in_process(func: Callable[[Any], T], input: Any) -> T:
+    """Run a sync function in the shared process pool, and wait for its result.
+    The function must be picklable, ie. defined at the top level of a module.
+    Its input and output are pickled, so they keep their types."""
+    return get_process_executor().submit(func, input).result()
@@ -1,7 +1,9 @@
 import asyncio
 import concurrent.futures
+import threading
 from collections import deque
-from contextlib import AsyncExitStack, ExitStack
+from contextlib import AsyncExitStack, ExitStack, nullcontext
+from time import monotonic
 from types import TracebackType
 from typing import (
     Any,
@@ -24,6 +26,7 @@ from langchain_core.callbacks import AsyncParentRunManager, ParentRunManager
 from langchain_core.runnables import RunnableConfig
 from typing_extensions import ParamSpec, Self
 
+from langgraph.cache.base import BaseCache, FullKey
 from langgraph.channels.base import BaseChannel
 from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
@@ -43,6 +46,7 @@ from langgraph.constants import (
     CONFIG_KEY_CHECKPOINT_NS,
     CONFIG_KEY_DEDUPE_TASKS,
     CONFIG_KEY_DELEGATE,
+    CONFIG_KEY_DURABILITY,
     CONFIG_KEY_ENSURE_LATEST,
     CONFIG_KEY_RESUMING,
     CONFIG_KEY_STREAM,
@@ -98,9 +102,16 @@ from langgraph.pregel.io import (
 )
 from langgraph.pregel.manager import AsyncChannelsManager, ChannelsManager
 from langgraph.pregel.read import PregelNode
+from langgraph.pregel.timings import StepTimer, measure_serializer
 from langgraph.pregel.utils import get_new_channel_versions
 from langgraph.store.base import BaseStore
-from langgraph.types import All, LoopProtocol, PregelExecutableTask, StreamProtocol
+from langgraph.types import (
+    All,
+    Durability,
+    LoopProtocol,
+    PregelExecutableTask,
+    StreamProtocol,
+)
 from langgraph.utils.config import patch_configurable
 
 V = TypeVar("V")
@@ -124,16 +135,19 @@ def DuplexStream(*streams: StreamProtocol) -> StreamProtocol:
 class PregelLoop(LoopProtocol):
     input: Optional[Any]
     checkpointer: Optional[BaseCheckpointSaver]
+    cache: Optional[BaseCache]
+    durability: Durability
     nodes: Mapping[str, PregelNode]
     specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]]
     output_keys: Union[str, Sequence[str]]
     stream_keys: Union[str, Sequence[str]]
     skip_done_tasks: bool
     is_nested: bool
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]]
 
     checkpointer_get_next_version: GetNextVersion
     checkpointer_put_writes: Optional[
-        Callable[[RunnableConfig, Sequence[tuple[str, Any]], str], Any]
+        Callable[[RunnableConfig, Sequence[tuple[str, Sequence[tuple[str, Any]]]]], Any]
     ]
     _checkpointer_put_after_previous: Optional[
         Callable[
@@ -147,8 +161,11 @@ class PregelLoop(LoopProtocol):
             Any,
         ]
     ]
+    cache_set: Optional[Callable[[Mapping[FullKey, tuple[Any, Optional[int]]]], Any]]
+    timer: Optional[StepTimer]
     submit: Submit
     channels: Mapping[str, BaseChannel]
+    notify_channels: Sequence[str]
     managed: ManagedValueMapping
     checkpoint: Checkpoint
     checkpoint_ns: tuple[str, ...]
@@ -157,13 +174,20 @@ class PregelLoop(LoopProtocol):
     checkpoint_pending_writes: List[PendingWrite]
     checkpoint_previous_versions: dict[str, Union[str, float, int]]
     prev_checkpoint_config: Optional[RunnableConfig]
+    checkpoint_unsaved: bool = False
 
     status: Literal[
         "pending", "done", "interrupt_before", "interrupt_after", "out_of_steps"
     ]
     tasks: dict[str, PregelExecutableTask]
+    updated_channels: Optional[set[str]] = None
     output: Union[None, dict[str, Any], Any] = None
 
+    put_writes_batch_size: int = 64
+    """Max number of tasks whose writes are saved in one checkpointer call."""
+    put_writes_batch_window: float = 0.05
+    """Max seconds the writes of a finished task are held before being saved."""
+
     # public
 
     def __init__(
@@ -174,10 +198,13 @@ class PregelLoop(LoopProtocol):
         config: RunnableConfig,
         store: Optional[BaseStore],
         checkpointer: Optional[BaseCheckpointSaver],
+        cache: Optional[BaseCache] = None,
+        durability: Durability = "async",
         nodes: Mapping[str, PregelNode],
         specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
         output_keys: Union[str, Sequence[str]],
         stream_keys: Union[str, Sequence[str]],
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
         check_subgraphs: bool = True,
         debug: bool = False,
     ) -> None:
@@ -190,10 +217,13 @@ class PregelLoop(LoopProtocol):
         )
         self.input = input
         self.checkpointer = checkpointer
+        self.cache = cache
+        self.durability = durability
         self.nodes = nodes
         self.specs = specs
         self.output_keys = output_keys
         self.stream_keys = stream_keys
+        self.trigger_to_nodes = trigger_to_nodes
         self.is_nested = CONFIG_KEY_TASK_ID in self.config.get(CONF, {})
         self.skip_done_tasks = (
             CONFIG_KEY_CHECKPOINT_ID not in config[CONF]
@@ -237,31 +267,128 @@ class PregelLoop(LoopProtocol):
             else ()
         )
         self.prev_checkpoint_config = None
+        self.writes_batch: list[tuple[str, Sequence[tuple[str, Any]]]] = []
+        self.writes_batch_started = 0.0
+        self.writes_batch_lock = threading.Lock()
+        # cancels the scheduled flush of the current batch, if any
+        self.writes_batch_timer: Optional[Callable[[], None]] = None
+        # ids of the tasks of this step whose writes were put or restored
+        self.tasks_with_writes: set[str] = set()
+        self.timer = (
+            StepTimer()
+            if self.stream is not None and "timings" in self.stream.modes
+            else None
+        )
+        if self.timer is not None and checkpointer is not None:
+            measure_serializer(checkpointer)
 
-    def put_writes(self, task_id: str, writes: Sequence[tuple[str, Any]]) -> None:
-        """Put writes for a task, to be read by the next tick."""
+    def put_writes(
+        self, task_id: str, writes: Sequence[tuple[str, Any]], *, cached: bool = False
+    ) -> None:
+        """Put writes for a task, to be read by the next tick. Writes that were
+        replayed from the cache are marked as such with `cached`."""
         if not writes:
             return
         # save writes
         self.checkpoint_pending_writes.extend((task_id, k, v) for k, v in writes)
         if self.checkpointer_put_writes is not None:
+            with self.writes_batch_lock:
+                if not self.writes_batch:
+                    self.writes_batch_started = monotonic()
+                self.writes_batch.append((task_id, writes))
+                self.tasks_with_writes.add(task_id)
+                # with "exit" durability writes are saved only if the run exits
+                # before the step finishes, see _suppress_interrupt
+                flush = self.durability != "exit" and (
+                    # errors and interrupts end the step, save them right away
+                    writes[0][0] == ERROR
+                    or writes[0][0] == INTERRUPT
+                    or len(self.writes_batch) >= self.put_writes_batch_size
+                    or monotonic() - self.writes_batch_started
+                    >= self.put_writes_batch_window
+                    # the writes of the last task of the step
+                    or len(self.tasks_with_writes) >= len(self.tasks)
+                )
+                if (
+                    not flush
+                    and self.durability != "exit"
+                    and self.writes_batch_timer is None
+                ):
+                    self.writes_batch_timer = self._flush_writes_later()
+            if flush:
+                self._flush_writes()
+        # save writes to cache
+        if (
+            not cached
+            and self.cache_set is not None
+            and (task := self.tasks.get(task_id))
+            and task.cache_key is not None
+            and writes[0][0] != ERROR
+            and writes[0][0] != INTERRUPT
+        ):
             self.submit(
-                self.checkpointer_put_writes,
-                {
-                    **self.checkpoint_config,
-                    CONF: {
-                        **self.checkpoint_config[CONF],
-                        CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
-                            CONFIG_KEY_CHECKPOINT_NS, ""
-                        ),
-                        CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
-                    },
-                },
-                writes,
-                task_id,
+                self.cache_set,
+                {(task.cache_key.ns, task.cache_key.key): (writes, task.cache_key.ttl)},
+                __reraise_on_exit__=False,
             )
         # output writes
-        self._output_writes(task_id, writes)
+        self._output_writes(task_id, writes, cached=cached)
+
+    def _flush_writes(self) -> None:
+        """Save the buffered writes of finished tasks with one checkpointer call.
+        Called before the writes of a step are applied, so that the writes of all
+        tasks are saved before the next checkpoint."""
+        with self.writes_batch_lock:
+            if self.writes_batch_timer is not None:
+                self.writes_batch_timer()
+                self.writes_batch_timer = None
+            batch, self.writes_batch = self.writes_batch, []
+            # submit while holding the lock, so that a flush from the timer
+            # can't race with the flush on exit, after the executor is closed
+            if batch and self.checkpointer_put_writes is not None:
+                self.submit(
+                    self.checkpointer_put_writes,
+                    {
+                        **self.checkpoint_config,
+                        CONF: {
+                            **self.checkpoint_config[CONF],
+                            CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
+                                CONFIG_KEY_CHECKPOINT_NS, ""
+                            ),
+                            CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
+                        },
+                    },
+                    batch,
+                )
+
+    def _flush_writes_later(self) -> Callable[[], None]:
+        """Schedule a flush of the buffered writes after the batch window.
+        Returns a function that cancels it."""
+        raise NotImplementedError
+
+    def match_cached_writes(self) -> None:
+        """Replay the writes of tasks found in the cache, so they're not executed."""
+        if self.cache is None:
+            return
+        if tasks := self._cacheable_tasks():
+            for key, writes in self.cache.get(list(tasks)).items():
+                # serializers may load the (channel, value) pairs as lists
+                writes = [tuple(w) for w in writes]
+                for task in tasks[key]:
+                    task.writes.extend(writes)
+                    self.put_writes(task.id, writes, cached=True)
+
+    async def amatch_cached_writes(self) -> None:
+        """Replay the writes of tasks found in the cache, so they're not executed."""
+        if self.cache is None:
+            return
+        if tasks := self._cacheable_tasks():
+            for key, writes in (await self.cache.aget(list(tasks))).items():
+                # serializers may load the (channel, value) pairs as lists
+                writes = [tuple(w) for w in writes]
+                for task in tasks[key]:
+                    task.writes.extend(writes)
+                    self.put_writes(task.id, writes, cached=True)
 
     def tick(
         self,
@@ -292,12 +419,14 @@ class PregelLoop(LoopProtocol):
                     ),
                 )
             # all tasks have finished
-            mv_writes = apply_writes(
-                self.checkpoint,
-                self.channels,
-                self.tasks.values(),
-                self.checkpointer_get_next_version,
-            )
+            with self._timed("apply_writes"):
+                mv_writes, self.updated_channels = apply_writes(
+                    self.checkpoint,
+                    self.channels,
+                    self.tasks.values(),
+                    self.checkpointer_get_next_version,
+                    notify_channels=self.notify_channels,
+                )
             # apply writes to managed values
             for key, values in mv_writes.items():
                 self._update_mv(key, values)
@@ -319,6 +448,9 @@ class PregelLoop(LoopProtocol):
                     ),
                 }
             )
+            # produce timings output, for the step that just finished
+            if self.timer is not None:
+                self._emit("timings", self.timer.flush, self.step - 1)
             # after execution, check if we should interrupt
             if should_interrupt(self.checkpoint, interrupt_after, self.tasks.values()):
                 self.status = "interrupt_after"
@@ -332,18 +464,22 @@ class PregelLoop(LoopProtocol):
             return False
 
         # prepare next tasks
-        self.tasks = prepare_next_tasks(
-            self.checkpoint,
-            self.nodes,
-            self.channels,
-            self.managed,
-            self.config,
-            self.step,
-            for_execution=True,
-            manager=manager,
-            store=self.store,
-            checkpointer=self.checkpointer,
-        )
+        with self._timed("prepare_next_tasks"):
+            self.tasks = prepare_next_tasks(
+                self.checkpoint,
+                self.nodes,
+                self.channels,
+                self.managed,
+                self.config,
+                self.step,
+                for_execution=True,
+                manager=manager,
+                store=self.store,
+                checkpointer=self.checkpointer,
+                cache=self.cache,
+                trigger_to_nodes=self.trigger_to_nodes,
+                updated_channels=self.updated_channels,
+            )
 
         # produce debug output
         if self._checkpointer_put_after_previous is not None:
@@ -399,6 +535,8 @@ class PregelLoop(LoopProtocol):
             for task in self.tasks.values():
                 if task.writes:
                     self._output_writes(task.id, task.writes, cached=True)
+        with self.writes_batch_lock:
+            self.tasks_with_writes = {t.id for t in self.tasks.values() if t.writes}
 
         # if all tasks have finished, re-tick
         if all(task.writes for task in self.tasks.values()):
@@ -471,11 +609,12 @@ class PregelLoop(LoopProtocol):
                 manager=None,
             )
             # apply input writes
-            mv_writes = apply_writes(
+            mv_writes, self.updated_channels = apply_writes(
                 self.checkpoint,
                 self.channels,
                 [*discard_tasks.values(), PregelTaskWrites(INPUT, input_writes, [])],
                 self.checkpointer_get_next_version,
+                notify_channels=self.notify_channels,
             )
             assert not mv_writes, "Can't write to SharedValues in graph input"
             # save input checkpoint
@@ -484,13 +623,24 @@ class PregelLoop(LoopProtocol):
             raise EmptyInputError(f"Received no input for {input_keys}")
         # done with input
         self.input = INPUT_RESUMING if is_resuming else INPUT_DONE
-        # update config
+        # update config, subgraphs inherit the durability through task configs
         if not self.is_nested:
             self.config = patch_configurable(
-                self.config, {CONFIG_KEY_RESUMING: is_resuming}
+                self.config,
+                {
+                    CONFIG_KEY_RESUMING: is_resuming,
+                    CONFIG_KEY_DURABILITY: self.durability,
+                },
             )
 
     def _put_checkpoint(self, metadata: CheckpointMetadata) -> None:
+        if self.durability == "exit":
+            # writes of the previous step are part of the new checkpoint
+            with self.writes_batch_lock:
+                self.writes_batch.clear()
+        else:
+            # save writes of the previous checkpoint
+            self._flush_writes()
         # assign step and parents
         metadata["step"] = self.step
         metadata["parents"] = self.config[CONF].get(CONFIG_KEY_CHECKPOINT_MAP, {})
@@ -506,63 +656,97 @@ class PregelLoop(LoopProtocol):
                 ),
             )
         # create new checkpoint
-        self.checkpoint = create_checkpoint(self.checkpoint, self.channels, self.step)
+        with self._timed("create_checkpoint"):
+            self.checkpoint = create_checkpoint(
+                self.checkpoint, self.channels, self.step
+            )
         # bail if no checkpointer
         if self._checkpointer_put_after_previous is not None:
             self.checkpoint_metadata = metadata
-
-            self.prev_checkpoint_config = (
-                self.checkpoint_config
-                if CONFIG_KEY_CHECKPOINT_ID in self.checkpoint_config[CONF]
-                and self.checkpoint_config[CONF][CONFIG_KEY_CHECKPOINT_ID]
-                else None
-            )
-            self.checkpoint_config = {
-                **self.checkpoint_config,
-                CONF: {
-                    **self.checkpoint_config[CONF],
-                    CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
-                        CONFIG_KEY_CHECKPOINT_NS, ""
-                    ),
-                },
-            }
-
-            channel_versions = self.checkpoint["channel_versions"].copy()
-            new_versions = get_new_channel_versions(
-                self.checkpoint_previous_versions, channel_versions
-            )
-            self.checkpoint_previous_versions = channel_versions
-
-            # save it, without blocking
-            # if there's a previous checkpoint save in progress, wait for it
-            # ensuring checkpointers receive checkpoints in order
-            self._put_checkpoint_fut = self.submit(
-                self._checkpointer_put_after_previous,
-                getattr(self, "_put_checkpoint_fut", None),
-                self.checkpoint_config,
-                copy_checkpoint(self.checkpoint),
-                self.checkpoint_metadata,
-                new_versions,
-            )
-            self.checkpoint_config = {
-                **self.checkpoint_config,
-                CONF: {
-                    **self.checkpoint_config[CONF],
-                    CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
-                },
-            }
+            if self.durability == "exit":
+                # keep the checkpoint in memory, it's saved on exit
+                self.checkpoint_unsaved = True
+            else:
+                self._save_checkpoint()
         # increment step
         self.step += 1
 
+    def _save_checkpoint(self) -> None:
+        """Save the current checkpoint, without blocking."""
+        self.checkpoint_unsaved = False
+        self.prev_checkpoint_config = (
+            self.checkpoint_config
+            if CONFIG_KEY_CHECKPOINT_ID in self.checkpoint_config[CONF]
+            and self.checkpoint_config[CONF][CONFIG_KEY_CHECKPOINT_ID]
+            else None
+        )
+        self.checkpoint_config = {
+            **self.checkpoint_config,
+            CONF: {
+                **self.checkpoint_config[CONF],
+                CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
+                    CONFIG_KEY_CHECKPOINT_NS, ""
+                ),
+            },
+        }
+
+        channel_versions = self.checkpoint["channel_versions"].copy()
+        new_versions = get_new_channel_versions(
+            self.checkpoint_previous_versions, channel_versions
+        )
+        self.checkpoint_previous_versions = channel_versions
+
+        # save it, without blocking
+        # if there's a previous checkpoint save in progress, wait for it
+        # ensuring checkpointers receive checkpoints in order
+        self._put_checkpoint_fut = self.submit(
+            self._checkpointer_put_after_previous,
+            getattr(self, "_put_checkpoint_fut", None),
+            self.checkpoint_config,
+            copy_checkpoint(self.checkpoint),
+            self.checkpoint_metadata,
+            new_versions,
+        )
+        self.checkpoint_config = {
+            **self.checkpoint_config,
+            CONF: {
+                **self.checkpoint_config[CONF],
+                CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
+            },
+        }
+
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         raise NotImplementedError
 
+    def _timed(
+        self, phase: str, serialized: Optional[str] = None
+    ) -> ContextManager[None]:
+        return (
+            self.timer.phase(phase, serialized)
+            if self.timer is not None
+            else nullcontext()
+        )
+
+    def _cacheable_tasks(self) -> dict[FullKey, list[PregelExecutableTask]]:
+        tasks: dict[FullKey, list[PregelExecutableTask]] = {}
+        for task in self.tasks.values():
+            if task.cache_key is not None and not task.writes:
+                tasks.setdefault((task.cache_key.ns, task.cache_key.key), []).append(
+                    task
+                )
+        return tasks
+
     def _suppress_interrupt(
         self,
         exc_type: Optional[Type[BaseException]],
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> Optional[bool]:
+        # save the last checkpoint, if kept in memory
+        if self.checkpoint_unsaved:
+            self._save_checkpoint()
+        # save writes of tasks that finished before exiting
+        self._flush_writes()
         suppress = isinstance(exc_value, GraphInterrupt) and not self.is_nested
         if suppress or exc_type is None:
             # save final output
@@ -624,10 +808,13 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         config: RunnableConfig,
         store: Optional[BaseStore],
         checkpointer: Optional[BaseCheckpointSaver],
+        cache: Optional[BaseCache] = None,
+        durability: Durability = "async",
         nodes: Mapping[str, PregelNode],
         specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
         output_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         stream_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
         check_subgraphs: bool = True,
         debug: bool = False,
     ) -> None:
@@ -637,21 +824,32 @@ class SyncPregelLoop(PregelLoop, ContextManager):
             config=config,
             checkpointer=checkpointer,
             store=store,
+            cache=cache,
+            durability=durability,
             nodes=nodes,
             specs=specs,
             output_keys=output_keys,
             stream_keys=stream_keys,
+            trigger_to_nodes=trigger_to_nodes,
             check_subgraphs=check_subgraphs,
             debug=debug,
         )
         self.stack = ExitStack()
+        self.writes_batch_cond = threading.Condition(self.writes_batch_lock)
+        self.writes_flusher: Optional[threading.Thread] = None
+        self.writes_flusher_stopped = False
         if checkpointer:
             self.checkpointer_get_next_version = checkpointer.get_next_version
-            self.checkpointer_put_writes = checkpointer.put_writes
+            self.checkpointer_put_writes = checkpointer.put_writes_batch
+            if self.timer is not None:
+                self.checkpointer_put_writes = self.timer.wrap(
+                    "checkpointer_put_writes", self.checkpointer_put_writes, "writes"
+                )
         else:
             self.checkpointer_get_next_version = increment
             self._checkpointer_put_after_previous = None  # type: ignore[assignment]
             self.checkpointer_put_writes = None
+        self.cache_set = cache.set if cache is not None else None
 
     def _checkpointer_put_after_previous(
         self,
@@ -665,13 +863,58 @@ class SyncPregelLoop(PregelLoop, ContextManager):
             if prev is not None:
                 prev.result()
         finally:
-            cast(BaseCheckpointSaver, self.checkpointer).put(
-                config, checkpoint, metadata, new_versions
-            )
+            with self._timed("checkpointer_put", "checkpoint"):
+                cast(BaseCheckpointSaver, self.checkpointer).put(
+                    config, checkpoint, metadata, new_versions
+                )
 
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         return self.submit(cast(WritableManagedValue, self.managed[key]).update, values)
 
+    def wait_for_checkpoint(self) -> None:
+        """Block until the last checkpoint is saved, if durability is "sync"."""
+        if self.durability == "sync" and (
+            fut := getattr(self, "_put_checkpoint_fut", None)
+        ):
+            fut.result()
+
+    def _flush_writes_later(self) -> Callable[[], None]:
+        # called with writes_batch_lock held, a single thread owned by the loop
+        # flushes each batch after its window
+        if self.writes_flusher is None:
+            self.writes_flusher = threading.Thread(
+                target=self._flush_writes_after_window, daemon=True
+            )
+            self.writes_flusher.start()
+        self.writes_batch_cond.notify()
+        return self.writes_batch_cond.notify
+
+    def _flush_writes_after_window(self) -> None:
+        while True:
+            with self.writes_batch_cond:
+                while not self.writes_flusher_stopped and (
+                    self.writes_batch_timer is None
+                    or monotonic() - self.writes_batch_started
+                    < self.put_writes_batch_window
+                ):
+                    self.writes_batch_cond.wait(
+                        None
+                        if self.writes_batch_timer is None
+                        else self.writes_batch_started
+                        + self.put_writes_batch_window
+                        - monotonic()
+                    )
+                if self.writes_flusher_stopped:
+                    return
+            self._flush_writes()
+
+    def _stop_writes_flusher(self) -> None:
+        with self.writes_batch_cond:
+            self.writes_flusher_stopped = True
+            self.writes_batch_cond.notify()
+        if self.writes_flusher is not None:
+            self.writes_flusher.join()
+
     # context manager
 
     def __enter__(self) -> Self:
@@ -720,9 +963,14 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         )
 
         self.submit = self.stack.enter_context(BackgroundExecutor(self.config))
+        # stopped after the writes are flushed on exit, before the executor is
+        self.stack.callback(self._stop_writes_flusher)
         self.channels, self.managed = self.stack.enter_context(
             ChannelsManager(self.specs, self.checkpoint, self)
         )
+        self.notify_channels = [
+            k for k, v in self.channels.items() if v.notify_on_new_step
+        ]
         self.stack.push(self._suppress_interrupt)
         self.status = "pending"
         self.step = self.checkpoint_metadata["step"] + 1
@@ -750,10 +998,13 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         config: RunnableConfig,
         store: Optional[BaseStore],
         checkpointer: Optional[BaseCheckpointSaver],
+        cache: Optional[BaseCache] = None,
+        durability: Durability = "async",
         nodes: Mapping[str, PregelNode],
         specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
         output_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         stream_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
         check_subgraphs: bool = True,
         debug: bool = False,
     ) -> None:
@@ -763,21 +1014,29 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             config=config,
             checkpointer=checkpointer,
             store=store,
+            cache=cache,
+            durability=durability,
             nodes=nodes,
             specs=specs,
             output_keys=output_keys,
             stream_keys=stream_keys,
+            trigger_to_nodes=trigger_to_nodes,
             check_subgraphs=check_subgraphs,
             debug=debug,
         )
         self.stack = AsyncExitStack()
         if checkpointer:
             self.checkpointer_get_next_version = checkpointer.get_next_version
-            self.checkpointer_put_writes = checkpointer.aput_writes
+            self.checkpointer_put_writes = checkpointer.aput_writes_batch
+            if self.timer is not None:
+                self.checkpointer_put_writes = self.timer.awrap(
+                    "checkpointer_put_writes", self.checkpointer_put_writes, "writes"
+                )
         else:
             self.checkpointer_get_next_version = increment
             self._checkpointer_put_after_previous = None  # type: ignore[assignment]
             self.checkpointer_put_writes = None
+        self.cache_set = cache.aset if cache is not None else None
 
     async def _checkpointer_put_after_previous(
         self,
@@ -791,15 +1050,30 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             if prev is not None:
                 await prev
         finally:
-            await cast(BaseCheckpointSaver, self.checkpointer).aput(
-                config, checkpoint, metadata, new_versions
-            )
+            with self._timed("checkpointer_put", "checkpoint"):
+                await cast(BaseCheckpointSaver, self.checkpointer).aput(
+                    config, checkpoint, metadata, new_versions
+                )
 
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         return self.submit(
             cast(WritableManagedValue, self.managed[key]).aupdate, values
         )
 
+    async def await_checkpoint(self) -> None:
+        """Wait until the last checkpoint is saved, if durability is "sync"."""
+        if self.durability == "sync" and (
+            fut := getattr(self, "_put_checkpoint_fut", None)
+        ):
+            await fut
+
+    def _flush_writes_later(self) -> Callable[[], None]:
+        return (
+            asyncio.get_running_loop()
+            .call_later(self.put_writes_batch_window, self._flush_writes)
+            .cancel
+        )
+
     # context manager
 
     async def __aenter__(self) -> Self:
@@ -853,6 +1127,9 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         self.channels, self.managed = await self.stack.enter_async_context(
             AsyncChannelsManager(self.specs, self.checkpoint, self)
         )
+        self.notify_channels = [
+            k for k, v in self.channels.items() if v.notify_on_new_step
+        ]
         self.stack.push(self._suppress_interrupt)
         self.status = "pending"
         self.step = self.checkpoint_metadata["step"] + 1
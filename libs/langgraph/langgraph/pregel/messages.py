@@ -1,3 +1,4 @@
+from time import monotonic
 from typing import (
     Any,
     AsyncIterator,
@@ -13,12 +14,13 @@ from typing import (
 from uuid import UUID, uuid4
 
 from langchain_core.callbacks import BaseCallbackHandler
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import BaseMessage, BaseMessageChunk
 from langchain_core.outputs import ChatGenerationChunk, LLMResult
 from langchain_core.tracers._streaming import T, _StreamingCallbackHandler
 
 from langgraph.constants import NS_SEP, TAG_HIDDEN, TAG_NOSTREAM
 from langgraph.pregel.loop import StreamChunk
+from langgraph.types import TokenCoalescing
 
 Meta = tuple[tuple[str, ...], dict[str, Any]]
 
@@ -30,10 +32,18 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
     run_inline = True
     """We want this callback to run in the main thread, to avoid order/locking issues."""
 
-    def __init__(self, stream: Callable[[StreamChunk], None]):
+    def __init__(
+        self,
+        stream: Callable[[StreamChunk], None],
+        coalesce: Optional[TokenCoalescing] = None,
+    ):
         self.stream = stream
+        self.coalesce = coalesce
         self.metadata: dict[UUID, Meta] = {}
         self.seen: set[Union[int, str]] = set()
+        # tokens not yet emitted, per chat model run, with their count and
+        # the time the first one was received
+        self.pending: dict[UUID, tuple[Meta, BaseMessageChunk, int, float]] = {}
 
     def _emit(self, meta: Meta, message: BaseMessage, *, dedupe: bool = False) -> None:
         if dedupe and message.id in self.seen:
@@ -81,7 +91,38 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         if not isinstance(chunk, ChatGenerationChunk):
             return
         if meta := self.metadata.get(run_id):
-            self._emit(meta, chunk.message)
+            if self.coalesce is not None and isinstance(
+                chunk.message, BaseMessageChunk
+            ):
+                self._coalesce(run_id, meta, chunk.message)
+            else:
+                self._emit(meta, chunk.message)
+
+    def _coalesce(self, run_id: UUID, meta: Meta, message: BaseMessageChunk) -> None:
+        """Merge a token into the pending chunk of the run, and emit it once it
+        holds enough tokens or is old enough."""
+        assert self.coalesce is not None
+        pending = self.pending.pop(run_id, None)
+        if pending is not None and pending[1].id == message.id:
+            _, merged, count, started = pending
+            merged, count = merged + message, count + 1
+        else:
+            if pending is not None:
+                self._emit(pending[0], pending[1])
+            merged, count, started = message, 1, monotonic()
+        if (
+            self.coalesce.max_tokens is not None and count >= self.coalesce.max_tokens
+        ) or (
+            self.coalesce.window is not None
+            and monotonic() - started >= self.coalesce.window
+        ):
+            self._emit(meta, merged)
+        else:
+            self.pending[run_id] = (meta, merged, count, started)
+
+    def _flush(self, run_id: UUID) -> None:
+        if pending := self.pending.pop(run_id, None):
+            self._emit(pending[0], pending[1])
 
     def on_llm_end(
         self,
@@ -91,6 +132,7 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         parent_run_id: Optional[UUID] = None,
         **kwargs: Any,
     ) -> Any:
+        self._flush(run_id)
         self.metadata.pop(run_id, None)
 
     def on_llm_error(
@@ -101,6 +143,7 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         parent_run_id: Optional[UUID] = None,
         **kwargs: Any,
     ) -> Any:
+        self._flush(run_id)
         self.metadata.pop(run_id, None)
 
     def on_chain_start(
@@ -24,6 +24,7 @@ from langchain_core.runnables.utils import ConfigurableFieldSpec
 from langgraph.constants import CONF, CONFIG_KEY_READ
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.pregel.write import ChannelWrite
+from langgraph.types import CachePolicy
 from langgraph.utils.config import merge_configs
 from langgraph.utils.runnable import RunnableCallable, RunnableSeq
 
@@ -139,6 +140,21 @@ class PregelNode(Runnable):
     retry_policy: Optional[RetryPolicy]
     """The retry policy to use when invoking the node."""
 
+    cache_policy: Optional[CachePolicy]
+    """The cache policy to use when invoking the node."""
+
+    max_concurrency: Optional[int]
+    """The maximum number of tasks of this node to run concurrently in a step."""
+
+    concurrency_weight: int
+    """The number of slots of the run's `max_concurrency` each task of this node
+    takes up."""
+
+    batched: Union[bool, Callable[[list[Any]], Sequence[Any]]]
+    """Whether to run the PUSH tasks of this node in a step with a single call,
+    either of `bound.batch` if True, or of the given function, which is called
+    with the list of inputs and returns the list of outputs of `bound`."""
+
     tags: Optional[Sequence[str]]
     """Tags to attach to the node for tracing."""
 
@@ -156,6 +172,10 @@ class PregelNode(Runnable):
         metadata: Optional[Mapping[str, Any]] = None,
         bound: Optional[Runnable[Any, Any]] = None,
         retry_policy: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        max_concurrency: Optional[int] = None,
+        concurrency_weight: int = 1,
+        batched: Union[bool, Callable[[list[Any]], Sequence[Any]]] = False,
     ) -> None:
         self.channels = channels
         self.triggers = list(triggers)
@@ -163,6 +183,10 @@ class PregelNode(Runnable):
         self.writers = writers or []
         self.bound = bound if bound is not None else DEFAULT_BOUND
         self.retry_policy = retry_policy
+        self.cache_policy = cache_policy
+        self.max_concurrency = max_concurrency
+        self.concurrency_weight = concurrency_weight
+        self.batched = batched
         self.tags = tags
         self.metadata = metadata
 
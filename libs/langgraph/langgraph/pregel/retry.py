@@ -2,13 +2,18 @@ import asyncio
 import logging
 import random
 import time
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from langchain_core.runnables.config import run_in_executor
 
 from langgraph.constants import CONF, CONFIG_KEY_CHECKPOINT_NS, CONFIG_KEY_RESUMING
 from langgraph.errors import _SEEN_CHECKPOINT_NS, GraphInterrupt
-from langgraph.types import PregelExecutableTask, RetryPolicy
+from langgraph.types import PregelExecutableTask, PregelTaskBatch, RetryPolicy
 from langgraph.utils.config import patch_configurable
 
+if TYPE_CHECKING:
+    from langgraph.pregel.read import PregelNode
+
 logger = logging.getLogger(__name__)
 
 
@@ -151,3 +156,123 @@ async def arun_with_retry(
             # clear checkpoint_ns seen (for subgraph detection)
             if checkpoint_ns := config[CONF].get(CONFIG_KEY_CHECKPOINT_NS):
                 _SEEN_CHECKPOINT_NS.discard(checkpoint_ns)
+
+
+def run_batch_with_retry(
+    batch: PregelTaskBatch,
+    node: "PregelNode",
+    retry_policy: Optional[RetryPolicy],
+) -> None:
+    """Run the tasks of a batch with a single call, then retry the tasks that
+    failed individually. Errors are recorded per task in `batch.errors`."""
+    for task in batch.tasks:
+        task.writes.clear()
+    try:
+        inputs = [task.input for task in batch.tasks]
+        if node.batched is True:
+            outputs: Sequence[Any] = node.bound.batch(
+                inputs, [task.config for task in batch.tasks], return_exceptions=True
+            )
+        elif asyncio.iscoroutinefunction(node.batched):
+            raise TypeError(
+                f"Node '{batch.name}' has an async batch function, "
+                "which can only be used when running the graph asynchronously"
+            )
+        else:
+            outputs = _check_batch_outputs(batch, node.batched(inputs))
+    except Exception as exc:
+        outputs = [exc] * len(batch.tasks)
+    finally:
+        # clear checkpoint_ns seen (for subgraph detection), before retries
+        _clear_seen_checkpoint_ns(batch)
+    for task, output in zip(batch.tasks, outputs):
+        if not isinstance(output, Exception):
+            try:
+                for writer in node.flat_writers:
+                    output = writer.invoke(output, task.config)
+                continue
+            except Exception as exc:
+                output = exc
+        if not isinstance(output, GraphInterrupt) and (
+            task.retry_policy or retry_policy
+        ):
+            try:
+                run_with_retry(task, retry_policy)
+                continue
+            except Exception as exc:
+                output = exc
+        batch.errors[task.id] = output
+    _raise_batch_errors(batch)
+
+
+async def arun_batch_with_retry(
+    batch: PregelTaskBatch,
+    node: "PregelNode",
+    retry_policy: Optional[RetryPolicy],
+    stream: bool = False,
+) -> None:
+    """Run the tasks of a batch asynchronously with a single call, then retry
+    the tasks that failed individually. Errors are recorded per task in
+    `batch.errors`."""
+    for task in batch.tasks:
+        task.writes.clear()
+    try:
+        inputs = [task.input for task in batch.tasks]
+        if node.batched is True:
+            outputs: Sequence[Any] = await node.bound.abatch(
+                inputs, [task.config for task in batch.tasks], return_exceptions=True
+            )
+        elif asyncio.iscoroutinefunction(node.batched):
+            outputs = _check_batch_outputs(batch, await node.batched(inputs))
+        else:
+            outputs = _check_batch_outputs(
+                batch, await run_in_executor(None, node.batched, inputs)
+            )
+    except Exception as exc:
+        outputs = [exc] * len(batch.tasks)
+    finally:
+        # clear checkpoint_ns seen (for subgraph detection), before retries
+        _clear_seen_checkpoint_ns(batch)
+    for task, output in zip(batch.tasks, outputs):
+        if not isinstance(output, Exception):
+            try:
+                for writer in node.flat_writers:
+                    output = await writer.ainvoke(output, task.config)
+                continue
+            except Exception as exc:
+                output = exc
+        if not isinstance(output, GraphInterrupt) and (
+            task.retry_policy or retry_policy
+        ):
+            try:
+                await arun_with_retry(task, retry_policy, stream=stream)
+                continue
+            except Exception as exc:
+                output = exc
+        batch.errors[task.id] = output
+    _raise_batch_errors(batch)
+
+
+def _clear_seen_checkpoint_ns(batch: PregelTaskBatch) -> None:
+    for task in batch.tasks:
+        if checkpoint_ns := task.config[CONF].get(CONFIG_KEY_CHECKPOINT_NS):
+            _SEEN_CHECKPOINT_NS.discard(checkpoint_ns)
+
+
+def _check_batch_outputs(batch: PregelTaskBatch, outputs: Any) -> Sequence[Any]:
+    if not isinstance(outputs, Sequence) or len(outputs) != len(batch.tasks):
+        raise ValueError(
+            f"Batch function of node '{batch.name}' must return a list "
+            f"of {len(batch.tasks)} outputs, got {outputs!r}"
+        )
+    return outputs
+
+
+def _raise_batch_errors(batch: PregelTaskBatch) -> None:
+    """Raise the first error of the batch, preferring errors to interrupts, so
+    that the batch fails like its tasks would have if run separately."""
+    for exc in batch.errors.values():
+        if not isinstance(exc, GraphInterrupt):
+            raise exc
+    for exc in batch.errors.values():
+        raise exc
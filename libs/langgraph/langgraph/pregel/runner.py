@@ -1,12 +1,16 @@
 import asyncio
 import concurrent.futures
 import time
+from collections import defaultdict, deque
+from functools import partial
 from typing import (
     Any,
     AsyncIterator,
+    Awaitable,
     Callable,
     Iterable,
     Iterator,
+    Mapping,
     Optional,
     Sequence,
     Type,
@@ -14,11 +18,17 @@ from typing import (
     cast,
 )
 
-from langgraph.constants import ERROR, INTERRUPT, NO_WRITES, TAG_HIDDEN
+from langgraph.constants import ERROR, INTERRUPT, NO_WRITES, PUSH, TAG_HIDDEN
 from langgraph.errors import GraphDelegate, GraphInterrupt
 from langgraph.pregel.executor import Submit
-from langgraph.pregel.retry import arun_with_retry, run_with_retry
-from langgraph.types import PregelExecutableTask, RetryPolicy
+from langgraph.pregel.read import PregelNode
+from langgraph.pregel.retry import (
+    arun_batch_with_retry,
+    arun_with_retry,
+    run_batch_with_retry,
+    run_with_retry,
+)
+from langgraph.types import PregelExecutableTask, PregelTaskBatch, RetryPolicy
 
 
 class PregelRunner:
@@ -33,11 +43,94 @@ class PregelRunner:
         put_writes: Callable[[str, Sequence[tuple[str, Any]]], None],
         use_astream: bool = False,
         node_finished: Optional[Callable[[str], None]] = None,
+        max_concurrency: Optional[int] = None,
+        node_max_concurrency: Optional[Mapping[str, int]] = None,
+        node_weights: Optional[Mapping[str, int]] = None,
+        batched_nodes: Optional[Mapping[str, PregelNode]] = None,
+        on_task_timing: Optional[Callable[[PregelExecutableTask, float], None]] = None,
     ) -> None:
         self.submit = submit
         self.put_writes = put_writes
         self.use_astream = use_astream
         self.node_finished = node_finished
+        self.max_concurrency = max_concurrency
+        self.node_max_concurrency = node_max_concurrency or {}
+        for node, limit in self.node_max_concurrency.items():
+            if limit < 1:
+                raise ValueError(
+                    f"max_node_concurrency of node '{node}' must be at least 1"
+                )
+        # weights only matter when there is a shared budget to take slots from
+        self.node_weights = node_weights if max_concurrency else {}
+        self.batched_nodes = batched_nodes or {}
+        self.on_task_timing = on_task_timing
+        if on_task_timing is not None:
+            self.run_with_retry: Callable[..., None] = partial(
+                _timed, on_task_timing, run_with_retry
+            )
+            self.arun_with_retry: Callable[..., Awaitable[None]] = partial(
+                _atimed, on_task_timing, arun_with_retry
+            )
+        else:
+            self.run_with_retry = run_with_retry
+            self.arun_with_retry = arun_with_retry
+
+    def _slots(self) -> Optional["ConcurrencySlots"]:
+        if self.node_max_concurrency or self.node_weights:
+            return ConcurrencySlots(
+                self.max_concurrency, self.node_max_concurrency, self.node_weights
+            )
+        else:
+            return None
+
+    def _batch(
+        self, tasks: Sequence[PregelExecutableTask]
+    ) -> Sequence[Union[PregelExecutableTask, PregelTaskBatch]]:
+        """Group the PUSH tasks of batched nodes into one batch per node."""
+        if not self.batched_nodes:
+            return tasks
+        units: list[Union[PregelExecutableTask, PregelTaskBatch]] = []
+        groups: defaultdict[str, list[PregelExecutableTask]] = defaultdict(list)
+        for t in tasks:
+            if t.name in self.batched_nodes and t.path[0] == PUSH:
+                groups[t.name].append(t)
+            else:
+                units.append(t)
+        for name, group in groups.items():
+            if len(group) == 1:
+                units.append(group[0])
+            else:
+                units.append(PregelTaskBatch(name, tuple(group), {}))
+        return units
+
+    def run_batch(
+        self, batch: PregelTaskBatch, retry_policy: Optional[RetryPolicy]
+    ) -> None:
+        start = time.perf_counter()
+        try:
+            run_batch_with_retry(batch, self.batched_nodes[batch.name], retry_policy)
+        finally:
+            if self.on_task_timing is not None:
+                duration = time.perf_counter() - start
+                for t in batch.tasks:
+                    self.on_task_timing(t, duration)
+
+    async def arun_batch(
+        self,
+        batch: PregelTaskBatch,
+        retry_policy: Optional[RetryPolicy],
+        stream: bool = False,
+    ) -> None:
+        start = time.perf_counter()
+        try:
+            await arun_batch_with_retry(
+                batch, self.batched_nodes[batch.name], retry_policy, stream=stream
+            )
+        finally:
+            if self.on_task_timing is not None:
+                duration = time.perf_counter() - start
+                for t in batch.tasks:
+                    self.on_task_timing(t, duration)
 
     def tick(
         self,
@@ -48,14 +141,17 @@ class PregelRunner:
         retry_policy: Optional[RetryPolicy] = None,
         get_waiter: Optional[Callable[[], concurrent.futures.Future[None]]] = None,
     ) -> Iterator[None]:
-        tasks = tuple(tasks)
+        # skip tasks that already have writes, eg. replayed from the cache
+        tasks = tuple(t for t in tasks if not t.writes)
         # give control back to the caller
         yield
+        if not tasks:
+            return
         # fast path if single task with no timeout and no waiter
         if len(tasks) == 1 and timeout is None and get_waiter is None:
             t = tasks[0]
             try:
-                run_with_retry(t, retry_policy)
+                self.run_with_retry(t, retry_policy)
                 self.commit(t, None)
             except Exception as exc:
                 self.commit(t, exc)
@@ -64,25 +160,35 @@ class PregelRunner:
             return
         # add waiter task if requested
         if get_waiter is not None:
-            futures: dict[concurrent.futures.Future, Optional[PregelExecutableTask]] = {
-                get_waiter(): None
-            }
+            futures: dict[
+                concurrent.futures.Future,
+                Union[PregelExecutableTask, PregelTaskBatch, None],
+            ] = {get_waiter(): None}
         else:
             futures = {}
         # execute tasks, and wait for one to fail or all to finish.
         # each task is independent from all other concurrent tasks
         # yield updates/debug output as each task finishes
-        for t in tasks:
-            if not t.writes:
-                futures[
-                    self.submit(
-                        run_with_retry,
-                        t,
-                        retry_policy,
-                        __reraise_on_exit__=reraise,
-                    )
-                ] = t
+        # tasks over their concurrency limits wait until a slot frees up
+        # tasks of batched nodes run together, and are committed separately
         all_futures = futures.copy()
+        slots = self._slots()
+        units = self._batch(tasks)
+        pending = deque(units)
+
+        def schedule() -> None:
+            for t in slots.take(pending) if slots else units:
+                fut = self.submit(
+                    self.run_batch
+                    if isinstance(t, PregelTaskBatch)
+                    else self.run_with_retry,
+                    t,
+                    retry_policy,
+                    __reraise_on_exit__=reraise,
+                )
+                futures[fut] = all_futures[fut] = t
+
+        schedule()
         end_time = timeout + time.monotonic() if timeout else None
         while len(futures) > (1 if get_waiter is not None else 0):
             done, inflight = concurrent.futures.wait(
@@ -100,7 +206,11 @@ class PregelRunner:
                         futures[get_waiter()] = None
                 else:
                     # task finished, commit writes
-                    self.commit(task, _exception(fut))
+                    self.commit_unit(task, _exception(fut))
+                    # start tasks that were waiting for its slots
+                    if slots:
+                        slots.release(task)
+                        schedule()
             else:
                 # remove references to loop vars
                 del fut, task
@@ -122,14 +232,17 @@ class PregelRunner:
         get_waiter: Optional[Callable[[], asyncio.Future[None]]] = None,
     ) -> AsyncIterator[None]:
         loop = asyncio.get_event_loop()
-        tasks = tuple(tasks)
+        # skip tasks that already have writes, eg. replayed from the cache
+        tasks = tuple(t for t in tasks if not t.writes)
         # give control back to the caller
         yield
+        if not tasks:
+            return
         # fast path if single task with no waiter and no timeout
         if len(tasks) == 1 and get_waiter is None and timeout is None:
             t = tasks[0]
             try:
-                await arun_with_retry(t, retry_policy, stream=self.use_astream)
+                await self.arun_with_retry(t, retry_policy, stream=self.use_astream)
                 self.commit(t, None)
             except Exception as exc:
                 self.commit(t, exc)
@@ -138,31 +251,40 @@ class PregelRunner:
             return
         # add waiter task if requested
         if get_waiter is not None:
-            futures: dict[asyncio.Future, Optional[PregelExecutableTask]] = {
-                get_waiter(): None
-            }
+            futures: dict[
+                asyncio.Future, Union[PregelExecutableTask, PregelTaskBatch, None]
+            ] = {get_waiter(): None}
         else:
             futures = {}
         # execute tasks, and wait for one to fail or all to finish.
         # each task is independent from all other concurrent tasks
         # yield updates/debug output as each task finishes
-        for t in tasks:
-            if not t.writes:
-                futures[
-                    cast(
-                        asyncio.Future,
-                        self.submit(
-                            arun_with_retry,
-                            t,
-                            retry_policy,
-                            stream=self.use_astream,
-                            __name__=t.name,
-                            __cancel_on_exit__=True,
-                            __reraise_on_exit__=reraise,
-                        ),
-                    )
-                ] = t
+        # tasks over their concurrency limits wait until a slot frees up
+        # tasks of batched nodes run together, and are committed separately
         all_futures = futures.copy()
+        slots = self._slots()
+        units = self._batch(tasks)
+        pending = deque(units)
+
+        def schedule() -> None:
+            for t in slots.take(pending) if slots else units:
+                fut = cast(
+                    asyncio.Future,
+                    self.submit(
+                        self.arun_batch
+                        if isinstance(t, PregelTaskBatch)
+                        else self.arun_with_retry,
+                        t,
+                        retry_policy,
+                        stream=self.use_astream,
+                        __name__=t.name,
+                        __cancel_on_exit__=True,
+                        __reraise_on_exit__=reraise,
+                    ),
+                )
+                futures[fut] = all_futures[fut] = t
+
+        schedule()
         end_time = timeout + loop.time() if timeout else None
         while len(futures) > (1 if get_waiter is not None else 0):
             done, inflight = await asyncio.wait(
@@ -180,7 +302,11 @@ class PregelRunner:
                         futures[get_waiter()] = None
                 else:
                     # task finished, commit writes
-                    self.commit(task, _exception(fut))
+                    self.commit_unit(task, _exception(fut))
+                    # start tasks that were waiting for its slots
+                    if slots:
+                        slots.release(task)
+                        schedule()
             else:
                 # remove references to loop vars
                 del fut, task
@@ -197,6 +323,22 @@ class PregelRunner:
             all_futures, timeout_exc_cls=asyncio.TimeoutError, panic=reraise
         )
 
+    def commit_unit(
+        self,
+        unit: Union[PregelExecutableTask, PregelTaskBatch],
+        exception: Optional[BaseException],
+    ) -> None:
+        if isinstance(unit, PregelTaskBatch):
+            # tasks keep their own errors, unless the batch itself failed,
+            # eg. when cancelled
+            batch_failed = exception is not None and all(
+                e is not exception for e in unit.errors.values()
+            )
+            for t in unit.tasks:
+                self.commit(t, exception if batch_failed else unit.errors.get(t.id))
+        else:
+            self.commit(unit, exception)
+
     def commit(
         self, task: PregelExecutableTask, exception: Optional[BaseException]
     ) -> None:
@@ -222,6 +364,82 @@ class PregelRunner:
             self.put_writes(task.id, task.writes)
 
 
+class ConcurrencySlots:
+    """Tracks the concurrency slots taken by the running tasks of a step,
+    per node and out of the shared `max_concurrency` budget."""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int],
+        node_max_concurrency: Mapping[str, int],
+        node_weights: Mapping[str, int],
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.node_max_concurrency = node_max_concurrency
+        self.node_weights = node_weights
+        self.running: defaultdict[str, int] = defaultdict(int)
+        self.used = 0
+
+    def weight(self, task: Union[PregelExecutableTask, PregelTaskBatch]) -> int:
+        weight = self.node_weights.get(task.name, 1)
+        # a task heavier than the whole budget runs alone
+        return min(weight, self.max_concurrency) if self.max_concurrency else weight
+
+    def take(
+        self, pending: deque[Union[PregelExecutableTask, PregelTaskBatch]]
+    ) -> list[Union[PregelExecutableTask, PregelTaskBatch]]:
+        """Take slots for the pending tasks that fit, and remove them from the
+        queue. Tasks that don't fit keep their place in the queue."""
+        ready: list[Union[PregelExecutableTask, PregelTaskBatch]] = []
+        for _ in range(len(pending)):
+            task = pending.popleft()
+            weight = self.weight(task)
+            limit = self.node_max_concurrency.get(task.name)
+            if (limit is None or self.running[task.name] < limit) and (
+                self.max_concurrency is None
+                or self.used + weight <= self.max_concurrency
+            ):
+                self.running[task.name] += 1
+                self.used += weight
+                ready.append(task)
+            else:
+                pending.append(task)
+        return ready
+
+    def release(self, task: Union[PregelExecutableTask, PregelTaskBatch]) -> None:
+        """Free the slots taken by a finished task."""
+        self.running[task.name] -= 1
+        self.used -= self.weight(task)
+
+
+def _timed(
+    on_timing: Callable[[PregelExecutableTask, float], None],
+    run: Callable[..., None],
+    task: PregelExecutableTask,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    start = time.perf_counter()
+    try:
+        run(task, *args, **kwargs)
+    finally:
+        on_timing(task, time.perf_counter() - start)
+
+
+async def _atimed(
+    on_timing: Callable[[PregelExecutableTask, float], None],
+    run: Callable[..., Awaitable[None]],
+    task: PregelExecutableTask,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    start = time.perf_counter()
+    try:
+        await run(task, *args, **kwargs)
+    finally:
+        on_timing(task, time.perf_counter() - start)
+
+
 def _should_stop_others(
     done: Union[set[concurrent.futures.Future[Any]], set[asyncio.Future[Any]]],
 ) -> bool:
@@ -251,8 +469,11 @@ def _exception(
 
 def _panic_or_proceed(
     futs: Union[
-        dict[concurrent.futures.Future, Optional[PregelExecutableTask]],
-        dict[asyncio.Future, Optional[PregelExecutableTask]],
+        dict[
+            concurrent.futures.Future,
+            Union[PregelExecutableTask, PregelTaskBatch, None],
+        ],
+        dict[asyncio.Future, Union[PregelExecutableTask, PregelTaskBatch, None]],
     ],
     *,
     timeout_exc_cls: Type[Exception] = TimeoutError,
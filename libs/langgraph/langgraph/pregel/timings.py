@@ -0,0 +1,152 @@
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from typing_extensions import ParamSpec
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.types import PregelExecutableTask
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# the timer and the name to record the serializer calls made in this context under
+_measuring: ContextVar[Optional[tuple["StepTimer", str]]] = ContextVar(
+    "langgraph_measuring", default=None
+)
+
+
+class MeasuredSerializer(SerializerProtocol):
+    """Wraps the serializer of a checkpointer, to record the duration and size of
+    the values it serializes within `StepTimer.phase(..., serialized=...)`.
+    Other calls are passed through."""
+
+    def __init__(self, serde: SerializerProtocol) -> None:
+        self.serde = serde
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.serde, name)
+
+    def dumps(self, obj: Any) -> bytes:
+        if (measuring := _measuring.get()) is None:
+            return self.serde.dumps(obj)
+        start = perf_counter()
+        data = self.serde.dumps(obj)
+        measuring[0].serialized(measuring[1], perf_counter() - start, len(data))
+        return data
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        if (measuring := _measuring.get()) is None:
+            return self.serde.dumps_typed(obj)
+        start = perf_counter()
+        type_, data = self.serde.dumps_typed(obj)
+        measuring[0].serialized(measuring[1], perf_counter() - start, len(data))
+        return type_, data
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        return self.serde.loads_typed(data)
+
+
+def measure_serializer(checkpointer: BaseCheckpointSaver) -> None:
+    """Wrap the serializer of the checkpointer, once, so that the values it
+    serializes for a timed run are recorded."""
+    if not isinstance(checkpointer.serde, MeasuredSerializer):
+        checkpointer.serde = MeasuredSerializer(checkpointer.serde)
+
+
+class StepTimer:
+    """Collects the durations of the phases and tasks of each step of a run,
+    and the size of the serialized checkpoints and writes, for the "timings"
+    stream mode.
+
+    Phases run in the background, eg. checkpointer calls, are attributed to the
+    step during which they finish."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.phases: defaultdict[str, float] = defaultdict(float)
+        self.bytes: defaultdict[str, int] = defaultdict(int)
+        self.tasks: dict[str, dict[str, Any]] = {}
+        # metrics of the stream buffer since last called, if bounded
+        self.buffer_stats: Optional[Callable[[], dict[str, Any]]] = None
+
+    def add(self, name: str, duration: float) -> None:
+        with self.lock:
+            self.phases[name] += duration
+
+    @contextmanager
+    def phase(self, name: str, serialized: Optional[str] = None) -> Iterator[None]:
+        """Time the enclosed block as (part of) the given phase. If `serialized`
+        is given, the values serialized by the checkpointer meanwhile are
+        recorded under that name, and their serialization as the "serialize"
+        phase, see `measure_serializer`."""
+        start = perf_counter()
+        token = _measuring.set((self, serialized)) if serialized else None
+        try:
+            yield
+        finally:
+            if token is not None:
+                _measuring.reset(token)
+            self.add(name, perf_counter() - start)
+
+    def wrap(
+        self, name: str, func: Callable[P, T], serialized: Optional[str] = None
+    ) -> Callable[P, T]:
+        """Wrap a sync function, timing each call as part of the given phase."""
+
+        @wraps(func)
+        def timed(*args: P.args, **kwargs: P.kwargs) -> T:
+            with self.phase(name, serialized):
+                return func(*args, **kwargs)
+
+        return timed
+
+    def awrap(
+        self,
+        name: str,
+        func: Callable[P, Awaitable[T]],
+        serialized: Optional[str] = None,
+    ) -> Callable[P, Awaitable[T]]:
+        """Wrap an async function, timing each call as part of the given phase."""
+
+        @wraps(func)
+        async def timed(*args: P.args, **kwargs: P.kwargs) -> T:
+            with self.phase(name, serialized):
+                return await func(*args, **kwargs)
+
+        return timed
+
+    def task(self, task: PregelExecutableTask, duration: float) -> None:
+        """Record the duration of a task, including retries."""
+        with self.lock:
+            self.tasks[task.id] = {"name": task.name, "duration": duration}
+
+    def serialized(self, name: str, duration: float, size: int) -> None:
+        """Record a value serialized by the checkpointer under the given name."""
+        with self.lock:
+            self.phases["serialize"] += duration
+            self.bytes[name] += size
+
+    def flush(self, step: int) -> Iterator[dict[str, Any]]:
+        """Yield the timings collected since the last flush, and reset them."""
+        with self.lock:
+            phases, self.phases = self.phases, defaultdict(float)
+            sizes, self.bytes = self.bytes, defaultdict(int)
+            tasks, self.tasks = self.tasks, {}
+        timings = {
+            "step": step,
+            "phases": dict(phases),
+            "tasks": tasks,
+            "bytes": dict(sizes),
+        }
+        if self.buffer_stats is not None:
+            timings["stream_buffer"] = self.buffer_stats()
+        yield timings
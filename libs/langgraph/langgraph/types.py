@@ -1,10 +1,16 @@
+import json
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Literal,
+    Mapping,
     NamedTuple,
     Optional,
     Sequence,
@@ -12,6 +18,7 @@ from typing import (
     Union,
     cast,
 )
+from uuid import UUID
 
 from langchain_core.runnables import Runnable, RunnableConfig
 from typing_extensions import Self
@@ -28,7 +35,7 @@ Checkpointer = Union[None, Literal[False], BaseCheckpointSaver]
 """Type of the checkpointer to use for a subgraph. False disables checkpointing,
 even if the parent graph has a checkpointer. None inherits checkpointer."""
 
-StreamMode = Literal["values", "updates", "debug", "messages", "custom"]
+StreamMode = Literal["values", "updates", "debug", "messages", "custom", "timings"]
 """How the stream method should emit outputs.
 
 - 'values': Emit all values of the state for each step.
@@ -37,6 +44,29 @@ StreamMode = Literal["values", "updates", "debug", "messages", "custom"]
 - 'debug': Emit debug events for each step.
 - 'messages': Emit LLM messages token-by-token.
 - 'custom': Emit custom output `write: StreamWriter` kwarg of each node.
+- 'timings': Emit the durations of the phases and tasks of each step, the
+    size of the serialized checkpoint and writes, and the metrics of the stream
+    buffer if bounded.
+"""
+
+Durability = Literal["sync", "async", "exit"]
+"""When the checkpoints of a run are saved.
+
+- 'sync': Save the checkpoint of each step before starting the next step.
+- 'async': Save the checkpoint of each step in the background, while the next
+    step runs.
+- 'exit': Keep checkpoints in memory, and save only the last one when the run
+    exits, along with the writes of unfinished steps on interrupt or error.
+"""
+
+StreamBufferPolicy = Literal["block", "drop_oldest", "coalesce"]
+"""What to do with a chunk emitted while the stream buffer is full.
+
+- 'block': Wait for the consumer to catch up. Only chunks emitted from other
+    threads than the consumer's wait, the others are buffered anyway.
+- 'drop_oldest': Drop the oldest buffered chunk of the same stream mode.
+- 'coalesce': Merge the chunk into the buffered chunk of the same message, for
+    'messages' mode, otherwise drop the oldest chunk like 'drop_oldest'.
 """
 
 StreamWriter = Callable[[Any], None]
@@ -95,10 +125,91 @@ class RetryPolicy(NamedTuple):
     """List of exception classes that should trigger a retry, or a callable that returns True for exceptions that should trigger a retry."""
 
 
+def _canonical(value: Any) -> Any:
+    """Return a JSON-serializable form of the value, equal for equal values: the
+    keys of mappings and the items of sets are sorted, and containers are tagged
+    with their type. Raises TypeError for objects without a canonical form, eg.
+    without `__dict__`, as their pickled bytes may differ for equal values."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    elif isinstance(value, bytes):
+        return ["bytes", value.hex()]
+    elif isinstance(value, Mapping):
+        items = [[_canonical(k), _canonical(v)] for k, v in value.items()]
+        return [type(value).__qualname__, sorted(items, key=json.dumps)]
+    elif isinstance(value, (set, frozenset)):
+        return [
+            type(value).__qualname__,
+            sorted(map(_canonical, value), key=json.dumps),
+        ]
+    elif isinstance(value, (list, tuple, deque)):
+        return [type(value).__qualname__, [_canonical(v) for v in value]]
+    cls = f"{type(value).__module__}.{type(value).__qualname__}"
+    if isinstance(value, Enum):
+        return [cls, value.name]
+    elif isinstance(value, (date, time, timedelta, Decimal, UUID, PurePath)):
+        return [cls, str(value)]
+    elif is_dataclass(value):
+        return [
+            cls,
+            [[f.name, _canonical(getattr(value, f.name))] for f in fields(value)],
+        ]
+    elif hasattr(value, "__dict__"):
+        return [cls, _canonical(vars(value))]
+    else:
+        raise TypeError(f"Cannot compute a cache key for {cls} objects")
+
+
+def default_cache_key(input: Any) -> str:
+    """Default cache key function, serializes the input of the node in a
+    canonical form, so that equal inputs have the same key, eg. sets or dicts
+    with items in another order. Inputs holding objects it can't serialize,
+    eg. locks, have no key, so the task runs without caching."""
+    return json.dumps(_canonical(input), separators=(",", ":"))
+
+
 class CachePolicy(NamedTuple):
     """Configuration for caching nodes."""
 
-    pass
+    key_func: Callable[[Any], Union[str, bytes]] = default_cache_key
+    """Function to generate a cache key from the input of the node. Tasks whose
+    input it fails on run without caching."""
+    ttl: Optional[int] = None
+    """Time to live for a cache entry, in seconds. If None, entries never expire."""
+
+
+class StreamBuffer(NamedTuple):
+    """Configuration for bounding the chunks buffered while streaming, until
+    they are consumed."""
+
+    maxsize: int
+    """Maximum number of chunks to buffer."""
+    policy: Union[StreamBufferPolicy, Mapping[str, StreamBufferPolicy]] = "block"
+    """What to do when the buffer is full, for all stream modes or per stream mode.
+    Modes missing from the mapping block."""
+
+
+class TokenCoalescing(NamedTuple):
+    """Configuration for merging the tokens of a message before emitting them
+    in "messages" stream mode. Each emitted chunk holds the tokens received since
+    the previous one, and keeps the id of the message and the metadata."""
+
+    window: Optional[float] = 0.02
+    """Emit the tokens once the first of them is this old, in seconds. Checked
+    when a token is received. If None, tokens are not emitted based on time."""
+    max_tokens: Optional[int] = None
+    """Emit the tokens once there are this many. If None, there's no limit."""
+
+
+class CacheKey(NamedTuple):
+    """Cache key of a task, computed from its cache policy."""
+
+    ns: tuple[str, ...]
+    """Namespace of the cache entry, the path of the node in the graph."""
+    key: str
+    """Hash of the input of the task."""
+    ttl: Optional[int]
+    """Time to live for the cache entry, in seconds."""
 
 
 @dataclass
@@ -129,6 +240,16 @@ class PregelExecutableTask(NamedTuple):
     id: str
     path: tuple[Union[str, int], ...]
     scheduled: bool = False
+    cache_key: Optional[CacheKey] = None
+
+
+class PregelTaskBatch(NamedTuple):
+    """PUSH tasks of the same node run together with a single batch call."""
+
+    name: str
+    tasks: tuple[PregelExecutableTask, ...]
+    errors: dict[str, BaseException]
+    """The errors of the tasks that failed, by task id."""
 
 
 class StateSnapshot(NamedTuple):
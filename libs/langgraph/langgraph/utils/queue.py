@@ -5,7 +5,7 @@ import queue
 import sys
 import threading
 import types
-from collections import deque
+from collections import Counter, deque
 from time import monotonic
 from typing import Optional
 
@@ -130,4 +130,163 @@ class SyncQueue:
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
-__all__ = ["AsyncQueue", "SyncQueue"]
+class BufferPolicy:
+    """Applies a StreamBuffer to the (ns, mode, payload) chunks of a queue,
+    and keeps metrics of the buffer since they were last collected."""
+
+    def __init__(self, buffer):
+        if buffer.maxsize < 1:
+            raise ValueError("StreamBuffer maxsize must be at least 1")
+        self.maxsize = buffer.maxsize
+        self.policy = buffer.policy
+        self.max_depth = 0
+        self.dropped = Counter()
+        self.coalesced = Counter()
+        self.blocked = 0.0
+
+    def get(self, mode):
+        if isinstance(self.policy, str):
+            return self.policy
+        return self.policy.get(mode, "block")
+
+    def make_room(self, items, item):
+        """Apply the policy of a chunk put in a full buffer. Returns the index of
+        the buffered chunk that was dropped, -1 if the chunk was merged into a
+        buffered one or dropped itself, or None if the chunk should be added."""
+        ns, mode, payload = item
+        policy = self.get(mode)
+        if policy == "coalesce" and mode == "messages":
+            # messages are only streamed once langchain_core.messages is imported
+            from langchain_core.messages import BaseMessageChunk
+
+            chunk, metadata = payload
+            for i in range(len(items) - 1, -1, -1):
+                prev_ns, prev_mode, prev_payload = items[i]
+                if prev_ns != ns or prev_mode != mode:
+                    continue
+                prev, prev_metadata = prev_payload
+                if (
+                    isinstance(prev, BaseMessageChunk)
+                    and isinstance(chunk, BaseMessageChunk)
+                    and prev.id == chunk.id
+                ):
+                    items[i] = (ns, mode, (prev + chunk, prev_metadata))
+                    self.coalesced[mode] += 1
+                    return -1
+        if policy in ("drop_oldest", "coalesce"):
+            self.dropped[mode] += 1
+            for i, other in enumerate(items):
+                if other[1] == mode:
+                    del items[i]
+                    return i
+            # no older chunk of this mode, drop this one
+            return -1
+        return None
+
+    def added(self, depth):
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def stats(self, depth):
+        """Return the metrics of the buffer, and reset them."""
+        stats = {
+            "depth": depth,
+            "max_depth": max(self.max_depth, depth),
+            "dropped": dict(self.dropped),
+            "coalesced": dict(self.coalesced),
+            "blocked": self.blocked,
+        }
+        self.max_depth = depth
+        self.dropped = Counter()
+        self.coalesced = Counter()
+        self.blocked = 0.0
+        return stats
+
+
+class BoundedSyncQueue(SyncQueue):
+    """SyncQueue of stream chunks holding at most `buffer.maxsize` items,
+    see StreamBuffer. Puts from other threads than the one that created the
+    queue, the consumer, block when full if the policy of the chunk says so."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._policy = BufferPolicy(buffer)
+        self._consumer = threading.get_ident()
+        self._not_full = threading.Condition(threading.Lock())
+        self._closed = False
+
+    def put(self, item, block=True, timeout=None):
+        with self._not_full:
+            while len(self._queue) >= self._policy.maxsize:
+                dropped = self._policy.make_room(self._queue, item)
+                if dropped is None:
+                    if (
+                        block
+                        and not self._closed
+                        and threading.get_ident() != self._consumer
+                    ):
+                        start = monotonic()
+                        self._not_full.wait(timeout)
+                        self._policy.blocked += monotonic() - start
+                        if timeout is None:
+                            continue
+                    # can't wait, buffer it anyway
+                    break
+                elif dropped == -1:
+                    return
+                else:
+                    # the dropped chunk had been counted
+                    self._count.acquire(False)
+                    break
+            self._queue.append(item)
+            self._policy.added(len(self._queue))
+        self._count.release()
+
+    def get(self, block=True, timeout=None):
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if not self._count.acquire(block, timeout):
+            raise queue.Empty
+        with self._not_full:
+            try:
+                item = self._queue.popleft()
+            except IndexError:
+                raise queue.Empty
+            self._not_full.notify()
+        return item
+
+    def close(self):
+        """Stop blocking puts, eg. when the consumer has stopped consuming."""
+        with self._not_full:
+            self._closed = True
+            self._not_full.notify_all()
+
+    def stats(self):
+        """Return the metrics of the buffer since last called."""
+        with self._not_full:
+            return self._policy.stats(len(self._queue))
+
+
+class BoundedAsyncQueue(AsyncQueue):
+    """AsyncQueue of stream chunks holding at most `buffer.maxsize` items,
+    see StreamBuffer. As puts can't wait in the event loop, chunks whose
+    policy is to block are buffered anyway."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._policy = BufferPolicy(buffer)
+
+    def put_nowait(self, item):
+        if len(self._queue) >= self._policy.maxsize:
+            dropped = self._policy.make_room(self._queue, item)
+            if dropped == -1:
+                return
+        super().put_nowait(item)
+        self._policy.added(len(self._queue))
+
+    def stats(self):
+        """Return the metrics of the buffer since last called."""
+        return self._policy.stats(len(self._queue))
+
+
+__all__ = ["AsyncQueue", "SyncQueue", "BoundedAsyncQueue", "BoundedSyncQueue"]
@@ -1,5 +1,14 @@
+from langgraph.channels.ephemeral_value import EphemeralValue
+from langgraph.channels.last_value import LastValue
 from langgraph.checkpoint.base import empty_checkpoint
-from langgraph.pregel.algo import prepare_next_tasks
+from langgraph.constants import INPUT
+from langgraph.pregel import Channel, Pregel
+from langgraph.pregel.algo import (
+    PregelTaskWrites,
+    apply_writes,
+    increment,
+    prepare_next_tasks,
+)
 from langgraph.pregel.manager import ChannelsManager
 
 
@@ -32,3 +41,114 @@ def test_prepare_next_tasks() -> None:
         )
 
         # TODO: add more tests
+
+
+def test_prepare_next_tasks_only_triggered_nodes() -> None:
+    app = Pregel(
+        nodes={
+            "one": Channel.subscribe_to("a") | Channel.write_to("b"),
+            "two": Channel.subscribe_to("b") | Channel.write_to("c"),
+            "three": Channel.subscribe_to("a") | Channel.write_to("c"),
+        },
+        channels={"a": LastValue(int), "b": LastValue(int), "c": LastValue(int)},
+        input_channels="a",
+        output_channels="c",
+    )
+    assert app.trigger_to_nodes == {"a": ["one", "three"], "b": ["two"]}
+
+    config = {}
+    checkpoint = empty_checkpoint()
+
+    with ChannelsManager(app.channels, checkpoint, config) as (channels, managed):
+        _, updated_channels = apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites(INPUT, [("a", 1), ("b", 2)], [])],
+            increment,
+        )
+        assert updated_channels == {"a", "b"}
+
+        # without an index, every node is visited
+        tasks = prepare_next_tasks(
+            checkpoint, app.nodes, channels, managed, config, 0, for_execution=False
+        )
+        assert [t.name for t in tasks.values()] == ["one", "two", "three"]
+
+        # with an index, only nodes subscribed to updated channels are visited
+        for updated, expected in [
+            ({"a", "b"}, ["one", "two", "three"]),
+            ({"a"}, ["one", "three"]),
+            ({"b"}, ["two"]),
+            ({"c"}, []),
+            (set(), []),
+        ]:
+            tasks = prepare_next_tasks(
+                checkpoint,
+                app.nodes,
+                channels,
+                managed,
+                config,
+                0,
+                for_execution=False,
+                trigger_to_nodes=app.trigger_to_nodes,
+                updated_channels=updated,
+            )
+            assert [t.name for t in tasks.values()] == expected
+
+
+def test_unvalidated_graph_runs_all_steps() -> None:
+    app = Pregel(
+        nodes={
+            "one": Channel.subscribe_to("a") | Channel.write_to("b"),
+            "two": Channel.subscribe_to("b") | Channel.write_to("c"),
+        },
+        channels={"a": LastValue(int), "b": LastValue(int), "c": LastValue(int)},
+        input_channels="a",
+        output_channels="c",
+        auto_validate=False,
+    )
+    # without an index, nodes triggered after the first step still run
+    assert app.trigger_to_nodes is None
+    assert app.invoke(1) == 1
+
+
+def test_apply_writes_notifies_only_step_channels() -> None:
+    specs = {
+        "last": LastValue(int),
+        "ephemeral": EphemeralValue(int),
+        "written": EphemeralValue(int),
+    }
+    checkpoint = empty_checkpoint()
+
+    with ChannelsManager(specs, checkpoint, {}) as (channels, _):
+        _, updated_channels = apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites(INPUT, [("last", 1), ("ephemeral", 2)], [])],
+            increment,
+        )
+        assert updated_channels == {"last", "ephemeral"}
+        assert checkpoint["channel_versions"] == {"last": 1, "ephemeral": 1}
+
+        # unwritten ephemeral channel is cleared, and gets a new version
+        _, updated_channels = apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites("node", [("written", 3)], [])],
+            increment,
+        )
+        assert updated_channels == {"ephemeral", "written"}
+        assert checkpoint["channel_versions"] == {
+            "last": 1,
+            "ephemeral": 2,
+            "written": 2,
+        }
+        assert channels["last"].get() == 1
+        assert channels["written"].get() == 3
+
+        # channels not listed in notify_channels are left as is
+        _, updated_channels = apply_writes(
+            checkpoint, channels, [], increment, notify_channels=[]
+        )
+        assert updated_channels == set()
+        assert channels["written"].get() == 3
@@ -5,7 +5,8 @@ import pytest
 
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.last_value import LastValue
-from langgraph.channels.topic import Topic
+from langgraph.channels.topic import AppendOnlyTopic, LogView, Topic
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.errors import EmptyChannelError, InvalidUpdateError
 
 pytestmark = pytest.mark.anyio
@@ -15,6 +16,7 @@ def test_last_value() -> None:
     channel = LastValue(int).from_checkpoint(None)
     assert channel.ValueType is int
     assert channel.UpdateType is int
+    assert not channel.notify_on_new_step
 
     with pytest.raises(EmptyChannelError):
         channel.get()
@@ -34,6 +36,7 @@ def test_topic() -> None:
     channel = Topic(str).from_checkpoint(None)
     assert channel.ValueType is Sequence[str]
     assert channel.UpdateType is Union[str, list[str]]
+    assert channel.notify_on_new_step
 
     assert channel.update(["a", "b"])
     assert channel.get() == ["a", "b"]
@@ -58,6 +61,7 @@ def test_topic_accumulate() -> None:
     channel = Topic(str, accumulate=True).from_checkpoint(None)
     assert channel.ValueType is Sequence[str]
     assert channel.UpdateType is Union[str, list[str]]
+    assert not channel.notify_on_new_step
 
     assert channel.update(["a", "b"])
     assert channel.get() == ["a", "b"]
@@ -72,10 +76,53 @@ def test_topic_accumulate() -> None:
     assert channel.get() == ["a", "b", "b", "c", "d", "d", "e"]
 
 
+def test_append_only_topic() -> None:
+    channel = AppendOnlyTopic(str).from_checkpoint(None)
+    assert channel.ValueType is Sequence[str]
+    assert channel.UpdateType is Union[str, list[str]]
+    assert not channel.notify_on_new_step
+
+    with pytest.raises(EmptyChannelError):
+        channel.get()
+    assert channel.update(["a", ["b", "c"]])
+    view = channel.get()
+    assert isinstance(view, LogView)
+    assert view == ["a", "b", "c"]
+    assert not channel.update([])
+    assert channel.update(["d"])
+    # views returned before are unchanged by later updates
+    assert view == ["a", "b", "c"]
+    assert list(view) == ["a", "b", "c"]
+    # views are serialized as lists, eg. in writes of nodes that return them
+    serde = JsonPlusSerializer()
+    assert serde.loads_typed(serde.dumps_typed(view)) == ["a", "b", "c"]
+    assert view[-1] == "c"
+    assert view[1:] == ["b", "c"]
+    with pytest.raises(IndexError):
+        view[3]
+    assert channel.get() == ["a", "b", "c", "d"]
+
+    # checkpoints are views too, so they don't copy the values every step
+    checkpoint = channel.checkpoint()
+    assert isinstance(checkpoint, LogView)
+    assert checkpoint == ["a", "b", "c", "d"]
+    restored = AppendOnlyTopic(str).from_checkpoint(checkpoint)
+    assert restored.update(["e"])
+    assert channel.update(["f"])
+    assert restored.get() == ["a", "b", "c", "d", "e"]
+    assert channel.get() == ["a", "b", "c", "d", "f"]
+    assert checkpoint == ["a", "b", "c", "d"]
+    # and are saved as lists
+    loaded = serde.loads_typed(serde.dumps_typed(checkpoint))
+    assert loaded == ["a", "b", "c", "d"]
+    assert AppendOnlyTopic(str).from_checkpoint(loaded).get() == loaded
+
+
 def test_binop() -> None:
     channel = BinaryOperatorAggregate(int, operator.add).from_checkpoint(None)
     assert channel.ValueType is int
     assert channel.UpdateType is int
+    assert not channel.notify_on_new_step
 
     assert channel.get() == 0
 
@@ -86,3 +133,66 @@ def test_binop() -> None:
     checkpoint = channel.checkpoint()
     channel = BinaryOperatorAggregate(int, operator.add).from_checkpoint(checkpoint)
     assert channel.get() == 10
+
+
+def test_binop_inplace() -> None:
+    channel = BinaryOperatorAggregate(list, operator.add).from_checkpoint([1])
+    first = [2]
+    channel.update([first, [3], [4]])
+    assert channel.get() == [1, 2, 3, 4]
+    # neither the checkpoint nor the writes are mutated
+    assert first == [2]
+    checkpoint = channel.checkpoint()
+    channel.update([[5]])
+    assert checkpoint == [1, 2, 3, 4]
+    assert channel.get() == [1, 2, 3, 4, 5]
+    # updates of other types fall back to the operator
+    with pytest.raises(TypeError):
+        channel.update([(6,)])
+
+    channel = BinaryOperatorAggregate(dict, operator.or_).from_checkpoint(None)
+    channel.update([{"a": 1}, {"b": 2}, {"a": 3}])
+    value = channel.get()
+    assert value == {"a": 3, "b": 2}
+    channel.update([{"c": 4}])
+    assert value == {"a": 3, "b": 2}
+    assert channel.get() == {"a": 3, "b": 2, "c": 4}
+
+
+def test_binop_declared_forms() -> None:
+    calls = []
+
+    def concat(left: list, right: list) -> list:
+        return left + right
+
+    def concat_batch(left: list, updates: Sequence[list]) -> list:
+        calls.append(len(updates))
+        return [*left, *(item for update in updates for item in update)]
+
+    concat.batch = concat_batch  # type: ignore[attr-defined]
+    channel = BinaryOperatorAggregate(list, concat).from_checkpoint([0])
+    channel.update([[1], [2], [3]])
+    assert channel.get() == [0, 1, 2, 3]
+    assert calls == [3]
+
+    def merge(left: dict, right: dict) -> dict:
+        return {**left, **right}
+
+    merge.inplace = dict.update  # type: ignore[attr-defined]
+    checkpoint = {"a": 1}
+    channel = BinaryOperatorAggregate(dict, merge).from_checkpoint(checkpoint)
+    channel.update([{"b": 2}, {"c": 3}])
+    assert channel.get() == {"a": 1, "b": 2, "c": 3}
+    assert checkpoint == {"a": 1}
+
+
+def test_channel_copy() -> None:
+    channel = BinaryOperatorAggregate(list, operator.add).from_checkpoint([1])
+    copied = channel.copy()
+    copied.update([[2]])
+    assert copied.get() == [1, 2]
+    assert channel.get() == [1]
+
+    empty = LastValue(int).copy()
+    with pytest.raises(EmptyChannelError):
+        empty.get()
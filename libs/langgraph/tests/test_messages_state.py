@@ -12,6 +12,7 @@ from langchain_core.messages import (
 from pydantic import BaseModel
 from pydantic.v1 import BaseModel as BaseModelV1
 
+from langgraph.channels.messages import MessagesChannel
 from langgraph.graph import add_messages
 from langgraph.graph.message import MessagesState
 from langgraph.graph.state import END, START, StateGraph
@@ -145,6 +146,48 @@ def test_delete_all():
     assert result == expected_result
 
 
+def test_messages_channel():
+    updates = [
+        [HumanMessage(content="Hello", id="1"), AIMessage(content="Hi", id="2")],
+        AIMessage(content="Hi again!", id="3"),
+        [HumanMessage(content="Hello, edited", id="1"), SystemMessage("", id="4")],
+        [RemoveMessage(id="3"), AIMessage(content="Bye", id="5")],
+        [RemoveMessage(id="4"), AIMessage(content="Back", id="4")],
+    ]
+    channel = MessagesChannel(Annotated[list, add_messages], add_messages)
+    expected: list = []
+    for update in updates:
+        before = channel.get()
+        snapshot = list(before)
+        assert channel.update([update])
+        expected = add_messages(expected, update)
+        assert channel.get() == expected
+        # values returned before are left unchanged
+        assert before == snapshot
+
+    restored = channel.from_checkpoint(channel.checkpoint())
+    assert restored.update([AIMessage(content="Bye, edited", id="5")])
+    assert restored.get() == add_messages(
+        expected, AIMessage(content="Bye, edited", id="5")
+    )
+    assert channel.get() == expected
+
+    copied = channel.copy()
+    assert copied.update([AIMessage(content="Bye, copied", id="5")])
+    assert copied.get() == add_messages(
+        expected, AIMessage(content="Bye, copied", id="5")
+    )
+    assert channel.get() == expected
+    assert channel.update([AIMessage(content="Later", id="6")])
+    assert [m.id for m in copied.get()] == [m.id for m in expected]
+
+    with pytest.raises(ValueError, match="doesn't exist"):
+        channel.update([RemoveMessage(id="7")])
+
+    builder = StateGraph(MessagesState)
+    assert isinstance(builder.channels["messages"], MessagesChannel)
+
+
 MESSAGES_STATE_SCHEMAS = [MessagesState]
 if IS_LANGCHAIN_CORE_030_OR_GREATER:
 
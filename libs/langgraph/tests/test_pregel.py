@@ -1,13 +1,16 @@
 import enum
 import json
 import operator
+import os
 import re
+import threading
 import time
 import uuid
 import warnings
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from datetime import datetime
 from random import randrange
 from typing import (
     Annotated,
@@ -40,6 +43,9 @@ from pydantic import BaseModel
 from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
+from langgraph.cache.base import PickleSerializer
+from langgraph.cache.memory import InMemoryCache
+from langgraph.cache.store import StoreCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
@@ -74,7 +80,16 @@ from langgraph.pregel import (
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.store.memory import InMemoryStore
-from langgraph.types import Interrupt, PregelTask, Send, StreamWriter
+from langgraph.types import (
+    CachePolicy,
+    Interrupt,
+    PregelTask,
+    Send,
+    StreamBuffer,
+    StreamWriter,
+    TokenCoalescing,
+    default_cache_key,
+)
 from tests.any_str import AnyDict, AnyStr, AnyVersion, FloatBetween, UnsortedSequence
 from tests.conftest import (
     ALL_CHECKPOINTERS_SYNC,
@@ -11775,6 +11790,584 @@ def test_store_injected(
     assert len(the_store.search(("foo", "bar"))) == 1  # still overwriting the same one
 
 
+def test_node_cache() -> None:
+    class State(TypedDict):
+        query: str
+        results: Annotated[list[str], operator.add]
+
+    calls: list[str] = []
+
+    def retrieve(state: State) -> State:
+        calls.append(state["query"])
+        return {"results": [state["query"].upper()]}
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "retrieve", retrieve, cache_policy=CachePolicy(key_func=lambda s: s["query"])
+    )
+    builder.add_edge(START, "retrieve")
+    graph = builder.compile(cache=InMemoryCache())
+
+    assert graph.invoke({"query": "a", "results": []}) == {
+        "query": "a",
+        "results": ["A"],
+    }
+    assert calls == ["a"]
+
+    # same input is served from the cache, and marked as such in the stream
+    assert [*graph.stream({"query": "a", "results": []})] == [
+        {"retrieve": {"results": ["A"]}, "__metadata__": {"cached": True}},
+    ]
+    assert calls == ["a"]
+
+    # different input runs the node
+    assert graph.invoke({"query": "b", "results": []}) == {
+        "query": "b",
+        "results": ["B"],
+    }
+    assert calls == ["a", "b"]
+
+    # cache hits are shared through a store
+    store_cache = StoreCache(InMemoryStore())
+    for _ in range(2):
+        assert builder.compile(cache=store_cache).invoke(
+            {"query": "c", "results": []}
+        ) == {"query": "c", "results": ["C"]}
+    assert calls == ["a", "b", "c"]
+
+    # clearing the node namespace forces re-execution
+    graph.cache.clear([("retrieve",)])
+    graph.invoke({"query": "a", "results": []})
+    assert calls == ["a", "b", "c", "a"]
+
+
+def test_node_cache_default_key() -> None:
+    # equal inputs have the same key, whatever the order of keys and set items
+    assert default_cache_key({"b": 1, "a": {"x", "y", "z"}}) == default_cache_key(
+        {"a": {"z", "y", "x"}, "b": 1}
+    )
+    assert default_cache_key([1, 2]) != default_cache_key((1, 2))
+    assert default_cache_key(datetime(2024, 1, 1)) != default_cache_key(
+        datetime(2024, 1, 2)
+    )
+    # objects without a canonical form aren't keyed by their pickled bytes
+    with pytest.raises(TypeError):
+        default_cache_key({"lock": threading.Lock()})
+
+    class State(TypedDict):
+        tags: set[str]
+        lock: Any
+        pair: tuple[int, int]
+
+    calls: list[set[str]] = []
+
+    def tag(state: State) -> dict:
+        calls.append(state["tags"])
+        return {"pair": (len(state["tags"]), len(calls))}
+
+    builder = StateGraph(State)
+    builder.add_node("tag", tag, cache_policy=CachePolicy())
+    builder.add_edge(START, "tag")
+    graph = builder.compile(cache=InMemoryCache(serde=PickleSerializer()))
+
+    # cache hits return the same writes as the first run
+    first = graph.invoke({"tags": {"a", "b"}, "pair": (0, 0)})
+    assert first == {"tags": {"a", "b"}, "pair": (2, 1)}
+    assert graph.invoke({"tags": {"b", "a"}, "pair": (0, 0)}) == first
+    assert type(graph.invoke({"tags": {"a", "b"}, "pair": (0, 0)})["pair"]) is tuple
+    assert len(calls) == 1
+
+    # inputs without a key run without caching
+    locked = {"tags": {"a", "b"}, "lock": threading.Lock(), "pair": (0, 0)}
+    assert graph.invoke(locked)["pair"] == (2, 2)
+    assert graph.invoke(locked)["pair"] == (2, 3)
+
+
+def _count_words_in_process(state: dict) -> dict:
+    # runs in a worker of the process pool, so must be defined at module level
+    assert type(state["span"]) is tuple
+    return {"counts": [(os.getpid(), len(state["doc"].split()))]}
+
+
+def test_node_process_executor() -> None:
+    class State(TypedDict):
+        docs: list[str]
+        counts: Annotated[list[tuple[int, int]], operator.add]
+
+    builder = StateGraph(State)
+    builder.add_node("count", _count_words_in_process, executor="process")
+    builder.add_conditional_edges(
+        START,
+        lambda s: [Send("count", {"doc": d, "span": (0, len(d))}) for d in s["docs"]],
+    )
+    graph = builder.compile()
+
+    result = graph.invoke({"docs": ["a b", "c d e", "f"], "counts": []})
+    assert sorted(c for _, c in result["counts"]) == [1, 2, 3]
+    assert all(pid != os.getpid() for pid, _ in result["counts"])
+    # input and output keep their types, as in a thread
+    assert all(type(c) is tuple for c in result["counts"])
+
+    # only sync functions of the node input can run in a process
+    with pytest.raises(ValueError, match="executor='process'"):
+        builder.add_node("other", lambda s, config: s, executor="process")
+    with pytest.raises(ValueError, match="Invalid executor"):
+        builder.add_node("other", _count_words_in_process, executor="fork")
+
+
+def test_node_max_concurrency() -> None:
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+
+    lock = threading.Lock()
+    running: Counter[str] = Counter()
+    peaks: Counter[str] = Counter()
+
+    def tracked(name: str):
+        def node(state: dict) -> dict:
+            with lock:
+                running[name] += 1
+                running["total"] += 1
+                peaks[name] = max(peaks[name], running[name])
+                peaks["total"] = max(peaks["total"], running["total"])
+            time.sleep(0.02)
+            with lock:
+                running[name] -= 1
+                running["total"] -= 1
+            return {"results": [state["item"]]}
+
+        return node
+
+    builder = StateGraph(State)
+    builder.add_node("llm", tracked("llm"), max_concurrency=2)
+    builder.add_node("db", tracked("db"), concurrency_weight=2)
+    builder.add_conditional_edges(
+        START,
+        lambda s: [Send(n, {"item": i}) for i in s["items"] for n in ("llm", "db")],
+    )
+    graph = builder.compile()
+
+    result = graph.invoke({"items": list(range(6)), "results": []})
+    assert sorted(result["results"]) == sorted([*range(6), *range(6)])
+    assert peaks["llm"] == 2
+
+    # limits can be overridden per run, weights take from max_concurrency
+    peaks.clear()
+    graph.invoke(
+        {"items": list(range(6)), "results": []},
+        {"max_concurrency": 4, "configurable": {"max_node_concurrency": {"llm": 1}}},
+    )
+    assert peaks["llm"] == 1
+    assert peaks["db"] <= 2
+    assert peaks["total"] <= 3
+
+    # a limit below 1 would never schedule the node's tasks
+    for limit in (0, -1):
+        with pytest.raises(ValueError, match="max_node_concurrency"):
+            graph.invoke(
+                {"items": [1], "results": []},
+                {"configurable": {"max_node_concurrency": {"llm": limit}}},
+            )
+    with pytest.raises(ValueError, match="max_concurrency"):
+        builder.add_node("other", tracked("other"), max_concurrency=0)
+
+    # limits passed in config don't apply to nodes of subgraphs with the same name
+    sub = StateGraph(State)
+    sub.add_node("llm", tracked("sub"))
+    sub.add_conditional_edges(
+        START, lambda s: [Send("llm", {"item": i}) for i in s["items"]]
+    )
+    parent = StateGraph(State)
+    parent.add_node("llm", sub.compile())
+    parent.add_edge(START, "llm")
+    peaks.clear()
+    parent.compile().invoke(
+        {"items": list(range(4)), "results": []},
+        {"configurable": {"max_node_concurrency": {"llm": 1}}},
+    )
+    assert peaks["sub"] > 1
+
+
+def test_stream_timings() -> None:
+    class State(TypedDict):
+        value: str
+
+    def slow(state: State) -> State:
+        time.sleep(0.05)
+        return {"value": state["value"] + "!"}
+
+    builder = StateGraph(State)
+    builder.add_node("slow", slow)
+    builder.add_edge(START, "slow")
+    graph = builder.compile(checkpointer=MemorySaver())
+
+    chunks = [
+        *graph.stream(
+            {"value": "a"},
+            {"configurable": {"thread_id": "1"}},
+            stream_mode=["updates", "timings"],
+            durability="sync",
+        )
+    ]
+    # the __start__ task runs as step 0, without an update
+    assert [mode for mode, _ in chunks] == ["timings", "updates", "timings"]
+    assert chunks[0][1]["step"] == 0
+    timings = chunks[2][1]
+    assert timings["step"] == 1
+    assert set(timings["phases"]) >= {
+        "apply_writes",
+        "create_checkpoint",
+        "prepare_next_tasks",
+    }
+    [task] = timings["tasks"].values()
+    assert task["name"] == "slow"
+    assert task["duration"] >= 0.05
+    # sizes and durations come from the checkpointer's own serializer calls
+    assert "serialize" in chunks[0][1]["phases"]
+    assert chunks[0][1]["bytes"]["checkpoint"] > 0
+    assert chunks[0][1]["bytes"]["writes"] > 0
+
+
+def test_put_writes_batched_per_step() -> None:
+    class BatchRecordingSaver(MemorySaver):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: list[list[str]] = []
+
+        def put_writes_batch(self, config, task_writes) -> None:
+            self.batches.append([task_id for task_id, _ in task_writes])
+            super().put_writes_batch(config, task_writes)
+
+    class State(TypedDict):
+        results: Annotated[list[int], operator.add]
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("work", i) for i in range(5)]
+
+    def work(item: int) -> State:
+        return {"results": [item * 2]}
+
+    builder = StateGraph(State)
+    builder.add_node("work", work)
+    builder.add_conditional_edges(START, fan_out, ["work"])
+    saver = BatchRecordingSaver()
+    graph = builder.compile(checkpointer=saver)
+    config = {"configurable": {"thread_id": "1"}}
+
+    assert graph.invoke({"results": []}, config) == {"results": [0, 2, 4, 6, 8]}
+    # one checkpointer call for the __start__ task, one for all Send tasks
+    assert [len(batch) for batch in saver.batches] == [1, 5]
+    # all writes were saved before the next checkpoint
+    parent = [*graph.get_state_history(config)][1]
+    pending_writes = saver.get_tuple(parent.config).pending_writes
+    assert len({task_id for task_id, _, _ in pending_writes}) == 5
+
+
+def test_put_writes_flushed_after_batch_window() -> None:
+    class BatchRecordingSaver(MemorySaver):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: list[int] = []
+
+        def put_writes_batch(self, config, task_writes) -> None:
+            self.batches.append(len(task_writes))
+            super().put_writes_batch(config, task_writes)
+
+    class State(TypedDict):
+        results: Annotated[list[int], operator.add]
+
+    saver = BatchRecordingSaver()
+    saved_while_running: list[int] = []
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("work", 0), Send("work", 1)]
+
+    def work(item: int) -> State:
+        if item:
+            # the writes of the other task are saved once the window passes
+            time.sleep(0.3)
+            saved_while_running.extend(saver.batches)
+        return {"results": [item]}
+
+    builder = StateGraph(State)
+    builder.add_node("work", work)
+    builder.add_conditional_edges(START, fan_out, ["work"])
+    graph = builder.compile(checkpointer=saver)
+
+    assert graph.invoke({"results": []}, {"configurable": {"thread_id": "1"}}) == {
+        "results": [0, 1]
+    }
+    assert saved_while_running == [1, 1]
+    assert saver.batches == [1, 1, 1]
+
+
+def test_memory_saver_no_serialize_history() -> None:
+    class State(TypedDict):
+        log: Annotated[list[str], operator.add]
+
+    builder = StateGraph(State)
+    for name in "abc":
+        builder.add_node(name, lambda _, name=name: {"log": [name]})
+    builder.add_edge(START, "a")
+    builder.add_edge("a", "b")
+    # the join channel of "c" checkpoints the set of nodes it has seen,
+    # which later steps update in place
+    builder.add_edge(["a", "b"], "c")
+    graph = builder.compile(checkpointer=MemorySaver(serialize=False))
+    config = {"configurable": {"thread_id": "1"}}
+
+    assert graph.invoke({"log": []}, config) == {"log": ["a", "b", "c"]}
+    assert [s.next for s in graph.get_state_history(config)] == [
+        (),
+        ("c",),
+        ("b",),
+        ("a",),
+        ("__start__",),
+    ]
+
+
+@pytest.mark.parametrize("durability", ["sync", "async", "exit"])
+def test_checkpoint_durability(durability: str) -> None:
+    class CountingSaver(MemorySaver):
+        def __init__(self) -> None:
+            super().__init__()
+            self.puts = 0
+
+        def put(self, config, checkpoint, metadata, new_versions):
+            self.puts += 1
+            return super().put(config, checkpoint, metadata, new_versions)
+
+    class State(TypedDict):
+        count: int
+
+    def increment(state: State) -> State:
+        if state["count"] == 7:
+            raise ValueError("boom")
+        return {"count": state["count"] + 1}
+
+    builder = StateGraph(State)
+    builder.add_node("increment", increment)
+    builder.add_edge(START, "increment")
+    builder.add_conditional_edges(
+        "increment", lambda s: END if s["count"] >= 5 else "increment"
+    )
+    saver = CountingSaver()
+    graph = builder.compile(checkpointer=saver, durability=durability)
+
+    config = {"configurable": {"thread_id": "1"}}
+    assert graph.invoke({"count": 0}, config) == {"count": 5}
+    assert graph.get_state(config).values == {"count": 5}
+    # input, start and 5 increment steps
+    assert saver.puts == (1 if durability == "exit" else 7)
+    assert len([*graph.get_state_history(config)]) == (1 if durability == "exit" else 7)
+
+    # on error, the last checkpoint is saved along with the error
+    config = {"configurable": {"thread_id": "2"}}
+    with pytest.raises(ValueError, match="boom"):
+        graph.invoke({"count": 7}, config, durability="exit")
+    state = graph.get_state(config)
+    assert state.values == {"count": 7}
+    assert state.next == ("increment",)
+    assert state.tasks[0].error is not None
+
+
+@pytest.mark.parametrize(
+    "subgraph_durability,parent_durability,subgraph_puts",
+    [(None, None, 4), ("exit", None, 1), (None, "exit", 1), ("sync", "exit", 4)],
+)
+def test_subgraph_durability(
+    subgraph_durability: Optional[str],
+    parent_durability: Optional[str],
+    subgraph_puts: int,
+) -> None:
+    class CountingSaver(MemorySaver):
+        def __init__(self) -> None:
+            super().__init__()
+            self.subgraph_puts = 0
+
+        def put(self, config, checkpoint, metadata, new_versions):
+            if config["configurable"]["checkpoint_ns"]:
+                self.subgraph_puts += 1
+            return super().put(config, checkpoint, metadata, new_versions)
+
+    class State(TypedDict):
+        count: int
+
+    def increment(state: State) -> State:
+        return {"count": state["count"] + 1}
+
+    sub_builder = StateGraph(State)
+    sub_builder.add_node("one", increment)
+    sub_builder.add_node("two", increment)
+    sub_builder.add_edge(START, "one")
+    sub_builder.add_edge("one", "two")
+    subgraph = sub_builder.compile(durability=subgraph_durability)
+
+    builder = StateGraph(State)
+    builder.add_node("subgraph", subgraph)
+    builder.add_edge(START, "subgraph")
+    saver = CountingSaver()
+    graph = builder.compile(checkpointer=saver, durability=parent_durability)
+
+    # the subgraph inherits the durability of the parent, unless it has its own
+    config = {"configurable": {"thread_id": "1"}}
+    assert graph.invoke({"count": 0}, config) == {"count": 2}
+    assert saver.subgraph_puts == subgraph_puts
+
+
+def test_node_batch() -> None:
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+
+    batch_sizes: list[int] = []
+    single_calls: list[int] = []
+
+    def square(item: int) -> dict:
+        single_calls.append(item)
+        return {"results": [item * item]}
+
+    def square_many(items: list[int]) -> list[Any]:
+        batch_sizes.append(len(items))
+        return [
+            ValueError("flaky") if item == 3 else {"results": [item * item]}
+            for item in items
+        ]
+
+    def build(node: Any, **kwargs: Any) -> StateGraph:
+        builder = StateGraph(State)
+        builder.add_node("square", node, **kwargs)
+        builder.add_conditional_edges(
+            START, lambda s: [Send("square", i) for i in s["items"]], ["square"]
+        )
+        return builder
+
+    graph = build(square, batch=square_many).compile(checkpointer=MemorySaver())
+
+    # an item failing doesn't fail the other tasks of the batch
+    config = {"configurable": {"thread_id": "1"}}
+    with pytest.raises(ValueError, match="flaky"):
+        graph.invoke({"items": list(range(5)), "results": []}, config)
+    assert batch_sizes == [5]
+    assert single_calls == []
+    assert [
+        (t.name, t.error is not None)
+        for t in graph.get_state(config).tasks
+        if t.name == "square"
+    ] == [("square", False)] * 3 + [("square", True), ("square", False)]
+
+    # failed items are retried individually
+    batch_sizes.clear()
+    graph = build(square, batch=square_many, retry=RetryPolicy()).compile()
+    result = graph.invoke({"items": list(range(5)), "results": []})
+    assert sorted(result["results"]) == [0, 1, 4, 9, 16]
+    assert batch_sizes == [5]
+    assert single_calls == [3]
+
+    # the node's runnable can batch itself
+    single_calls.clear()
+    graph = build(RunnableLambda(square), batch=True).compile()
+    result = graph.invoke({"items": list(range(5)), "results": []})
+    assert sorted(result["results"]) == [0, 1, 4, 9, 16]
+    assert sorted(single_calls) == [0, 1, 2, 3, 4]
+
+
+def test_node_batch_subgraph() -> None:
+    from langgraph.errors import _SEEN_CHECKPOINT_NS
+
+    class State(TypedDict):
+        items: list[int]
+        results: Annotated[list[int], operator.add]
+
+    class SubState(TypedDict):
+        item: int
+        results: Annotated[list[int], operator.add]
+
+    subgraph = StateGraph(SubState)
+    subgraph.add_node("square", lambda s: {"results": [s["item"] * s["item"]]})
+    subgraph.add_edge(START, "square")
+
+    builder = StateGraph(State)
+    builder.add_node("sub", subgraph.compile(), batch=True)
+    builder.add_conditional_edges(
+        START, lambda s: [Send("sub", {"item": i}) for i in s["items"]], ["sub"]
+    )
+    graph = builder.compile(checkpointer=MemorySaver())
+
+    seen = set(_SEEN_CHECKPOINT_NS)
+    for thread_id in ("1", "2"):
+        config = {"configurable": {"thread_id": thread_id}}
+        result = graph.invoke({"items": [1, 2, 3], "results": []}, config)
+        assert sorted(result["results"]) == [1, 4, 9]
+    # the namespaces of subgraphs run in a batch are forgotten afterwards
+    assert _SEEN_CHECKPOINT_NS <= seen
+
+
+def test_stream_buffer() -> None:
+    class State(TypedDict):
+        names: Annotated[list[str], operator.add]
+
+    def produce(state: dict, writer: StreamWriter) -> dict:
+        for i in range(20):
+            writer((state["name"], i))
+        return {"names": []}
+
+    builder = StateGraph(State)
+    builder.add_node("produce", produce)
+    builder.add_conditional_edges(
+        START, lambda s: [Send("produce", {"name": n}) for n in s["names"]]
+    )
+    graph = builder.compile()
+
+    # nodes wait for a slow consumer instead of growing the buffer
+    chunks = []
+    for mode, chunk in graph.stream(
+        {"names": ["a", "b"]},
+        stream_mode=["custom", "timings"],
+        stream_buffer=StreamBuffer(maxsize=4),
+    ):
+        time.sleep(0.001)
+        chunks.append((mode, chunk))
+    custom = [c for m, c in chunks if m == "custom"]
+    assert [c for c in custom if c[0] == "a"] == [("a", i) for i in range(20)]
+    assert [c for c in custom if c[0] == "b"] == [("b", i) for i in range(20)]
+    stats = [c["stream_buffer"] for m, c in chunks if m == "timings"]
+    # only the chunks emitted from the consumer's thread go over the bound
+    assert stats and all(s["max_depth"] <= 6 for s in stats)
+    assert all(s["dropped"] == {} for s in stats)
+
+
+def test_stream_messages_token_coalescing() -> None:
+    from langchain_core.messages import AIMessage, HumanMessage
+
+    class State(TypedDict):
+        messages: Annotated[list, add_messages]
+
+    model = FakeChatModel(messages=[AIMessage(content="a b c d e")])
+
+    def call_model(state: State) -> dict:
+        return {"messages": model.invoke(state["messages"])}
+
+    builder = StateGraph(State)
+    builder.add_node("agent", call_model)
+    builder.add_edge(START, "agent")
+    graph = builder.compile()
+
+    chunks = [
+        c
+        for c in graph.stream(
+            {"messages": [HumanMessage(content="hi")]},
+            stream_mode="messages",
+            token_coalescing=TokenCoalescing(window=None, max_tokens=4),
+        )
+    ]
+    # the last tokens are emitted when the model is done
+    assert [c.content for c, _ in chunks] == ["a b ", "c d ", "e"]
+    assert len({c.id for c, _ in chunks}) == 1
+    assert all(meta["langgraph_node"] == "agent" for _, meta in chunks)
+
+
 def test_enum_node_names():
     class NodeName(str, enum.Enum):
         BAZ = "baz"
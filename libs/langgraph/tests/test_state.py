@@ -1,4 +1,5 @@
 import inspect
+import operator
 import warnings
 from dataclasses import dataclass, field
 from typing import Annotated as Annotated2
@@ -286,3 +287,21 @@ def test_raises_invalid_managed():
             match="Invalid managed channels detected in BadOutputState: some_output_channel. Managed channels are not permitted in Input/Output schema.",
         ):
             StateGraph(_state, input=_inp, output=_outp)
+
+
+def test_state_schema_introspected_once():
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+        name: str
+
+    first = StateGraph(State)
+    second = StateGraph(State)
+    assert first.channels == second.channels
+    # each graph gets its own channels
+    assert first.channels["items"] is not second.channels["items"]
+    assert first.channels["items"].key == "items"
+
+    compiled = second.compile()
+    assert compiled.get_input_schema() is compiled.get_input_schema()
+    assert compiled.with_config(tags=["a"]).get_output_schema() is not None
+    assert compiled.get_input_jsonschema()["properties"].keys() == {"items", "name"}
@@ -1,4 +1,5 @@
 import functools
+import subprocess
 import sys
 import uuid
 from typing import (
@@ -17,11 +18,14 @@ from unittest.mock import patch
 
 import langsmith
 import pytest
+from langchain_core.messages import AIMessageChunk
 from typing_extensions import Annotated, NotRequired, Required
 
 from langgraph.graph import END, StateGraph
 from langgraph.graph.graph import CompiledGraph
+from langgraph.types import StreamBuffer
 from langgraph.utils.fields import _is_optional_type, get_field_default
+from langgraph.utils.queue import BoundedSyncQueue  # type: ignore[attr-defined]
 from langgraph.utils.runnable import is_async_callable, is_async_generator
 
 pytestmark = pytest.mark.anyio
@@ -227,3 +231,59 @@ def test_is_required():
     assert get_field_default("val_12", gcannos["val_12"], MyGrandChildDict) is None
     assert get_field_default("val_9", gcannos["val_9"], MyGrandChildDict) is None
     assert get_field_default("val_13", gcannos["val_13"], MyGrandChildDict) == ...
+
+
+def test_bounded_sync_queue() -> None:
+    stream = BoundedSyncQueue(
+        StreamBuffer(3, {"custom": "drop_oldest", "messages": "coalesce"})
+    )
+    meta = {"langgraph_node": "a"}
+    stream.put(((), "custom", 1))
+    stream.put(((), "messages", (AIMessageChunk(content="a", id="1"), meta)))
+    stream.put(((), "messages", (AIMessageChunk(content="x", id="2"), meta)))
+    # full, tokens are merged into the buffered chunk of the same message
+    stream.put(((), "messages", (AIMessageChunk(content="b", id="1"), meta)))
+    # full, the oldest chunk of the same mode is dropped
+    stream.put(((), "custom", 2))
+    # full, chunks that block are buffered anyway when put by the consumer
+    stream.put(((), "values", {}))
+
+    assert stream.stats() == {
+        "depth": 4,
+        "max_depth": 4,
+        "dropped": {"custom": 1},
+        "coalesced": {"messages": 1},
+        "blocked": 0.0,
+    }
+    items = [stream.get(block=False) for _ in range(stream.qsize())]
+    assert [
+        (mode, p[0].content if mode == "messages" else p) for _, mode, p in items
+    ] == [("messages", "ab"), ("messages", "x"), ("custom", 2), ("values", {})]
+    # metrics are reset once collected
+    assert stream.stats()["dropped"] == {}
+
+
+def test_lazy_imports() -> None:
+    code = (
+        "import sys, langgraph.graph, langgraph.channels;"
+        "print(sorted(m for m in sys.modules if m.startswith('langgraph.')))"
+    )
+    modules = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    for module in (
+        "langgraph.prebuilt",
+        "langgraph.pregel.remote",
+        "langgraph.pregel.messages",
+        "langgraph.graph.message",
+        "langgraph.channels.messages",
+    ):
+        assert f"'{module}'" not in modules
+
+    from langgraph.channels import MessagesChannel
+    from langgraph.graph import MessagesState, add_messages
+    from langgraph.prebuilt import ToolNode
+
+    assert StateGraph(MessagesState).channels["messages"].__class__ is MessagesChannel
+    assert add_messages([], []) == []
+    assert ToolNode.__module__ == "langgraph.prebuilt.tool_node"
@@ -161,6 +161,7 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
             specs=graph.channels,
             output_keys=graph.output_channels,
             stream_keys=graph.stream_channels,
+            trigger_to_nodes=graph.trigger_to_nodes,
             check_subgraphs=False,
         ) as loop:
             if loop.tick(
@@ -351,6 +352,7 @@ class KafkaOrchestrator(AbstractContextManager):
             specs=graph.channels,
             output_keys=graph.output_channels,
             stream_keys=graph.stream_channels,
+            trigger_to_nodes=graph.trigger_to_nodes,
             check_subgraphs=False,
         ) as loop:
             if loop.tick(